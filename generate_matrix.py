@@ -1,3 +1,4 @@
+import os
 import re
 
 types = [
@@ -61,49 +62,171 @@ for i, section in enumerate(sections):
                     'roast': roast
                 })
 
-# Generate TypeScript file
+# Every type code gets a 4-bit index (its position in `types`), so a pair
+# resolves through a dense 16x16 table instead of scanning the array.
+# The matrix is symmetric: getDuoIdentity has always returned the first
+# stored entry for the unordered pair, so only that one is emitted (136).
+# Roasts are the bulk of the text; they go to one chunk module per stored
+# typeA under src/lib/duoRoasts/ and are imported only when displayed.
+
+OUTPUT = 'src/lib/duoIdentityMatrix.ts'
+ROAST_DIR = 'src/lib/duoRoasts'
+
+
+def ts_string(value):
+    return "'" + value.replace('\\', '\\\\').replace("'", "\\'") + "'"
+
+
+type_index = {code: i for i, code in enumerate(types)}
+
+entries = []
+slots = {}
+for entry in matrix_entries:
+    pair = frozenset((entry['typeA'], entry['typeB']))
+    if pair not in slots:
+        slots[pair] = len(entries)
+        entries.append(entry)
+
+index_table = [255] * 256
+for a in types:
+    for b in types:
+        slot = slots.get(frozenset((a, b)))
+        if slot is not None:
+            index_table[type_index[a] * 16 + type_index[b]] = slot
+
+roast_chunks = {code: {} for code in types}
+for entry in entries:
+    roast_chunks[entry['typeA']][entry['typeB']] = entry['roast']
+
+# Validate: all 256 pairs resolve, to the same entry the linear scan found
+for a in types:
+    for b in types:
+        slot = index_table[type_index[a] * 16 + type_index[b]]
+        if slot == 255:
+            raise SystemExit(f"Unresolved pair: {a} x {b}")
+        linear = next(e for e in matrix_entries
+                      if (e['typeA'], e['typeB']) in ((a, b), (b, a)))
+        if entries[slot] is not linear:
+            raise SystemExit(f"Index mismatch for {a} x {b}")
+        stored = entries[slot]
+        if stored['typeB'] not in roast_chunks[stored['typeA']]:
+            raise SystemExit(f"Missing roast for {a} x {b}")
+
 ts_content = """// 256 Duo-Identity Matrix - Complete
 // EtchVox: The Complete 256 Duo-Identity Matrix
-// All type combinations with labels, taglines, and detailed roasts
+// Generated by generate_matrix.py - do not edit by hand.
+// Pairs resolve in O(1): each type code has a 4-bit index and DUO_INDEX maps
+// typeA * 16 + typeB to one of the 136 symmetric entries below. Long-form
+// roasts live in ./duoRoasts/<typeA>.ts and are loaded with loadDuoRoast().
 
 export interface DuoIdentity {
     typeA: string;
     typeB: string;
     label: string;
     tagline: string;  // Short one-liner
-    roast?: string;   // Optional long-form cynical analysis
+    roast?: string;   // Optional long-form cynical analysis (see loadDuoRoast)
 }
 
-export const duoIdentityMatrix: DuoIdentity[] = [
 """
+ts_content += "export const DUO_TYPE_CODES = [\n"
+for row in range(0, 16, 8):
+    ts_content += "    " + ", ".join(ts_string(code) for code in types[row:row + 8]) + ",\n"
+ts_content += "] as const;\n\n"
+ts_content += "const TYPE_INDEX: Record<string, number> = Object.fromEntries(DUO_TYPE_CODES.map((code, i) => [code, i]));\n\n"
+
+ts_content += "export const duoIdentityMatrix: DuoIdentity[] = [\n"
+for entry in entries:
+    ts_content += (f"    {{ typeA: '{entry['typeA']}', typeB: '{entry['typeB']}', "
+                   f"label: {ts_string(entry['label'])}, tagline: {ts_string(entry['tagline'])} }},\n")
+ts_content += "];\n\n"
 
-for entry in matrix_entries:
-    roast_escaped = entry['roast'].replace("'", "\\'")
-    tagline_escaped = entry['tagline'].replace("'", "\\'")
-    label_escaped = entry['label'].replace("'", "\\'")
-    ts_content += f"    {{ typeA: '{entry['typeA']}', typeB: '{entry['typeB']}', label: '{label_escaped}', tagline: '{tagline_escaped}', roast: '{roast_escaped}' }},\n"
+ts_content += "// DUO_INDEX[typeA * 16 + typeB] -> duoIdentityMatrix position\n"
+ts_content += "const DUO_INDEX = new Uint8Array([\n"
+for row in range(16):
+    ts_content += "    " + ", ".join(f"{slot:3d}" for slot in index_table[row * 16:(row + 1) * 16]) + ",\n"
+ts_content += "]);\n\n"
+
+ts_content += "type RoastChunk = { default: Record<string, string> };\n\n"
+ts_content += "const ROAST_CHUNKS: Record<string, () => Promise<RoastChunk>> = {\n"
+for code in types:
+    if roast_chunks[code]:
+        ts_content += f"    {code}: () => import('./duoRoasts/{code}'),\n"
+ts_content += "};\n\n"
+
+ts_content += """function findDuoIdentity(typeA: string, typeB: string): DuoIdentity | undefined {
+    const a = TYPE_INDEX[typeA];
+    const b = TYPE_INDEX[typeB];
+    if (a === undefined || b === undefined) return undefined;
+    return duoIdentityMatrix[DUO_INDEX[a * 16 + b]];
+}
 
-ts_content += "];\n\n"
-ts_content += """export function getDuoIdentity(typeA: string, typeB: string): DuoIdentity {
-    const match = duoIdentityMatrix.find(d => 
-        (d.typeA === typeA && d.typeB === typeB) || 
-        (d.typeA === typeB && d.typeB === typeA)
-    );
-
-    if (match) return match;
-
-    // Fallback (should never happen with complete matrix)
-    return {
-        typeA,
-        typeB,
-        label: 'The Unknown Pairing',
-        tagline: 'An unexplored combination.',
-        roast: 'No analysis available for this exotic pairing.'
-    };
+export function getDuoIdentity(typeA: string, typeB: string, relationshipType: string = 'romantic'): DuoIdentity {
+    const match = findDuoIdentity(typeA, typeB);
+
+    if (!match) {
+        return {
+            typeA,
+            typeB,
+            label: 'The Unknown Pairing',
+            tagline: 'An unexplored combination.',
+            roast: 'No analysis available for this exotic pairing.'
+        };
+    }
+
+    // Clone to avoid mutating the matrix
+    const result = { ...match };
+
+    // Contextual Modifiers for Labels
+    if (relationshipType === 'rival') {
+        result.label = result.label.replace('The ', 'The Rivaling ');
+    } else if (relationshipType === 'friend') {
+        result.label = result.label.replace('The ', 'The Platonic ');
+    }
+
+    return result;
+}
+
+export async function loadDuoRoast(typeA: string, typeB: string, relationshipType: string = 'romantic'): Promise<string> {
+    const match = findDuoIdentity(typeA, typeB);
+    if (!match) return 'No analysis available for this exotic pairing.';
+
+    const chunk = await ROAST_CHUNKS[match.typeA]();
+    const roast = chunk.default[match.typeB];
+
+    // Contextual Modifiers for Roasts
+    if (relationshipType === 'rival') {
+        return `[COMPETITIVE ANALYSIS] ${roast?.replace('love', 'rivalry').replace('partnership', 'contest')}`;
+    } else if (relationshipType === 'friend') {
+        return `[PLATONIC AUDIT] ${roast?.replace('love', 'friendship').replace('dating', 'hanging out')}`;
+    }
+    return `[ROMANTIC AUDIT] ${roast}`;
 }
 """
 
-with open('src/lib/duoIdentityMatrix.ts', 'w', encoding='utf-8') as f:
+before = os.path.getsize(OUTPUT) if os.path.exists(OUTPUT) else 0
+
+with open(OUTPUT, 'w', encoding='utf-8') as f:
     f.write(ts_content)
 
-print(f"Successfully generated {len(matrix_entries)} entries.")
+os.makedirs(ROAST_DIR, exist_ok=True)
+chunk_sizes = {}
+for code, roasts in roast_chunks.items():
+    path = os.path.join(ROAST_DIR, f'{code}.ts')
+    if not roasts:
+        if os.path.exists(path):
+            os.remove(path)
+        continue
+    chunk = f"// Duo roasts for typeA = {code} - generated by generate_matrix.py\n\n"
+    chunk += "const roasts: Record<string, string> = {\n"
+    for typeB, roast in roasts.items():
+        chunk += f"    {typeB}: {ts_string(roast)},\n"
+    chunk += "};\n\nexport default roasts;\n"
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(chunk)
+    chunk_sizes[code] = len(chunk.encode('utf-8'))
+
+after = len(ts_content.encode('utf-8'))
+print(f"Successfully generated {len(matrix_entries)} pairs -> {len(entries)} entries, all 256 pairs resolve.")
+print(f"Main module : {before:,} -> {after:,} bytes")
+print(f"Roast chunks: {len(chunk_sizes)} files, {min(chunk_sizes.values()):,}-{max(chunk_sizes.values()):,} bytes "
+      f"({sum(chunk_sizes.values()):,} total, loaded on demand)")
@@ -0,0 +1,184 @@
+"""
+Shared table-driven acoustic quantizer.
+
+Every metric is a QuantizerTable: how to normalize the raw value to the
+0-100 scale, the bin edges on that scale and the five labels. The scalar
+path (one tag per call) and the batch path (np.searchsorted over whole
+arrays) read the same tables, and labels are interned once in the tables,
+so tagging never builds strings.
+
+Two table sets are defined:
+    SCORE_QUANTIZER   0-100 score inputs (voice_processor engines)
+    COUPLE_QUANTIZER  Hz / 0-1 inputs (couple_processor AcousticMetrics)
+
+percentile_quantizer() builds a third kind on the same labels, binned by
+where a value sits in a population sketch (population_sketch.py).
+"""
+
+import bisect
+
+import numpy as np
+
+# 5段階の境界値 (norm < 20 -> 0, ... , norm >= 80 -> 4)
+BINS = (20, 40, 60, 80)
+
+PITCH_LABELS = (
+    "Sub-bass / Gravitas (重厚)",
+    "Deep / Resonant (共鳴)",
+    "Baritone / Grounded (安定的)",
+    "Tenor / Clear (明瞭)",
+    "Soprano / Crystalline (透き通った)",
+)
+SPEED_LABELS = (
+    "Largo / Contemplative (熟考)",
+    "Andante / Deliberate (慎重)",
+    "Moderato / Conversational (会話的)",
+    "Allegro / Energetic (活発)",
+    "Presto / Urgent (性急)",
+)
+VOLUME_LABELS = (
+    "Whisper / Intimate (親密・秘密)",
+    "Soft / Gentle (穏やか・配慮)",
+    "Mezzo / Balanced (バランス)",
+    "Forte / Projecting (発信・主張)",
+    "Fortissimo / Commanding (威厳・支配)",
+)
+# Tone: 低い＝ハスキー/雑味、高い＝クリア/純音
+TONE_LABELS = (
+    "Husky / Textured (陰影・ハスキー)",
+    "Smoky / Warm (温かみ・スモーキー)",
+    "Neutral / Natural (自然的)",
+    "Bright / Polished (磨かれた)",
+    "Piercing / Pure (純粋・鋭い)",
+)
+
+# couple_processor has always used shorter volume / tone wording
+COUPLE_VOLUME_LABELS = (
+    "Whisper / Intimate (親密)",
+    "Soft / Gentle (穏やか)",
+    "Mezzo / Balanced (バランス)",
+    "Forte / Projecting (発信)",
+    "Fortissimo / Commanding (威厳)",
+)
+COUPLE_TONE_LABELS = (
+    "Husky / Textured (ハスキー)",
+    "Smoky / Warm (スモーキー)",
+    "Neutral / Natural (ナチュラル)",
+    "Bright / Polished (ブライト)",
+    "Piercing / Pure (純粋)",
+)
+
+
+class QuantizerTable:
+    """
+    One metric: norm = ((value - offset) / span) * 100, optionally clamped
+    to 0-100, then binned against `bins`. With span=None the value is
+    already on the 0-100 scale and used as is.
+    """
+
+    def __init__(self, labels, offset=0.0, span=None, clamp=False, bins=BINS):
+        if len(labels) != len(bins) + 1:
+            raise ValueError(f"Expected {len(bins) + 1} labels, got {len(labels)}")
+        self.labels = tuple(labels)
+        self.offset = offset
+        self.span = span
+        self.clamp = clamp
+        self.bins = tuple(bins)
+        self._bins_array = np.asarray(bins, dtype=np.float64)
+        self._labels_array = np.asarray(self.labels, dtype=object)
+
+    def normalize(self, value):
+        if self.span is None:
+            return value
+        norm = ((value - self.offset) / self.span) * 100
+        if self.clamp:
+            norm = min(100, max(0, norm))
+        return norm
+
+    def normalize_array(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        if self.span is None:
+            return values
+        norm = ((values - self.offset) / self.span) * 100
+        if self.clamp:
+            # Same NaN handling as min(100, max(0, norm)): NaN becomes 0
+            norm = np.where(norm > 0, norm, 0)
+            norm = np.where(norm < 100, norm, 100)
+        return norm
+
+    def index(self, value):
+        # NaNはどの境界より小さくないので最上段 (if-chainと同じ挙動)
+        return bisect.bisect_right(self.bins, self.normalize(value))
+
+    def indices(self, values):
+        return np.searchsorted(self._bins_array, self.normalize_array(values), side='right').astype(np.int8)
+
+    def tag(self, value):
+        return self.labels[self.index(value)]
+
+    def tags(self, values):
+        """Object array of the shared label strings"""
+        return self._labels_array[self.indices(values)]
+
+
+class PercentileTable(QuantizerTable):
+    """
+    Bins by population percentile instead of a fixed scale: norm is the
+    value's rank * 100, so the BINS edges become quintiles. `sketch` is
+    anything with rank(value) / ranks(values) in 0-1, e.g. a
+    population_sketch.KLLSketch; only the sketch is kept, never the values.
+    """
+
+    def __init__(self, labels, sketch, bins=BINS):
+        super().__init__(labels, bins=bins)
+        self.sketch = sketch
+
+    def normalize(self, value):
+        return self.sketch.rank(value) * 100
+
+    def normalize_array(self, values):
+        return self.sketch.ranks(values) * 100
+
+
+class TableQuantizer:
+    """A named set of QuantizerTables (pitch / speed / volume / tone)"""
+
+    def __init__(self, **tables):
+        self.tables = tables
+
+    def __getitem__(self, metric):
+        return self.tables[metric]
+
+    def tag(self, metric, value):
+        return self.tables[metric].tag(value)
+
+    def batch_indices(self, **columns):
+        """{metric: int8 label indices} for whole columns at once"""
+        return {metric: self.tables[metric].indices(values) for metric, values in columns.items()}
+
+    def batch_tags(self, **columns):
+        """{metric: object array of labels} for whole columns at once"""
+        return {metric: self.tables[metric].tags(values) for metric, values in columns.items()}
+
+
+SCORE_QUANTIZER = TableQuantizer(
+    pitch=QuantizerTable(PITCH_LABELS),
+    speed=QuantizerTable(SPEED_LABELS),
+    volume=QuantizerTable(VOLUME_LABELS),
+    tone=QuantizerTable(TONE_LABELS),
+)
+
+COUPLE_QUANTIZER = TableQuantizer(
+    pitch=QuantizerTable(PITCH_LABELS, offset=80, span=220, clamp=True),        # 80-300 Hz
+    speed=QuantizerTable(SPEED_LABELS, span=1),                                 # 0-1
+    volume=QuantizerTable(COUPLE_VOLUME_LABELS, span=1),                        # 0-1
+    tone=QuantizerTable(COUPLE_TONE_LABELS, offset=1000, span=3000, clamp=True),  # 1000-4000 Hz
+)
+
+
+def percentile_quantizer(sketches, base=COUPLE_QUANTIZER):
+    """`base`'s labels binned by population percentile (sketches[metric])"""
+    return TableQuantizer(**{
+        metric: PercentileTable(table.labels, sketches[metric])
+        for metric, table in base.tables.items()
+    })
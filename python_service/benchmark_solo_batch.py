@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+SoloIdentityEngine batch benchmark
+Compares rows/second of generate_payload() in a Python loop against
+SoloIdentityEngine.batch(), and checks that every compared row is identical.
+
+Usage:
+    python benchmark_solo_batch.py --rows 1000000 --check-rows 100000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from voice_processor import SoloIdentityEngine
+
+MBTI_TYPES = [
+    a + b + c + d
+    for a in 'EI' for b in 'SN' for c in 'TF' for d in 'JP'
+]
+
+
+def make_inputs(rows: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    p, s, v, t = (rng.integers(0, 101, rows) for _ in range(4))
+    # Lower-case and odd entries exercise the same .upper()/substring rules
+    mbti = rng.choice(MBTI_TYPES + ['infp', 'estj', 'unknown'], rows)
+    return p, s, v, t, mbti
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark SoloIdentityEngine.batch')
+    parser.add_argument('--rows', type=int, default=1_000_000, help='Rows for the batch timing')
+    parser.add_argument('--check-rows', type=int, default=100_000,
+                        help='Rows run through generate_payload for timing and comparison')
+
+    args = parser.parse_args()
+    p, s, v, t, mbti = make_inputs(args.rows)
+
+    t0 = time.perf_counter()
+    result = SoloIdentityEngine.batch(p, s, v, t, mbti)
+    batch_seconds = time.perf_counter() - t0
+
+    n = min(args.check_rows, args.rows)
+    t0 = time.perf_counter()
+    expected = [
+        SoloIdentityEngine(int(p[i]), int(s[i]), int(v[i]), int(t[i]), str(mbti[i])).generate_payload()
+        for i in range(n)
+    ]
+    loop_seconds = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    rows = [result.row(i) for i in range(n)]
+    view_seconds = time.perf_counter() - t0
+
+    mismatches = sum(1 for a, b in zip(expected, rows) if a != b)
+
+    print(f"generate_payload loop : {n / loop_seconds:>12,.0f} rows/s ({n:,} rows)")
+    print(f"batch (columnar)      : {args.rows / batch_seconds:>12,.0f} rows/s ({args.rows:,} rows)")
+    print(f"batch row(i) view     : {n / view_seconds:>12,.0f} rows/s ({n:,} rows)")
+    print(f"Speedup (columnar)    : x{(args.rows / batch_seconds) / (n / loop_seconds):.0f}")
+    print(f"Identical rows        : {n - mismatches:,}/{n:,}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+VoiceMatchIndex benchmark
+Builds an index over random p/s/v/t users, times top_sync / top_contrast
+queries against a NumPy brute-force scan (full distance pass + argpartition),
+checks every answer against an exact tie-ordered scan, then repeats after a
+round of inserts/deletes.
+
+Usage:
+    python benchmark_voice_match.py --users 1000000 --queries 200 --k 10
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from voice_match import VoiceMatchIndex
+
+
+def brute_force_top(vectors, alive, q, k, nearest):
+    """Timed baseline: one full scan plus argpartition"""
+    d = np.abs(vectors - q)
+    dist = np.where(alive, d[:, 0] + d[:, 1] + d[:, 2] + d[:, 3], np.inf if nearest else -np.inf)
+    key = dist if nearest else -dist
+    return np.argpartition(key, k - 1)[:k]
+
+
+def exact_answer(vectors, alive, q, k, nearest):
+    """User ids (= rows here) of the exact top-k, ties by id"""
+    d = np.abs(vectors - q)
+    dist = d[:, 0] + d[:, 1] + d[:, 2] + d[:, 3]
+    ids = np.flatnonzero(alive)
+    order = np.lexsort((ids, dist[ids] if nearest else -dist[ids]))[:k]
+    return ids[order].tolist()
+
+
+def run_queries(index, vectors, alive, queries, k):
+    timings = {}
+    mismatches = 0
+    for name, nearest in (('top_sync', True), ('top_contrast', False)):
+        query = getattr(index, name)
+        t0 = time.perf_counter()
+        answers = [query(*q, k=k) for q in queries]
+        t1 = time.perf_counter()
+        for q in queries:
+            brute_force_top(vectors, alive, q, k, nearest)
+        t2 = time.perf_counter()
+        timings[name] = (t1 - t0, t2 - t1)
+        for q, got in zip(queries, answers):
+            mismatches += [m['User_ID'] for m in got] != exact_answer(vectors, alive, q, k, nearest)
+    for name, (index_seconds, brute_seconds) in timings.items():
+        print(f"  {name:<13}: index {index_seconds / len(queries) * 1e3:7.3f} ms/query, "
+              f"brute force {brute_seconds / len(queries) * 1e3:7.3f} ms/query "
+              f"(x{brute_seconds / index_seconds:.0f})")
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark VoiceMatchIndex against brute force')
+    parser.add_argument('--users', type=int, default=1_000_000, help='Users in the index')
+    parser.add_argument('--queries', type=int, default=200, help='Queries per phase')
+    parser.add_argument('--k', type=int, default=10, help='Matches per query')
+    parser.add_argument('--churn', type=int, default=20_000, help='Inserts and deletes between phases')
+
+    args = parser.parse_args()
+    rng = np.random.default_rng(0)
+    capacity = args.users + args.churn
+    vectors = rng.integers(0, 101, (capacity, 4)).astype(np.float64)
+    alive = np.zeros(capacity, dtype=bool)
+    alive[:args.users] = True
+
+    t0 = time.perf_counter()
+    index = VoiceMatchIndex.from_arrays(range(args.users), *vectors[:args.users].T)
+    print(f"Build          : {time.perf_counter() - t0:.2f}s for {args.users:,} users")
+
+    queries = rng.integers(0, 101, (args.queries, 4))
+    print("Static index")
+    mismatches = run_queries(index, vectors, alive, queries, args.k)
+
+    # Churn: new users land in the brute-force tail, deletes are tombstones
+    deleted = rng.choice(args.users, args.churn, replace=False)
+    t0 = time.perf_counter()
+    for user_id in range(args.users, capacity):
+        index.insert(user_id, *vectors[user_id])
+    for user_id in deleted:
+        index.delete(int(user_id))
+    churn_seconds = time.perf_counter() - t0
+    alive[args.users:] = True
+    alive[deleted] = False
+    print(f"Churn          : {args.churn:,} inserts + {args.churn:,} deletes in {churn_seconds:.2f}s "
+          f"({churn_seconds / (2 * args.churn) * 1e6:.1f} us/op incl. rebuilds)")
+
+    print("After churn")
+    mismatches += run_queries(index, vectors, alive, queries, args.k)
+    print(f"Identical answers: {4 * args.queries - mismatches}/{4 * args.queries}")
+
+
+if __name__ == '__main__':
+    main()
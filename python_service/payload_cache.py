@@ -0,0 +1,109 @@
+"""
+Bounded LRU memoization for the payload engines.
+
+Cached values are frozen (FrozenDict / FrozenList) before they are stored,
+so one instance can be handed to every caller without copying: the
+structures stay JSON-serializable and compare equal to plain dicts/lists,
+but any attempt to mutate them raises TypeError.
+"""
+
+from collections import OrderedDict
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError(f"{type(self).__name__} is read-only")
+
+
+class FrozenDict(dict):
+    """dict that refuses mutation (shared cache entries)"""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        # dict.__init__ does not go through __setitem__
+        return (type(self), (dict(self),))
+
+
+class FrozenList(list):
+    """list that refuses mutation (shared cache entries)"""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def __reduce__(self):
+        return (type(self), (list(self),))
+
+
+_MUTABLE = (dict, list)
+
+
+def freeze(value):
+    """Recursively convert dicts/lists to their read-only counterparts"""
+    # Exact type checks: already-frozen values are shared as they are, and
+    # leaves (str / int) are not recursed into
+    if type(value) is dict:
+        return FrozenDict({k: freeze(v) if type(v) in _MUTABLE else v for k, v in value.items()})
+    if type(value) is list:
+        return FrozenList([freeze(v) if type(v) in _MUTABLE else v for v in value])
+    return value
+
+
+class PayloadCache:
+    """
+    LRU cache from a normalized input key to a frozen value.
+    maxsize=0 disables storage (every call builds).
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_or_build(self, key, build):
+        # No lock: each OrderedDict call is atomic under the GIL, and the
+        # only race (an entry evicted between get and move_to_end, or a
+        # concurrent miss building the same value twice) is harmless
+        entries = self._entries
+        value = entries.get(key)
+        if value is not None:
+            try:
+                entries.move_to_end(key)
+            except KeyError:
+                pass
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        value = freeze(build())
+        if self.maxsize > 0:
+            entries[key] = value
+            while len(entries) > self.maxsize:
+                try:
+                    entries.popitem(last=False)
+                except KeyError:
+                    break
+                self.evictions += 1
+        return value
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
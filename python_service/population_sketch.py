@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Population Percentile Sketches
+Constant-memory, mergeable quantile sketches (KLL) of the acoustic metrics
+we produce, so tags can be assigned by where a voice sits in our user base
+instead of on a fixed Hz / 0-1 scale.
+
+Each metric keeps a KLLSketch: a stack of compactors where level h holds
+items of weight 2**h. When a level fills up it is sorted and every other
+item (random offset) is promoted, so memory stays under 3*k items per
+metric however many values were seen, and rank error is ~1/k. Two sketches
+merge by concatenating levels and compacting, so per-worker files can be
+combined.
+
+Usage:
+    python population_sketch.py show population.json
+    python population_sketch.py merge population.json worker1.json worker2.json
+"""
+
+import argparse
+import base64
+import json
+import math
+import os
+import random
+
+import numpy as np
+
+# AcousticMetrics fields that drive the tags
+METRICS = ('pitch', 'speed', 'volume', 'tone')
+
+DEFAULT_K = 200
+
+
+class KLLSketch:
+    """Mergeable streaming quantile sketch (rank queries in 0-1)"""
+
+    def __init__(self, k: int = DEFAULT_K, seed=None):
+        self.k = k
+        self.n = 0
+        self.levels = [[]]
+        self._rng = random.Random(seed)
+        self._view = None
+
+    def __len__(self):
+        return self.n
+
+    def _capacity(self, level: int) -> int:
+        # Top level holds k items, each level below 2/3 of the one above
+        depth = len(self.levels) - level - 1
+        return max(2, int(math.ceil(self.k * (2 / 3) ** depth)))
+
+    def _full(self):
+        return any(len(items) >= self._capacity(h) for h, items in enumerate(self.levels))
+
+    def _compress(self):
+        while self._full():
+            for h in range(len(self.levels)):
+                items = self.levels[h]
+                if len(items) < self._capacity(h):
+                    continue
+                if h + 1 == len(self.levels):
+                    self.levels.append([])
+                items.sort()
+                # An odd item out stays behind so total weight is preserved
+                keep = [items.pop()] if len(items) % 2 else []
+                self.levels[h + 1].extend(items[self._rng.randint(0, 1)::2])
+                self.levels[h] = keep
+        self._view = None
+
+    def update(self, value: float):
+        value = float(value)
+        if math.isnan(value):
+            return
+        self.levels[0].append(value)
+        self.n += 1
+        self._view = None
+        if len(self.levels[0]) >= self._capacity(0):
+            self._compress()
+
+    def update_many(self, values):
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        # Chunks of k: compacting one larger sorted buffer costs no more
+        # rank error than several small ones and avoids per-item compaction
+        for start in range(0, len(values), self.k):
+            chunk = values[start:start + self.k]
+            self.levels[0].extend(chunk.tolist())
+            self.n += len(chunk)
+            self._compress()
+        self._view = None
+
+    def merge(self, other: 'KLLSketch'):
+        while len(self.levels) < len(other.levels):
+            self.levels.append([])
+        for h, items in enumerate(other.levels):
+            self.levels[h].extend(items)
+        self.n += other.n
+        self._compress()
+
+    def _sorted_view(self):
+        """(sorted values, cumulative weights), rebuilt after updates"""
+        if self._view is None:
+            values = np.concatenate([np.asarray(items, dtype=np.float64) for items in self.levels])
+            weights = np.concatenate([np.full(len(items), 2 ** h, dtype=np.int64)
+                                      for h, items in enumerate(self.levels)])
+            order = np.argsort(values, kind='stable')
+            self._view = (values[order], np.cumsum(weights[order]))
+        return self._view
+
+    def ranks(self, values) -> np.ndarray:
+        """Estimated population fraction below each value (mid-rank for ties)"""
+        if self.n == 0:
+            raise ValueError("Population sketch is empty")
+        sorted_values, cumulative = self._sorted_view()
+        cumulative = np.concatenate([[0], cumulative])
+        values = np.asarray(values, dtype=np.float64)
+        below = cumulative[np.searchsorted(sorted_values, values, side='left')]
+        at_or_below = cumulative[np.searchsorted(sorted_values, values, side='right')]
+        # Keep NaN as NaN (binned like the fixed tables do)
+        return np.where(np.isnan(values), np.nan, (below + at_or_below) / 2 / cumulative[-1])
+
+    def rank(self, value: float) -> float:
+        return float(self.ranks(value))
+
+    def quantile(self, q: float) -> float:
+        """Value at population fraction q (0-1)"""
+        if self.n == 0:
+            raise ValueError("Population sketch is empty")
+        sorted_values, cumulative = self._sorted_view()
+        pos = np.searchsorted(cumulative, q * cumulative[-1], side='left')
+        return float(sorted_values[min(pos, len(sorted_values) - 1)])
+
+    def to_dict(self) -> dict:
+        # Raw little-endian float64 per level: a few KB per metric, and
+        # values round-trip exactly so a stored voice ranks against itself
+        return {
+            'k': self.k,
+            'n': self.n,
+            'levels': [
+                base64.b64encode(np.asarray(items, dtype='<f8').tobytes()).decode('ascii')
+                for items in self.levels
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'KLLSketch':
+        sketch = cls(k=data['k'])
+        sketch.n = data['n']
+        sketch.levels = [
+            np.frombuffer(base64.b64decode(level), dtype='<f8').tolist()
+            for level in data['levels']
+        ]
+        return sketch
+
+
+class PopulationSketches:
+    """One KLLSketch per metric, updated from AcousticMetrics (or dicts)"""
+
+    def __init__(self, k: int = DEFAULT_K):
+        self.sketches = {metric: KLLSketch(k) for metric in METRICS}
+
+    def __getitem__(self, metric: str) -> KLLSketch:
+        return self.sketches[metric]
+
+    @property
+    def n(self) -> int:
+        return max(sketch.n for sketch in self.sketches.values())
+
+    def update(self, metrics):
+        for metric, sketch in self.sketches.items():
+            value = metrics[metric] if isinstance(metrics, dict) else getattr(metrics, metric)
+            sketch.update(value)
+
+    def merge(self, other: 'PopulationSketches'):
+        for metric, sketch in self.sketches.items():
+            sketch.merge(other.sketches[metric])
+
+    def percentile(self, metric: str, value: float) -> float:
+        return self.sketches[metric].rank(value) * 100
+
+    def to_dict(self) -> dict:
+        return {metric: sketch.to_dict() for metric, sketch in self.sketches.items()}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'PopulationSketches':
+        population = cls()
+        population.sketches = {metric: KLLSketch.from_dict(data[metric]) for metric in METRICS}
+        return population
+
+    def save(self, path: str):
+        # Write-then-rename so a crash never leaves a truncated file
+        tmp = f"{path}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'PopulationSketches':
+        """Load `path`, or start an empty population if it does not exist"""
+        if not os.path.exists(path):
+            return cls()
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Inspect or merge population percentile sketches')
+    sub = parser.add_subparsers(dest='command', required=True)
+    show = sub.add_parser('show', help='Print population deciles per metric')
+    show.add_argument('path')
+    merge = sub.add_parser('merge', help='Merge sketch files (e.g. one per worker) into a new OUTPUT')
+    merge.add_argument('output')
+    merge.add_argument('inputs', nargs='+')
+
+    args = parser.parse_args()
+
+    if args.command == 'merge':
+        population = PopulationSketches()
+        for path in args.inputs:
+            population.merge(PopulationSketches.load(path))
+        population.save(args.output)
+        print(f"Merged {len(args.inputs)} file(s) into {args.output} ({population.n:,} values per metric)")
+        return
+
+    population = PopulationSketches.load(args.path)
+    print(f"{population.n:,} values per metric")
+    if population.n == 0:
+        return
+    for metric in METRICS:
+        deciles = [population[metric].quantile(q / 10) for q in range(1, 10)]
+        print(f"{metric:>7}: " + ' '.join(f"{value:.4g}" for value in deciles))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+"""
+Content-addressed disk cache for analysis results.
+
+Entries are JSON files named by a hex key (normally a hash of the audio
+bytes, user info and analysis version, see content_hash / cache_key) and
+sharded by the key's first two characters. Writes go to a temporary file in
+the same directory and are renamed into place, so concurrent workers only
+ever see complete entries; the last writer of a key wins, which is harmless
+because equal keys hold equal results.
+
+Recency is the file's mtime (touched on every hit). Once the directory
+grows past `max_bytes`, the least recently used entries are deleted until
+it is back under 90% of the limit.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+
+# Eviction trims down to this fraction of max_bytes so a full cache does
+# not rescan the directory on every write
+LOW_WATER = 0.9
+
+
+def content_hash(source, block_size: int = 1 << 20) -> str:
+    """sha256 of a file's bytes, read in blocks (`source` may also be the bytes)"""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return hashlib.sha256(source).hexdigest()
+    digest = hashlib.sha256()
+    with open(source, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def cache_key(*parts) -> str:
+    """Stable key from JSON-serializable parts (dict order does not matter)"""
+    canonical = json.dumps(parts, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class ResultCache:
+    """Size-bounded LRU of JSON values on disk, safe to share between processes"""
+
+    def __init__(self, directory: str, max_bytes: int = 512 * 2**20):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        os.makedirs(directory, exist_ok=True)
+        # Other workers write too, so this is only an estimate between scans
+        self._size = sum(size for _, _, size in self._entries())
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def _entries(self):
+        """(path, mtime, size) of every stored entry"""
+        for shard in os.scandir(self.directory):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if not entry.name.endswith('.json'):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue  # Evicted by another worker meanwhile
+                yield entry.path, stat.st_mtime, stat.st_size
+
+    def get(self, key: str):
+        """Stored value, or None on a miss"""
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                value = json.load(f)
+            os.utime(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except ValueError:
+            # Unreadable entry (e.g. written by an older format): drop it
+            self.misses += 1
+            self._remove(path)
+            return None
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(value, f, ensure_ascii=False)
+            self._size += os.path.getsize(tmp)
+            os.replace(tmp, path)
+        except BaseException:
+            self._remove(tmp)
+            raise
+        if self._size > self.max_bytes:
+            self.evict()
+
+    def evict(self):
+        """Delete least recently used entries down to LOW_WATER * max_bytes"""
+        entries = sorted(self._entries(), key=lambda entry: entry[1])
+        self._size = sum(size for _, _, size in entries)
+        for path, _, size in entries:
+            if self._size <= self.max_bytes * LOW_WATER:
+                break
+            if self._remove(path):
+                self.evictions += 1
+            self._size -= size
+
+    @staticmethod
+    def _remove(path: str) -> bool:
+        try:
+            os.remove(path)
+            return True
+        except FileNotFoundError:
+            return False
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            'directory': self.directory,
+            'size_bytes': self._size,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
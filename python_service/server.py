@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+EtchVox Analysis Service
+Local asyncio HTTP service so the Next.js API routes can call the solo /
+couple engines and the couple audio analysis without spawning a process
+per request.
+
+Endpoints (JSON in, JSON out):
+    GET  /health           Queue depth, capacity, payload and result cache counters
+    POST /solo             {"p", "s", "v", "t", "mbti"} -> SoloIdentityEngine payload
+    POST /couple           {"user_a": {...}, "user_b": {...}} -> CoupleResonanceEngine payload
+    POST /couple/analyze   {"path", "name_a", "job_a", ..., "pitch_engine", "quantizer"} -> couple_processor result
+                           (the recording may come in memory instead of `path`: as
+                           "audio_base64", or as the raw body with Content-Type audio/*
+                           or application/octet-stream and the other fields in the query)
+
+Audio analysis runs on a process pool; when every worker is busy and the
+queue is full the service answers 429 instead of piling up work.
+
+Usage:
+    python server.py --port 8765 --workers 4
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import sys
+import traceback
+import urllib.parse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import redirect_stdout
+from http import HTTPStatus
+
+from population_sketch import PopulationSketches
+from result_cache import ResultCache
+from voice_processor import AcousticQuantizer, SoloIdentityEngine, CoupleResonanceEngine
+
+# couple_processor lives with the other CLI tools in scripts/
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+try:
+    import couple_processor
+except (ImportError, SystemExit):
+    # Audio dependencies missing: payload endpoints still work
+    couple_processor = None
+
+MAX_BODY_BYTES = 64 * 1024
+# /couple/analyze bodies can carry the recording itself
+MAX_AUDIO_BODY_BYTES = 32 * 2**20
+
+
+class HTTPError(Exception):
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def analyze_couple_job(job: dict, options: dict) -> dict:
+    """Process-pool entry point: one manifest-style job -> batch record"""
+    with redirect_stdout(sys.stderr):
+        return couple_processor.process_manifest_row(job, options)
+
+
+def field(body: dict, name: str, kind: str, prefix: str = ''):
+    """body[name] checked to be a `kind` ('number': finite int/float, 'string', 'object')"""
+    if name not in body:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, f"Missing field: {prefix}{name}")
+    value = body[name]
+    if kind == 'number':
+        valid = (isinstance(value, (int, float)) and not isinstance(value, bool)
+                 and math.isfinite(value))
+    else:
+        valid = isinstance(value, {'string': str, 'object': dict}[kind])
+    if not valid:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, f"Field {prefix}{name} must be a {kind}")
+    return value
+
+
+def build_solo_payload(body: dict) -> dict:
+    p, s, v, t = (field(body, name, 'number') for name in ('p', 's', 'v', 't'))
+    engine = SoloIdentityEngine(p=p, s=s, v=v, t=t, mbti_type=field(body, 'mbti', 'string'))
+    return engine.generate_payload()
+
+
+def build_couple_payload(body: dict) -> dict:
+    users = []
+    for side in ('user_a', 'user_b'):
+        user = field(body, side, 'object')
+        for name in ('p', 's', 'v', 't'):
+            field(user, name, 'number', prefix=f'{side}.')
+        field(user, 'job', 'string', prefix=f'{side}.')
+        users.append(user)
+    try:
+        engine = CoupleResonanceEngine(*users)
+        return engine.generate_payload()
+    except KeyError as e:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, f"Missing field: {e.args[0]}")
+
+
+def job_options(body: dict) -> dict:
+    """Per-request couple_processor.JOB_OPTIONS overrides, checked before they reach a worker"""
+    options = {key: body[key] for key in couple_processor.JOB_OPTIONS if key in body}
+    choices = {
+        'pitch_engine': couple_processor.PITCH_ENGINES,
+        'pitch_pass': couple_processor.PITCH_PASSES,
+        'quantizer': couple_processor.QUANTIZERS,
+    }
+    for key, allowed in choices.items():
+        if key in options and options[key] not in allowed:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"{key} must be one of: {', '.join(allowed)}")
+    if 'analysis_sr' in options:
+        sr = options['analysis_sr']
+        if not isinstance(sr, int) or isinstance(sr, bool) or sr < couple_processor.MIN_ANALYSIS_SR:
+            raise HTTPError(HTTPStatus.BAD_REQUEST,
+                            f"analysis_sr must be an integer of at least {couple_processor.MIN_ANALYSIS_SR}")
+    if 'vad' in options and not isinstance(options['vad'], bool):
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "vad must be true or false")
+    return options
+
+
+class AnalysisService:
+    """Routes requests; CPU-bound analysis goes to a bounded process pool"""
+
+    def __init__(self, workers: int, queue_size: int, timeout: float, options: dict,
+                 population_path: str = None):
+        self.workers = workers
+        self.capacity = workers + queue_size
+        self.timeout = timeout
+        self.options = options
+        self.in_flight = 0
+        # Result cache lookups happen in the workers; hits are counted here
+        self.cache_lookups = 0
+        self.cache_hits = 0
+        # Updated here from finished analyses; workers only see snapshots
+        self.population_path = population_path
+        self.population = PopulationSketches.load(population_path) if population_path else None
+        # Saves run here, one at a time and in order, off the event loop
+        self.population_writer = ThreadPoolExecutor(max_workers=1) if population_path else None
+        self.executor = None
+        if couple_processor is not None:
+            self.executor = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=couple_processor.warm_up,
+                initargs=(options['analysis_sr'], options['pitch_engine']),
+            )
+
+    async def route(self, method: str, path: str, body: dict) -> dict:
+        if method == 'GET' and path == '/health':
+            return {
+                'status': 'ok',
+                'in_flight': self.in_flight,
+                'capacity': self.capacity,
+                'audio_analysis': self.executor is not None,
+                'payload_cache': {
+                    'solo': SoloIdentityEngine.cache.stats(),
+                    'scm': CoupleResonanceEngine.scm_cache.stats(),
+                    'tags': AcousticQuantizer.tag_cache.stats(),
+                },
+                'result_cache': self.result_cache_stats(),
+            }
+        if path not in ('/solo', '/couple', '/couple/analyze'):
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"No route for {path}")
+        if method != 'POST':
+            raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, f"{method} not allowed")
+        if path == '/solo':
+            return build_solo_payload(body)
+        if path == '/couple':
+            return build_couple_payload(body)
+        return await self.analyze(body)
+
+    async def analyze(self, body: dict) -> dict:
+        if self.executor is None:
+            raise HTTPError(HTTPStatus.SERVICE_UNAVAILABLE, "Audio analysis dependencies are not installed")
+        options = {**self.options, **job_options(body)}
+        # Only read_request sets bytes here; a JSON value is never a recording
+        audio = body.pop('audio_bytes', None)
+        if isinstance(audio, bytes):
+            options['audio_bytes'] = audio
+        elif 'audio_base64' in body:
+            field(body, 'audio_base64', 'string')
+        else:
+            field(body, 'path', 'string')
+        # Backpressure: refuse rather than queue without bound
+        if self.in_flight >= self.capacity:
+            raise HTTPError(HTTPStatus.TOO_MANY_REQUESTS, "Analysis queue is full")
+
+        if options.get('quantizer') == 'percentile':
+            options['population'] = self.population
+        self.in_flight += 1
+        future = asyncio.get_running_loop().run_in_executor(
+            self.executor, analyze_couple_job, body, options
+        )
+        # A timed-out job keeps its worker until it finishes, so the slot is
+        # released on completion rather than when the client gives up
+        future.add_done_callback(self._release)
+        try:
+            record = await asyncio.wait_for(asyncio.shield(future), self.timeout)
+        except asyncio.TimeoutError:
+            raise HTTPError(HTTPStatus.GATEWAY_TIMEOUT, f"Analysis exceeded {self.timeout:.0f}s")
+        if record['status'] != 'ok':
+            raise HTTPError(HTTPStatus.UNPROCESSABLE_ENTITY, record['error'])
+        if 'cache' in record['result']:
+            self.cache_lookups += 1
+            self.cache_hits += record['result']['cache'] == 'hit'
+        if self.population is not None:
+            couple_processor.update_population(self.population, record['result'])
+            # Snapshot on the loop so the write never sees a half-updated sketch
+            snapshot = PopulationSketches.from_dict(self.population.to_dict())
+            self.population_writer.submit(self._save_population, snapshot)
+        return record['result']
+
+    def result_cache_stats(self):
+        if self.options.get('cache') is None:
+            return None
+        return {
+            'directory': self.options['cache'].directory,
+            'lookups': self.cache_lookups,
+            'hits': self.cache_hits,
+            'hit_rate': self.cache_hits / self.cache_lookups if self.cache_lookups else 0.0,
+        }
+
+    def _release(self, _future):
+        self.in_flight -= 1
+
+    def _save_population(self, snapshot: PopulationSketches):
+        try:
+            snapshot.save(self.population_path)
+        except Exception:
+            traceback.print_exc()
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            try:
+                method, path, body = await read_request(reader)
+                status, payload = HTTPStatus.OK, await self.route(method, path, body)
+            except HTTPError as e:
+                status, payload = e.status, {'error': e.message}
+            except Exception:
+                # Answer instead of dropping the connection; details go to the log
+                traceback.print_exc()
+                status, payload = HTTPStatus.INTERNAL_SERVER_ERROR, {'error': "Internal server error"}
+            await write_response(writer, status, payload)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+        if self.population_writer is not None:
+            # Pending saves hold the latest population; let them finish
+            self.population_writer.shutdown(wait=True)
+
+
+def query_job(query: str) -> dict:
+    """Job fields sent in the query string next to a raw audio body"""
+    job = dict(urllib.parse.parse_qsl(query))
+    if job.get('analysis_sr', '').isdigit():
+        job['analysis_sr'] = int(job['analysis_sr'])
+    if 'vad' in job:
+        job['vad'] = {'true': True, 'false': False}.get(job['vad'].lower(), job['vad'])
+    return job
+
+
+async def read_request(reader: asyncio.StreamReader) -> tuple:
+    """Parse request line, headers and a JSON body
+    
+    A raw audio body (Content-Type audio/* or application/octet-stream) is
+    returned as body['audio_bytes'] next to the query string's job fields.
+    """
+    request_line = (await reader.readline()).decode('latin-1').strip()
+    try:
+        method, target, _ = request_line.split(' ', 2)
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Malformed request line")
+
+    headers = {}
+    while True:
+        line = (await reader.readline()).decode('latin-1').strip()
+        if not line:
+            break
+        name, _, value = line.partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+    try:
+        length = int(headers.get('content-length', 0) or 0)
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Malformed Content-Length")
+    path, _, query = target.partition('?')
+    if length > (MAX_AUDIO_BODY_BYTES if path == '/couple/analyze' else MAX_BODY_BYTES):
+        raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Request body too large")
+    content_type = headers.get('content-type', '').split(';', 1)[0].strip().lower()
+    if content_type.startswith('audio/') or content_type == 'application/octet-stream':
+        return method.upper(), path, {**query_job(query), 'audio_bytes': await reader.readexactly(length)}
+    body = {}
+    if length:
+        try:
+            body = json.loads(await reader.readexactly(length))
+        except ValueError:
+            # JSONDecodeError, or bytes that are not UTF-8
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Body must be JSON")
+        if not isinstance(body, dict):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Body must be a JSON object")
+    return method.upper(), path, body
+
+
+async def write_response(writer: asyncio.StreamWriter, status: HTTPStatus, payload: dict):
+    data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+    head = (
+        f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+        "Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(data)}\r\n"
+        "Connection: close\r\n"
+    )
+    if status == HTTPStatus.TOO_MANY_REQUESTS:
+        head += "Retry-After: 1\r\n"
+    writer.write((head + "\r\n").encode('latin-1') + data)
+    await writer.drain()
+
+
+async def serve(args):
+    service = AnalysisService(
+        workers=args.workers,
+        queue_size=args.queue_size,
+        timeout=args.timeout,
+        options={
+            'pitch_engine': args.pitch_engine,
+            'pitch_pass': 'segment',
+            'analysis_sr': args.analysis_sr,
+            'quantizer': args.quantizer,
+            'cache': ResultCache(args.cache, int(args.cache_max_mb * 2**20)) if args.cache else None,
+        },
+        population_path=args.population,
+    )
+    server = await asyncio.start_server(service.handle_connection, args.host, args.port)
+    print(f"Listening on http://{args.host}:{args.port} ({args.workers} analysis workers)")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='EtchVox local analysis service')
+    parser.add_argument('--host', default='127.0.0.1', help='Bind address')
+    parser.add_argument('--port', type=int, default=8765, help='Bind port')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='Analysis processes')
+    parser.add_argument('--queue-size', type=int, default=8, help='Analyses allowed to wait beyond --workers')
+    parser.add_argument('--timeout', type=float, default=120, help='Seconds before an analysis request returns 504')
+    # Without the audio dependencies /couple/analyze is off and these go unused
+    pitch_engines = couple_processor.PITCH_ENGINES if couple_processor else None
+    quantizers = couple_processor.QUANTIZERS if couple_processor else None
+    parser.add_argument('--pitch-engine', choices=pitch_engines, default='pyin',
+                        help='Default pitch tracker for /couple/analyze')
+    parser.add_argument('--analysis-sr', type=int, default=44100, help='Default analysis sample rate')
+    parser.add_argument('--population', help='Population sketch file updated with every couple analysis')
+    parser.add_argument('--quantizer', choices=quantizers, default='fixed', help='Default tag quantizer')
+    parser.add_argument('--cache', help='Couple result cache directory (shared with batch / serve workers)')
+    parser.add_argument('--cache-max-mb', type=float, default=512, help='Size limit of --cache')
+
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,226 @@
+"""
+Voice match index: "who in the user base resonates with this voice?"
+
+Sync_Score is the same as CoupleResonanceEngine._calculate_synergy:
+100 - mean |delta| over p/s/v/t, i.e. a smaller L1 distance is a higher
+score. The index answers the top-k highest Sync_Score (nearest) and the
+top-k most contrasting (farthest) stored users.
+
+Layout: every metric is 0-100, so the 4-D space is cut into a coarse grid
+(cell_size per axis) and indexed users are stored grouped by cell (CSR).
+A query bounds each non-empty cell's min / max L1 distance from the query
+and computes exact distances only for cells that can still hold a top-k
+user; the answer is exact, ties broken by insertion order.
+
+Inserts go to an unindexed tail that is scanned by brute force, deletes
+are tombstones; the grid is rebuilt once either grows past
+`rebuild_ratio` of the index (and at least `rebuild_min`).
+"""
+
+import numpy as np
+
+
+def _validate(vectors):
+    # NaN fails both comparisons, so check the in-range form
+    if not np.all((vectors >= 0) & (vectors <= 100)):
+        raise ValueError("Voice metrics must be within 0-100")
+    return vectors
+
+
+class VoiceMatchIndex:
+    """Exact top-k Sync_Score / contrast search over stored p/s/v/t vectors"""
+
+    def __init__(self, cell_size: int = 10, rebuild_ratio: float = 0.01, rebuild_min: int = 4096):
+        self.cell_size = cell_size
+        self.rebuild_ratio = rebuild_ratio
+        self.rebuild_min = rebuild_min
+        self.grid = 100 // cell_size + 1
+
+        # Per slot (insertion order); deleted slots stay until the next rebuild
+        self._vectors = np.empty((0, 4), dtype=np.float64)
+        self._alive = np.empty(0, dtype=bool)
+        self._ids = []
+        self._slot_of = {}
+        self._size = 0
+        self._dead = 0
+
+        # Cell bounds on each axis (closed intervals, last one ends at 100)
+        lo = np.arange(self.grid) * cell_size
+        self._cell_lo = lo.astype(np.float64)
+        self._cell_hi = np.minimum(lo + cell_size, 100).astype(np.float64)
+        self._build(0)
+
+    @classmethod
+    def from_arrays(cls, ids, p, s, v, t, **kwargs):
+        ids = list(ids)
+        if len(set(ids)) != len(ids):
+            raise ValueError("Duplicate user ids")
+        index = cls(**kwargs)
+        vectors = _validate(np.column_stack([np.asarray(x, dtype=np.float64) for x in (p, s, v, t)]))
+        index._append(ids, vectors)
+        index.rebuild()
+        return index
+
+    def __len__(self):
+        return len(self._slot_of)
+
+    def __contains__(self, user_id):
+        return user_id in self._slot_of
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def insert(self, user_id, p, s, v, t):
+        """Add a user (re-inserting an existing id replaces its vector)"""
+        vector = _validate(np.array([[p, s, v, t]], dtype=np.float64))
+        if user_id in self._slot_of:
+            self.delete(user_id)
+        self._append([user_id], vector)
+        if self._size - self._indexed > max(self.rebuild_min, self.rebuild_ratio * self._indexed):
+            self.rebuild()
+
+    def delete(self, user_id):
+        slot = self._slot_of.pop(user_id)
+        self._alive[slot] = False
+        self._dead += 1
+        if slot < self._indexed:
+            self._cell_alive[self._cell_pos[slot]] -= 1
+        if self._dead > max(self.rebuild_min, self.rebuild_ratio * self._size):
+            self.rebuild()
+
+    def rebuild(self):
+        """Drop tombstones and re-grid every live user"""
+        live = np.flatnonzero(self._alive[:self._size])
+        self._vectors = self._vectors[live]
+        self._alive = np.ones(len(live), dtype=bool)
+        self._ids = [self._ids[i] for i in live]
+        self._slot_of = {user_id: slot for slot, user_id in enumerate(self._ids)}
+        self._size = len(live)
+        self._dead = 0
+        self._build(self._size)
+
+    def _append(self, ids, vectors):
+        n = self._size + len(ids)
+        if n > len(self._vectors):
+            capacity = max(n, 2 * len(self._vectors), 1024)
+            grown = np.empty((capacity, 4), dtype=np.float64)
+            grown[:self._size] = self._vectors[:self._size]
+            alive = np.zeros(capacity, dtype=bool)
+            alive[:self._size] = self._alive[:self._size]
+            self._vectors, self._alive = grown, alive
+        self._vectors[self._size:n] = vectors
+        self._alive[self._size:n] = True
+        for offset, user_id in enumerate(ids):
+            self._slot_of[user_id] = self._size + offset
+        self._ids.extend(ids)
+        self._size = n
+
+    def _build(self, n):
+        """Group slots [0, n) by grid cell"""
+        coords = np.minimum(self._vectors[:n] // self.cell_size, self.grid - 1).astype(np.int64)
+        cell_id = ((coords[:, 0] * self.grid + coords[:, 1]) * self.grid + coords[:, 2]) * self.grid + coords[:, 3]
+        self._order = np.argsort(cell_id, kind='stable')
+        cells, starts, counts = np.unique(cell_id[self._order], return_index=True, return_counts=True)
+
+        self._indexed = n
+        self._cell_start = starts
+        self._cell_count = counts
+        self._cell_alive = counts.copy()
+        # Grid coordinates of each non-empty cell, one column per metric
+        self._cell_coords = np.stack(np.unravel_index(cells, (self.grid,) * 4), axis=1)
+        self._cell_pos = np.empty(n, dtype=np.int64)
+        self._cell_pos[self._order] = np.repeat(np.arange(len(cells)), counts)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def top_sync(self, p, s, v, t, k: int = 10, exclude=None) -> list:
+        """k users with the highest Sync_Score (most similar voices)"""
+        return self._query((p, s, v, t), k, exclude, nearest=True)
+
+    def top_contrast(self, p, s, v, t, k: int = 10, exclude=None) -> list:
+        """k users with the lowest Sync_Score (most contrasting voices)"""
+        return self._query((p, s, v, t), k, exclude, nearest=False)
+
+    def matches_for(self, user_id, k: int = 10, nearest: bool = True) -> list:
+        """top_sync / top_contrast for a stored user, excluding themself"""
+        vector = self._vectors[self._slot_of[user_id]]
+        return self._query(tuple(vector), k, user_id, nearest)
+
+    def _query(self, q, k, exclude, nearest):
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        q = np.asarray(q, dtype=np.float64)
+        want = k + (exclude is not None and exclude in self._slot_of)
+        # Rank on a key where smaller is better: the L1 distance for
+        # matches, the negated distance for contrasts
+        sign = 1.0 if nearest else -1.0
+
+        # Lower bound of the key per cell: per-axis distance from q to the
+        # cell interval (nearest point for matches, farthest for contrasts)
+        below, above = self._cell_lo - q[:, None], q[:, None] - self._cell_hi
+        if nearest:
+            per_axis = np.maximum(below, 0) + np.maximum(above, 0)
+        else:
+            per_axis = -np.maximum(np.abs(below), np.abs(above))
+        coords = self._cell_coords
+        bound = (per_axis[0, coords[:, 0]] + per_axis[1, coords[:, 1]]
+                 + per_axis[2, coords[:, 2]] + per_axis[3, coords[:, 3]])
+
+        # Unindexed tail: brute force
+        tail = np.arange(self._indexed, self._size)
+        slots, key = self._keys(tail[self._alive[tail]], q, sign)
+
+        if len(bound):
+            # Grow a radius until the cells inside it hold enough users,
+            # then widen to every cell that could still beat the k-th best
+            radius = bound.min()
+            while True:
+                inside = bound <= radius
+                if self._cell_alive[inside].sum() + len(slots) >= want or inside.all():
+                    break
+                radius += self.cell_size
+            cand_slots, cand_key = self._keys(self._cell_slots(inside), q, sign)
+            if len(key) + len(cand_key) >= want:
+                kth = np.partition(np.concatenate([key, cand_key]), want - 1)[want - 1]
+                cand_slots, cand_key = self._keys(self._cell_slots(bound <= kth), q, sign)
+            slots = np.concatenate([slots, cand_slots])
+            key = np.concatenate([key, cand_key])
+
+        # Keep everything tied with the k-th best, then order by (key, slot)
+        if len(key) > want:
+            keep = key <= np.partition(key, want - 1)[want - 1]
+            slots, key = slots[keep], key[keep]
+        results = []
+        for i in np.lexsort((slots, key)):
+            user_id = self._ids[slots[i]]
+            if user_id == exclude:
+                continue
+            mean_delta = sign * key[i] / 4
+            results.append({
+                "User_ID": user_id,
+                "Sync_Score": int(100 - mean_delta),
+                "Mean_Delta": int(mean_delta),
+            })
+            if len(results) == k:
+                break
+        return results
+
+    def _cell_slots(self, mask):
+        """Live slots stored in the selected cells"""
+        starts, counts = self._cell_start[mask], self._cell_count[mask]
+        if not len(counts):
+            return np.empty(0, dtype=np.int64)
+        # Concatenated ranges [start, start + count) without a Python loop
+        offsets = np.repeat(starts - np.cumsum(counts) + counts, counts)
+        slots = self._order[offsets + np.arange(counts.sum())]
+        return slots[self._alive[slots]]
+
+    def _keys(self, slots, q, sign):
+        x = self._vectors[slots]
+        # Same summation order as _calculate_synergy (p, s, v, t)
+        dist = (np.abs(x[:, 0] - q[0]) + np.abs(x[:, 1] - q[1])
+                + np.abs(x[:, 2] - q[2]) + np.abs(x[:, 3] - q[3]))
+        return slots, sign * dist
@@ -1,5 +1,10 @@
 import math
 
+import numpy as np
+
+from acoustic_quantizer import SCORE_QUANTIZER
+from payload_cache import FrozenDict, FrozenList, PayloadCache
+
 # ==========================================
 # 1. SHARED CORE: Acoustic Quantizer
 # ==========================================
@@ -7,40 +12,34 @@ class AcousticQuantizer:
     """
     音響数値をLLMが解釈可能な「文脈タグ」に変換するクラス。
     0-100の数値を5段階の形容詞にマッピングし、レポートの表現力を底上げする。
+    境界値とラベルは acoustic_quantizer.SCORE_QUANTIZER のテーブルを共有する。
     """
 
-    @staticmethod
-    def get_pitch_tag(value):
-        if value < 20: return "Sub-bass / Gravitas (重厚)"
-        if value < 40: return "Deep / Resonant (共鳴)"
-        if value < 60: return "Baritone / Grounded (安定的)"
-        if value < 80: return "Tenor / Clear (明瞭)"
-        return "Soprano / Crystalline (透き通った)"
+    TABLES = SCORE_QUANTIZER
 
-    @staticmethod
-    def get_speed_tag(value):
-        if value < 20: return "Largo / Contemplative (熟考)"
-        if value < 40: return "Andante / Deliberate (慎重)"
-        if value < 60: return "Moderato / Conversational (会話的)"
-        if value < 80: return "Allegro / Energetic (活発)"
-        return "Presto / Urgent (性急)"
+    PITCH_LABELS = SCORE_QUANTIZER['pitch'].labels
+    SPEED_LABELS = SCORE_QUANTIZER['speed'].labels
+    VOLUME_LABELS = SCORE_QUANTIZER['volume'].labels
+    TONE_LABELS = SCORE_QUANTIZER['tone'].labels
 
-    @staticmethod
-    def get_volume_tag(value):
-        if value < 20: return "Whisper / Intimate (親密・秘密)"
-        if value < 40: return "Soft / Gentle (穏やか・配慮)"
-        if value < 60: return "Mezzo / Balanced (バランス)"
-        if value < 80: return "Forte / Projecting (発信・主張)"
-        return "Fortissimo / Commanding (威厳・支配)"
+    # (p, s, v, t) -> 読み取り専用タグ辞書 (Solo/Coupleで共有)
+    tag_cache = PayloadCache(maxsize=4096)
 
-    @staticmethod
-    def get_tone_tag(value):
-        # Tone: 低い＝ハスキー/雑味、高い＝クリア/純音
-        if value < 20: return "Husky / Textured (陰影・ハスキー)"
-        if value < 40: return "Smoky / Warm (温かみ・スモーキー)"
-        if value < 60: return "Neutral / Natural (自然的)"
-        if value < 80: return "Bright / Polished (磨かれた)"
-        return "Piercing / Pure (純粋・鋭い)"
+    @classmethod
+    def get_pitch_tag(cls, value):
+        return cls.TABLES['pitch'].tag(value)
+
+    @classmethod
+    def get_speed_tag(cls, value):
+        return cls.TABLES['speed'].tag(value)
+
+    @classmethod
+    def get_volume_tag(cls, value):
+        return cls.TABLES['volume'].tag(value)
+
+    @classmethod
+    def get_tone_tag(cls, value):
+        return cls.TABLES['tone'].tag(value)
 
     @classmethod
     def get_all_tags(cls, p, s, v, t):
@@ -51,6 +50,11 @@ class AcousticQuantizer:
             "Tone_Tag": cls.get_tone_tag(t)
         }
 
+    @classmethod
+    def shared_tags(cls, p, s, v, t):
+        """get_all_tags() のメモ化版。返り値は共有の FrozenDict (変更不可)"""
+        return cls.tag_cache.get_or_build((p, s, v, t), lambda: FrozenDict(cls.get_all_tags(p, s, v, t)))
+
 # ==========================================
 # 2. SOLO ENGINE: Voice Identity & Gap Analysis
 # ==========================================
@@ -60,6 +64,12 @@ class SoloIdentityEngine:
     「声のアーキタイプ」を特定し、ユーザー申告のMBTIとの「ギャップ」を計算する。
     """
     
+    SYSTEM_INSTRUCTION = "Focus on the discrepancy between MBTI and Voice Archetype."
+
+    # payloadはp/s/v/tとMBTIのE/I・T/Fだけで決まる (User_MBTI以外)
+    # -> 正規化キーごとに読み取り専用の本体をLRUで共有する
+    cache = PayloadCache(maxsize=4096)
+
     def __init__(self, p, s, v, t, mbti_type):
         self.p = p
         self.s = s
@@ -79,34 +89,51 @@ class SoloIdentityEngine:
         
         return projection, texture
 
+    # 4象限マトリクス: index = (proj < 50) * 2 + (text < 50)
+    ARCHETYPES = (
+        {
+            "Label": "The Lightning Rod (雷撃の扇動者)",
+            "Quote": "Words like electric shocks. Impossible to ignore.",
+            "Vibe": "High Voltage & Sharp"
+        },
+        {
+            "Label": "The Thunder King (轟く覇者)",
+            "Quote": "A voice that shakes the floorboards. Pure dominance.",
+            "Vibe": "High Voltage & Heavy"
+        },
+        {
+            "Label": "The Ice Sculptor (氷の彫刻家)",
+            "Quote": "Precision over volume. Every syllable cuts deep.",
+            "Vibe": "Low Voltage & Sharp"
+        },
+        {
+            "Label": "The Midnight FM (深夜のDJ)",
+            "Quote": "Velvet frequencies. You bypass ears and speak to the soul.",
+            "Vibe": "Low Voltage & Heavy"
+        },
+    )
+
+    # Gap Diagnosis: index 0 = gap > 30, 1 = gap < -30, 2 = aligned
+    PROJECTION_GAP_TAGS = (
+        "Over-Amplified (Masking Introversion)",
+        "Under-Projecting (Holding Back)",
+        "Authentic Projection (Aligned)",
+    )
+    TEXTURE_GAP_TAGS = (
+        "Cooler than Personality (Logical Mask)",
+        "Warmer than Personality (Social Mask)",
+        "Authentic Texture (Aligned)",
+    )
+
+    @staticmethod
+    def _gap_index(gap):
+        if gap > 30: return 0
+        if gap < -30: return 1
+        return 2
+
     def _determine_archetype(self, proj, text):
         # 4象限マトリクスによる分類
-        if proj >= 50:
-            if text >= 50:
-                return {
-                    "Label": "The Lightning Rod (雷撃の扇動者)",
-                    "Quote": "Words like electric shocks. Impossible to ignore.",
-                    "Vibe": "High Voltage & Sharp"
-                }
-            else:
-                return {
-                    "Label": "The Thunder King (轟く覇者)",
-                    "Quote": "A voice that shakes the floorboards. Pure dominance.",
-                    "Vibe": "High Voltage & Heavy"
-                }
-        else:
-            if text >= 50:
-                return {
-                    "Label": "The Ice Sculptor (氷の彫刻家)",
-                    "Quote": "Precision over volume. Every syllable cuts deep.",
-                    "Vibe": "Low Voltage & Sharp"
-                }
-            else:
-                return {
-                    "Label": "The Midnight FM (深夜のDJ)",
-                    "Quote": "Velvet frequencies. You bypass ears and speak to the soul.",
-                    "Vibe": "Low Voltage & Heavy"
-                }
+        return self.ARCHETYPES[(proj < 50) * 2 + (text < 50)]
 
     def _analyze_gap(self, proj, text):
         # MBTIから期待される音声値を推論
@@ -118,16 +145,11 @@ class SoloIdentityEngine:
         proj_gap = proj - expected_proj
         text_gap = text - expected_text
         
-        tags = []
-        
         # Gap Diagnosis logic
-        if proj_gap > 30: tags.append("Over-Amplified (Masking Introversion)")
-        elif proj_gap < -30: tags.append("Under-Projecting (Holding Back)")
-        else: tags.append("Authentic Projection (Aligned)")
-
-        if text_gap > 30: tags.append("Cooler than Personality (Logical Mask)")
-        elif text_gap < -30: tags.append("Warmer than Personality (Social Mask)")
-        else: tags.append("Authentic Texture (Aligned)")
+        tags = [
+            self.PROJECTION_GAP_TAGS[self._gap_index(proj_gap)],
+            self.TEXTURE_GAP_TAGS[self._gap_index(text_gap)],
+        ]
 
         return {
             "Projection_Delta": int(proj_gap),
@@ -135,24 +157,130 @@ class SoloIdentityEngine:
             "Diagnosis_Tags": tags
         }
 
-    def generate_payload(self):
+    def _payload_key(self):
+        return (self.p, self.s, self.v, self.t, 'E' in self.mbti, 'T' in self.mbti)
+
+    def _build_payload_body(self):
+        # 最初から読み取り専用で組み立てる (freeze() のコピーを避ける)
         proj, text = self._calculate_axes()
         archetype = self._determine_archetype(proj, text)
         gap_analysis = self._analyze_gap(proj, text)
-        quantized_metrics = AcousticQuantizer.get_all_tags(self.p, self.s, self.v, self.t)
+
+        return FrozenDict({
+            "Voice_Archetype": FrozenDict({
+                "Label": archetype["Label"],
+                "Quote": archetype["Quote"],
+                "Stats": FrozenDict({"Projection": int(proj), "Texture": int(text)})
+            }),
+            "Gap_Analysis": FrozenDict({
+                **gap_analysis,
+                "Diagnosis_Tags": FrozenList(gap_analysis["Diagnosis_Tags"])
+            }),
+            "Raw_Metrics_Tags": AcousticQuantizer.shared_tags(self.p, self.s, self.v, self.t),
+        })
+
+    def generate_payload(self):
+        # 外側のdictだけ毎回作り、中身は共有 (FrozenDict/FrozenList)
+        body = self.cache.get_or_build(self._payload_key(), self._build_payload_body)
 
         return {
             "User_MBTI": self.mbti,
+            **body,
+            "System_Instruction": self.SYSTEM_INSTRUCTION
+        }
+
+    @classmethod
+    def batch(cls, p, s, v, t, mbti):
+        """
+        generate_payload() の列指向・ベクトル化版。
+        p/s/v/t は数値配列、mbti は文字列配列 (同じ長さ)。
+        結果は SoloBatchResult (row(i) は generate_payload() と同一の dict)。
+        """
+        p, s, v, t = (np.asarray(x, dtype=np.float64) for x in (p, s, v, t))
+
+        # MBTIの種類は少ないので、ユニーク値ごとに元の文字列判定を行って展開する
+        unique_mbti, inverse = np.unique(np.asarray(mbti, dtype=str), return_inverse=True)
+        inverse = inverse.reshape(-1)
+        upper = [m.upper() for m in unique_mbti]
+        mbti_upper = np.array(upper, dtype=object)[inverse]
+        is_e = np.array(['E' in m for m in upper], dtype=bool)[inverse]
+        is_t = np.array(['T' in m for m in upper], dtype=bool)[inverse]
+
+        proj = (v + s) / 2
+        text = (p + t) / 2
+        proj_gap = proj - np.where(is_e, 80, 30)
+        text_gap = text - np.where(is_t, 80, 30)
+
+        def gap_index(gap):
+            return np.where(gap > 30, 0, np.where(gap < -30, 1, 2)).astype(np.int8)
+
+        # int() と同じくゼロ方向への切り捨て
+        columns = {
+            "User_MBTI": mbti_upper,
+            "Projection": proj,
+            "Texture": text,
+            "Projection_Stat": proj.astype(np.int64),
+            "Texture_Stat": text.astype(np.int64),
+            "Archetype_Index": ((proj < 50) * 2 + (text < 50)).astype(np.int8),
+            "Projection_Delta": proj_gap.astype(np.int64),
+            "Texture_Delta": text_gap.astype(np.int64),
+            "Projection_Gap_Index": gap_index(proj_gap),
+            "Texture_Gap_Index": gap_index(text_gap),
+            "Pitch_Tag_Index": AcousticQuantizer.TABLES['pitch'].indices(p),
+            "Speed_Tag_Index": AcousticQuantizer.TABLES['speed'].indices(s),
+            "Volume_Tag_Index": AcousticQuantizer.TABLES['volume'].indices(v),
+            "Tone_Tag_Index": AcousticQuantizer.TABLES['tone'].indices(t),
+        }
+        return SoloBatchResult(columns)
+
+
+class SoloBatchResult:
+    """
+    SoloIdentityEngine.batch() の結果。列はNumPy配列で、ラベル類は
+    クラス定数テーブルへのインデックスとして保持する。
+    row(i) / rows() は必要になった行だけ payload dict を組み立てる。
+    """
+
+    def __init__(self, columns):
+        self.columns = columns
+
+    def __len__(self):
+        return len(self.columns["User_MBTI"])
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def row(self, i):
+        c = self.columns
+        archetype = SoloIdentityEngine.ARCHETYPES[c["Archetype_Index"][i]]
+        return {
+            "User_MBTI": c["User_MBTI"][i],
             "Voice_Archetype": {
                 "Label": archetype["Label"],
                 "Quote": archetype["Quote"],
-                "Stats": {"Projection": int(proj), "Texture": int(text)}
+                "Stats": {"Projection": int(c["Projection_Stat"][i]), "Texture": int(c["Texture_Stat"][i])}
+            },
+            "Gap_Analysis": {
+                "Projection_Delta": int(c["Projection_Delta"][i]),
+                "Texture_Delta": int(c["Texture_Delta"][i]),
+                "Diagnosis_Tags": [
+                    SoloIdentityEngine.PROJECTION_GAP_TAGS[c["Projection_Gap_Index"][i]],
+                    SoloIdentityEngine.TEXTURE_GAP_TAGS[c["Texture_Gap_Index"][i]],
+                ]
+            },
+            "Raw_Metrics_Tags": {
+                "Pitch_Tag": AcousticQuantizer.PITCH_LABELS[c["Pitch_Tag_Index"][i]],
+                "Speed_Tag": AcousticQuantizer.SPEED_LABELS[c["Speed_Tag_Index"][i]],
+                "Volume_Tag": AcousticQuantizer.VOLUME_LABELS[c["Volume_Tag_Index"][i]],
+                "Tone_Tag": AcousticQuantizer.TONE_LABELS[c["Tone_Tag_Index"][i]]
             },
-            "Gap_Analysis": gap_analysis,
-            "Raw_Metrics_Tags": quantized_metrics,
-            "System_Instruction": "Focus on the discrepancy between MBTI and Voice Archetype."
+            "System_Instruction": SoloIdentityEngine.SYSTEM_INSTRUCTION
         }
 
+    def rows(self):
+        for i in range(len(self)):
+            yield self.row(i)
+
 # ==========================================
 # 3. COUPLE ENGINE: Resonance & SCM Analysis
 # ==========================================
@@ -171,12 +299,20 @@ class CoupleResonanceEngine:
         "student": (50, 60), "sales": (70, 80), "other": (50, 50)
     }
 
+    # (job, p, s, v, t) -> 読み取り専用SCMプロファイル
+    scm_cache = PayloadCache(maxsize=4096)
+
     def __init__(self, user_a_data, user_b_data):
         # user_data expects: {'name': str, 'job': str, 'accent': str, 'p': int, 's': int, 'v': int, 't': int}
         self.ua = user_a_data
         self.ub = user_b_data
 
     def _calculate_scm(self, job, p, s, v, t):
+        return self.scm_cache.get_or_build(
+            (job.lower(), p, s, v, t), lambda: FrozenDict(self._build_scm(job, p, s, v, t))
+        )
+
+    def _build_scm(self, job, p, s, v, t):
         # 1. 職業ベース値
         base_c, base_w = self.JOB_DB.get(job.lower(), (50, 50))
         
@@ -232,11 +368,11 @@ class CoupleResonanceEngine:
     def generate_payload(self):
         # Process User A
         scm_a = self._calculate_scm(self.ua['job'], self.ua['p'], self.ua['s'], self.ua['v'], self.ua['t'])
-        tags_a = AcousticQuantizer.get_all_tags(self.ua['p'], self.ua['s'], self.ua['v'], self.ua['t'])
+        tags_a = AcousticQuantizer.shared_tags(self.ua['p'], self.ua['s'], self.ua['v'], self.ua['t'])
         
         # Process User B
         scm_b = self._calculate_scm(self.ub['job'], self.ub['p'], self.ub['s'], self.ub['v'], self.ub['t'])
-        tags_b = AcousticQuantizer.get_all_tags(self.ub['p'], self.ub['s'], self.ub['v'], self.ub['t'])
+        tags_b = AcousticQuantizer.shared_tags(self.ub['p'], self.ub['s'], self.ub['v'], self.ub['t'])
 
         # Synergy
         synergy = self._calculate_synergy()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Analysis Sample Rate Speed / Drift Report
+Runs process_couple_audio on the same recordings at several analysis rates
+and reports wall time plus the drift of every metric against DEFAULT_SR.
+
+Dependencies:
+    pip install librosa numpy scipy
+
+Usage:
+    python analysis_sr_report.py input.wav [more.wav ...] --rates 44100 22050 16000
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import time
+
+from couple_processor import DEFAULT_SR, PITCH_ENGINES, process_couple_audio
+
+USER_INFO_A = {'name': 'User A', 'job': 'other', 'accent': 'unknown', 'age': ''}
+USER_INFO_B = {'name': 'User B', 'job': 'other', 'accent': 'unknown', 'age': ''}
+
+
+def flatten_result(result) -> dict:
+    """Numeric and tag fields keyed by dotted path"""
+    flat = {'matrix_score': result.matrix_score}
+    for side, user in (('user_a', result.user_a), ('user_b', result.user_b)):
+        for key, value in user['metrics'].items():
+            flat[f'{side}.{key}'] = value
+        for key, value in user['tags'].items():
+            flat[f'{side}.{key}'] = value
+        flat[f'{side}.stress_volume'] = user['stress_volume']
+    for key, value in result.together.items():
+        flat[f'together.{key}'] = value
+    return flat
+
+
+def run_at_rate(path: str, rate: int, pitch_engine: str) -> tuple:
+    # Silence the per-stage progress prints
+    with contextlib.redirect_stdout(io.StringIO()):
+        t0 = time.perf_counter()
+        result = process_couple_audio(
+            path, USER_INFO_A, USER_INFO_B,
+            pitch_engine=pitch_engine,
+            analysis_sr=rate,
+        )
+        elapsed = time.perf_counter() - t0
+    return flatten_result(result), elapsed
+
+
+def drift(reference: dict, candidate: dict) -> dict:
+    """Absolute numeric drift, and whether categorical fields changed"""
+    out = {}
+    for key, ref in reference.items():
+        value = candidate[key]
+        if isinstance(ref, str):
+            out[key] = 'same' if value == ref else f'{ref} -> {value}'
+        else:
+            out[key] = abs(value - ref)
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure speed and metric drift per analysis sample rate')
+    parser.add_argument('inputs', nargs='+', help='Audio files to analyze')
+    parser.add_argument('--rates', nargs='+', type=int, default=[DEFAULT_SR, 22050, 16000],
+                        help='Analysis rates to compare (DEFAULT_SR is always the reference)')
+    parser.add_argument('--pitch-engine', choices=PITCH_ENGINES, default='pyin', help='Pitch tracker')
+    parser.add_argument('--json', help='Optional path for the full JSON report')
+
+    args = parser.parse_args()
+    rates = [DEFAULT_SR] + [r for r in args.rates if r != DEFAULT_SR]
+
+    report = {}
+    for path in args.inputs:
+        # Untimed warm-up so JIT compilation is not billed to the reference
+        run_at_rate(path, rates[-1], args.pitch_engine)
+
+        runs = {rate: run_at_rate(path, rate, args.pitch_engine) for rate in rates}
+        reference, ref_seconds = runs[DEFAULT_SR]
+
+        print(f"\n=== {path} ===")
+        report[path] = {}
+        for rate, (flat, seconds) in runs.items():
+            rate_drift = drift(reference, flat)
+            report[path][rate] = {'seconds': seconds, 'speedup': ref_seconds / seconds, 'drift': rate_drift}
+            print(f"{rate:>6} Hz: {seconds:6.2f}s (x{ref_seconds / seconds:.2f})")
+            if rate == DEFAULT_SR:
+                continue
+            for key, value in rate_drift.items():
+                if isinstance(value, str):
+                    if value != 'same':
+                        print(f"         {key}: {value}")
+                else:
+                    print(f"         {key}: {value:.4g}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\nReport saved to: {args.json}")
+
+
+if __name__ == '__main__':
+    main()
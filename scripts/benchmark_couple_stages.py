@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Couple Processor Stage Benchmark
+Synthesizes a deterministic 36 s couple recording laid out like SEGMENTS
+(harmonic voices at known f0 with syllable gaps, silence, a noise burst and
+a unison mix), then times every process_couple_audio stage separately and
+records peak memory. Results can be saved as a JSON baseline and later runs
+checked against it with a regression threshold (exit status 1 on regression).
+
+Dependencies:
+    pip install librosa numpy scipy
+
+Usage:
+    python benchmark_couple_stages.py --output baseline.json
+    python benchmark_couple_stages.py --baseline baseline.json --threshold 0.2
+    python benchmark_couple_stages.py --pitch-engine yin --sr 22050 --repeat 5
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict
+
+import numpy as np
+
+from couple_processor import (
+    DEFAULT_SR, PITCH_ENGINES, SEGMENTS, ANALYSIS_END, USER_SEGMENTS,
+    load_audio, extract_audio_segment, extract_features, analyze_segment,
+    analyze_unison, average_metrics, build_result, calculate_matrix_score,
+    generate_llm_prompt, librosa, sf,
+)
+
+# Synthetic speakers: f0 (Hz), syllables per second, peak amplitude
+VOICE_A = {'f0': 110.0, 'rate': 4.0, 'amp': 0.30}
+VOICE_B = {'f0': 220.0, 'rate': 3.0, 'amp': 0.20}
+
+# Under stress both speak a little higher, faster and louder over room noise
+STRESS = {'f0': 1.12, 'rate': 1.25, 'amp': 1.3}
+NOISE_FLOOR = 0.003
+STRESS_NOISE = 0.02
+
+USER_INFO_A = {'name': 'Bench A', 'job': 'engineer', 'accent': 'unknown', 'age': ''}
+USER_INFO_B = {'name': 'Bench B', 'job': 'designer', 'accent': 'unknown', 'age': ''}
+
+
+def voice(sr: int, duration: float, f0: float, rate: float, amp: float,
+          rng: np.random.Generator) -> np.ndarray:
+    """Harmonic voice at `f0` (slight vibrato), gated into syllables with silent gaps"""
+    t = np.arange(int(duration * sr)) / sr
+    vibrato = 1 + 0.01 * np.sin(2 * np.pi * 5 * t)
+    phase = 2 * np.pi * np.cumsum(f0 * vibrato) / sr
+    y = sum(np.sin(h * phase + rng.uniform(0, 2 * np.pi)) / h for h in range(1, 9))
+
+    # Each syllable is a raised-cosine burst over 70% of its period
+    period = 1 / rate
+    pos = (t % period) / (0.7 * period)
+    envelope = np.where(pos < 1, 0.5 - 0.5 * np.cos(2 * np.pi * np.minimum(pos, 1)), 0)
+    return amp * envelope * y / 2
+
+
+def synthesize(sr: int, seed: int = 0) -> tuple:
+    """(recording, expected f0 per segment) for a SEGMENTS-shaped couple session"""
+    rng = np.random.default_rng(seed)
+    y = NOISE_FLOOR * rng.standard_normal(int(ANALYSIS_END * sr))
+    stress_a = {key: VOICE_A[key] * STRESS[key] for key in VOICE_A}
+    stress_b = {key: VOICE_B[key] * STRESS[key] for key in VOICE_B}
+    expected = {}
+
+    def place(name, *parts, noise=0.0):
+        start, end = SEGMENTS[name]
+        segment = sum(voice(sr, end - start, rng=rng, **part) for part in parts)
+        segment = segment + noise * rng.standard_normal(len(segment))
+        y[int(start * sr):int(start * sr) + len(segment)] += segment
+
+    place('calibration_a', VOICE_A)
+    expected['calibration_a'] = VOICE_A['f0']
+    place('calibration_b', VOICE_B)
+    expected['calibration_b'] = VOICE_B['f0']
+    place('unison', {**VOICE_A, 'amp': VOICE_A['amp'] / 2}, {**VOICE_B, 'amp': VOICE_B['amp'] / 2})
+    expected['unison'] = None
+    place('stress_a', stress_a, noise=STRESS_NOISE)
+    expected['stress_a'] = stress_a['f0']
+    place('stress_b', stress_b, noise=STRESS_NOISE)
+    expected['stress_b'] = stress_b['f0']
+
+    # Alternating: 1.5 s turns separated by 0.5 s of silence, ending in a noise burst
+    start, end = SEGMENTS['alternating']
+    turn = int(1.5 * sr)
+    cursor = int(start * sr)
+    for speaker in (VOICE_A, VOICE_B, VOICE_A):
+        y[cursor:cursor + turn] += voice(sr, 1.5, rng=rng, **speaker)
+        cursor += turn + int(0.5 * sr)
+    burst = int(end * sr) - cursor
+    y[cursor:cursor + burst] += 0.1 * rng.standard_normal(burst)
+    expected['alternating'] = None
+
+    return np.clip(y, -1, 1).astype(np.float32), expected
+
+
+def run_pipeline(path: str, sr: int, pitch_engine: str, clock) -> tuple:
+    """process_couple_audio's default (per-segment pitch, one worker) path,
+    one `clock(stage)` context per stage; returns (result, segment metrics)"""
+    with clock('load'):
+        y, sr = load_audio(path, sr=sr)
+
+    with clock('extract_audio_segment'):
+        segments = {name: extract_audio_segment(y, sr, *SEGMENTS[name]) for name in SEGMENTS}
+
+    with clock('extract_features'):
+        features = extract_features(extract_audio_segment(y, sr, 0, ANALYSIS_END), sr)
+
+    segment_metrics = {}
+    for name in USER_SEGMENTS:
+        segment_features = features.slice(*SEGMENTS[name])
+        with clock(f'analyze_segment:{name}'):
+            segment_metrics[name] = analyze_segment(segments[name], sr, segment_features, pitch_engine)
+
+    metrics_a = average_metrics(segment_metrics['calibration_a'], segment_metrics['stress_a'])
+    metrics_b = average_metrics(segment_metrics['calibration_b'], segment_metrics['stress_b'])
+    unison_features = features.slice(*SEGMENTS['unison'])
+    with clock('analyze_unison'):
+        together = analyze_unison(segments['unison'], sr, metrics_a, metrics_b,
+                                  unison_features, pitch_engine=pitch_engine)
+
+    with clock('build_result'):
+        result = build_result(USER_INFO_A, USER_INFO_B, segment_metrics, together)
+
+    with clock('calculate_matrix_score'):
+        calculate_matrix_score(result.user_a, result.user_b, together)
+
+    with clock('generate_llm_prompt'):
+        generate_llm_prompt(result)
+
+    return result, segment_metrics
+
+
+class StageClock:
+    """Collects wall time per stage; with trace=True also tracemalloc peaks"""
+
+    def __init__(self, trace: bool = False):
+        self.trace = trace
+        self.seconds = {}
+        self.peak_bytes = {}
+        self._stage = None
+
+    def __call__(self, stage: str):
+        self._stage = stage
+        return self
+
+    def __enter__(self):
+        if self.trace:
+            tracemalloc.reset_peak()
+        self._t0 = time.perf_counter()
+
+    def __exit__(self, *exc):
+        self.seconds[self._stage] = time.perf_counter() - self._t0
+        if self.trace:
+            self.peak_bytes[self._stage] = tracemalloc.get_traced_memory()[1]
+
+
+def benchmark(path: str, sr: int, pitch_engine: str, repeat: int) -> dict:
+    # Untimed warm-up: numba JIT and librosa caches are not billed to run 1
+    run_pipeline(path, sr, pitch_engine, StageClock())
+
+    runs = []
+    for _ in range(repeat):
+        clock = StageClock()
+        result, segment_metrics = run_pipeline(path, sr, pitch_engine, clock)
+        runs.append(clock.seconds)
+
+    # Separate traced pass: tracemalloc slows numpy-heavy code down too
+    # much to share a run with the timings
+    tracemalloc.start()
+    traced = StageClock(trace=True)
+    run_pipeline(path, sr, pitch_engine, traced)
+    tracemalloc.stop()
+
+    stages = {}
+    for stage in runs[0]:
+        samples = [run[stage] for run in runs]
+        stages[stage] = {
+            'median_seconds': float(np.median(samples)),
+            'min_seconds': float(np.min(samples)),
+            'peak_alloc_mb': traced.peak_bytes[stage] / 2**20,
+        }
+    totals = [sum(run.values()) for run in runs]
+    stages['total'] = {
+        'median_seconds': float(np.median(totals)),
+        'min_seconds': float(np.min(totals)),
+        'peak_alloc_mb': max(traced.peak_bytes.values()) / 2**20,
+    }
+
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_rss_mb = maxrss / 2**20 if sys.platform == 'darwin' else maxrss / 2**10
+
+    return {
+        'stages': stages,
+        'peak_rss_mb': peak_rss_mb,
+        'metrics': {name: asdict(metrics) for name, metrics in segment_metrics.items()},
+        'matrix_score': result.matrix_score,
+    }
+
+
+def compare(report: dict, baseline: dict, threshold: float, min_delta: float) -> list:
+    """Stages whose median time or peak allocation grew past the threshold"""
+    regressions = []
+    print(f"\n{'stage':<30} {'ms':>9} {'base ms':>9} {'change':>8} {'MB':>7} {'base MB':>8}")
+    for stage, now in report['stages'].items():
+        base = baseline['stages'].get(stage)
+        if base is None:
+            print(f"{stage:<30} {now['median_seconds'] * 1000:>9.1f} {'-':>9}")
+            continue
+        change = now['median_seconds'] / base['median_seconds'] - 1 if base['median_seconds'] > 0 else 0.0
+        slower = change > threshold and now['median_seconds'] - base['median_seconds'] > min_delta
+        bigger = now['peak_alloc_mb'] > base['peak_alloc_mb'] * (1 + threshold) + 1
+        flag = ' REGRESSION' if slower or bigger else ''
+        print(f"{stage:<30} {now['median_seconds'] * 1000:>9.1f} {base['median_seconds'] * 1000:>9.1f} "
+              f"{change:>+8.0%} {now['peak_alloc_mb']:>7.1f} {base['peak_alloc_mb']:>8.1f}{flag}")
+        if slower:
+            regressions.append(f"{stage}: {change:+.0%} time")
+        if bigger:
+            regressions.append(f"{stage}: {now['peak_alloc_mb']:.1f} MB peak vs {base['peak_alloc_mb']:.1f} MB")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time each couple_processor stage on a synthetic recording')
+    parser.add_argument('--sr', type=int, default=DEFAULT_SR, help='Analysis sample rate')
+    parser.add_argument('--pitch-engine', choices=PITCH_ENGINES, default='pyin', help='Pitch tracker to time')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per stage (median is reported)')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for the synthetic recording')
+    parser.add_argument('--output', help='Write the results as JSON (use as a future --baseline)')
+    parser.add_argument('--baseline', help='Baseline JSON to check for regressions')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='Allowed relative slowdown / peak memory growth per stage')
+    parser.add_argument('--min-delta-ms', type=float, default=5.0,
+                        help='Ignore slowdowns smaller than this (timer noise on tiny stages)')
+
+    args = parser.parse_args()
+    y, expected = synthesize(DEFAULT_SR, args.seed)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'couple.wav')
+        sf.write(path, y, DEFAULT_SR, subtype='PCM_16')
+        report = benchmark(path, args.sr, args.pitch_engine, args.repeat)
+
+    report['config'] = {
+        'sr': args.sr,
+        'pitch_engine': args.pitch_engine,
+        'repeat': args.repeat,
+        'seed': args.seed,
+        'duration': ANALYSIS_END,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'librosa': librosa.__version__,
+        'machine': platform.machine(),
+    }
+    report['expected_f0'] = expected
+
+    print(f"Synthetic {ANALYSIS_END} s recording, sr={args.sr}, engine={args.pitch_engine}, "
+          f"{args.repeat} run(s), librosa {librosa.__version__}")
+    print(f"{'stage':<30} {'median ms':>10} {'min ms':>9} {'peak MB':>8}")
+    for stage, row in report['stages'].items():
+        print(f"{stage:<30} {row['median_seconds'] * 1000:>10.1f} {row['min_seconds'] * 1000:>9.1f} "
+              f"{row['peak_alloc_mb']:>8.1f}")
+    print(f"Peak RSS: {report['peak_rss_mb']:.0f} MB, Matrix Score: {report['matrix_score']}/100")
+    for name in USER_SEGMENTS:
+        print(f"  {name:<14} pitch {report['metrics'][name]['pitch']:6.1f} Hz (synthesized {expected[name]:.1f} Hz)")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults saved to: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        changed = [key for key in ('sr', 'pitch_engine', 'duration', 'librosa', 'numpy')
+                   if baseline.get('config', {}).get(key) != report['config'][key]]
+        if changed:
+            print(f"Note: baseline differs in {', '.join(changed)}")
+        regressions = compare(report, baseline, args.threshold, args.min_delta_ms / 1000)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"\nNo regressions over {args.threshold:.0%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -5,26 +5,68 @@ Analyzes couple recordings with hybrid timing-based segmentation.
 
 Dependencies:
     pip install librosa numpy scipy
+    pip install av   # optional: in-process WebM/Opus decoding (see audio_decoder.py)
 
 Usage:
     python couple_processor.py input.wav --output results.json
+    python couple_processor.py input.wav --pitch-engine yin   # fast tier
+    python couple_processor.py input.wav --vad   # pitch only where voice activity is detected
+    python couple_processor.py - < upload.webm   # recording bytes on stdin, no temp file
+    python couple_processor.py batch manifest.csv --output results.jsonl --jobs 8
+    python couple_processor.py serve --socket /tmp/couple.sock   # warm worker
+    ffmpeg -i rec.webm -f f32le -ac 1 -ar 16000 - | python couple_processor.py stream - --analysis-sr 16000
+    python couple_processor.py input.wav --population population.json --quantizer percentile
+    python couple_processor.py input.wav --profile couple.prof --trace-memory 10
+    python couple_processor.py batch manifest.csv --cache /var/cache/couple --cache-max-mb 1024
+    python couple_processor.py batch manifest.csv --feature-dir features/   # then, after tuning:
+    python couple_processor.py rescore features/*.npz --output rescored.jsonl
+    python couple_processor.py prompt couple_result.json --prompt-style compact
+    python couple_processor.py prompt results.jsonl --id 42 --compare   # bytes / tokens per style
+    python couple_processor.py batch manifest.csv --export results_store/   # or, for existing results:
+    python couple_processor.py export results_store/ results/*.json results.jsonl --compact
 """
 
 import argparse
+import base64
+import contextvars
+import cProfile
+import csv
+import itertools
 import json
+import logging
+import os
+import pstats
+import re
+import socketserver
+import sys
+import time
+import tracemalloc
 import numpy as np
-from dataclasses import dataclass, asdict
-from typing import Optional, Tuple, List
+from functools import partial
+from concurrent.futures import (
+    Executor, ProcessPoolExecutor, ThreadPoolExecutor,
+    FIRST_COMPLETED, as_completed, wait,
+)
+from contextlib import contextmanager, nullcontext, redirect_stdout
+from dataclasses import dataclass, asdict, replace
+from typing import Iterator, Optional, Tuple, List
 import warnings
 warnings.filterwarnings('ignore')
 
 try:
     import librosa
-    import librosa.display
+    import soundfile as sf
 except ImportError:
     print("Please install librosa: pip install librosa")
     exit(1)
 
+# Tag tables are shared with the solo / couple payload engines in python_service/
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'python_service'))
+from acoustic_quantizer import COUPLE_QUANTIZER, percentile_quantizer
+from audio_decoder import decode_audio
+from population_sketch import PopulationSketches
+from result_cache import ResultCache, cache_key, content_hash
+
 
 # Audio segment definitions (in seconds)
 SEGMENTS = {
@@ -36,6 +78,32 @@ SEGMENTS = {
     'alternating': (28, 36),
 }
 
+# Everything past the last segment boundary is ignored by the analysis
+ANALYSIS_END = max(end for _, end in SEGMENTS.values())
+
+# Frame parameters shared by every spectral feature (librosa defaults),
+# defined at the reference rate and scaled to keep the same frame duration
+DEFAULT_SR = 44100
+N_FFT = 2048
+HOP_LENGTH = 512
+
+# Tone tags normalize the spectral centroid over 1000-4000 Hz, so the
+# analysis rate must keep that band below Nyquist
+TONE_MAX_HZ = 4000
+MIN_ANALYSIS_SR = 2 * TONE_MAX_HZ
+
+# Pitch search range (Hz)
+PITCH_FMIN = 50
+PITCH_FMAX = 500
+
+# Part of every result cache key: bump whenever a change to the analysis or
+# scoring alters results, so stale cached results are not served
+ANALYSIS_VERSION = 'couple-2'
+
+# Timing spans are logged here as one JSON object per line
+log = logging.getLogger('couple_processor')
+LOG_LEVELS = ('DEBUG', 'INFO', 'WARNING', 'ERROR')
+
 
 @dataclass
 class AcousticMetrics:
@@ -67,6 +135,50 @@ class TogetherMetrics:
     blend_quality: str        # Interpretation
 
 
+def frame_params(sr: int) -> Tuple[int, int]:
+    """(n_fft, hop_length) spanning the same time as N_FFT/HOP_LENGTH at DEFAULT_SR
+    
+    Keeping frame duration fixed keeps per-frame statistics and the
+    frame-based onset peak picking comparable across analysis rates.
+    """
+    if sr == DEFAULT_SR:
+        return N_FFT, HOP_LENGTH
+    hop_length = max(1, int(round(HOP_LENGTH * sr / DEFAULT_SR)))
+    return hop_length * (N_FFT // HOP_LENGTH), hop_length
+
+
+@dataclass
+class FrameFeatures:
+    """Frame-level features computed once and sliced per segment"""
+    sr: int
+    hop_length: int
+    rms: np.ndarray        # RMS energy per frame
+    centroid: np.ndarray   # Spectral centroid per frame (Hz)
+    onset_env: np.ndarray  # Onset strength envelope per frame
+    f0: Optional[np.ndarray] = None           # Hz per frame, NaN when unvoiced
+    voiced_flag: Optional[np.ndarray] = None  # bool per frame
+    voiced_prob: Optional[np.ndarray] = None  # 0-1 per frame
+    voice_activity: Optional[np.ndarray] = None  # bool per frame (detect_voice_activity)
+
+    def slice(self, start: float, end: float) -> 'FrameFeatures':
+        """Return a view of the frames covering [start, end) seconds"""
+        first = int(librosa.time_to_frames(start, sr=self.sr, hop_length=self.hop_length))
+        last = int(librosa.time_to_frames(end, sr=self.sr, hop_length=self.hop_length))
+        frames = slice(first, last)
+        take = lambda values: values[frames] if values is not None else None
+        return FrameFeatures(
+            sr=self.sr,
+            hop_length=self.hop_length,
+            rms=self.rms[frames],
+            centroid=self.centroid[frames],
+            onset_env=self.onset_env[frames],
+            f0=take(self.f0),
+            voiced_flag=take(self.voiced_flag),
+            voiced_prob=take(self.voiced_prob),
+            voice_activity=take(self.voice_activity),
+        )
+
+
 @dataclass
 class CoupleAnalysisResult:
     """Complete analysis result"""
@@ -75,57 +187,139 @@ class CoupleAnalysisResult:
     together: dict
     delta: dict
     matrix_score: int
+    timings: Optional[dict] = None  # Seconds per span (process_couple_audio)
+    cache: Optional[str] = None     # 'hit' / 'miss' when run with a ResultCache
+
+
+class Timings:
+    """Wall-clock seconds per named span, in the order spans are opened
+    
+    Spans nest by name: a span opened inside 'segment.stress_a' is recorded
+    as 'segment.stress_a.pitch'. Repeated spans accumulate.
+    """
+    
+    def __init__(self):
+        self.spans = {}
+    
+    def add(self, name: str, seconds: float):
+        self.spans[name] = self.spans.get(name, 0.0) + seconds
+    
+    def merge(self, spans: dict):
+        for name, seconds in spans.items():
+            self.add(name, seconds)
+    
+    @contextmanager
+    def activate(self):
+        """Record span() calls made in this context (thread / task)"""
+        token = _current_span.set((self, ''))
+        try:
+            yield self
+        finally:
+            _current_span.reset(token)
+    
+    def as_dict(self) -> dict:
+        return {name: round(seconds, 6) for name, seconds in self.spans.items()}
+    
+    def log(self, **context):
+        for name, seconds in self.spans.items():
+            log.info(json.dumps({'event': 'span', **context, 'span': name, 'seconds': round(seconds, 6)},
+                                ensure_ascii=False))
+
+
+# (Timings, enclosing span name) of the running analysis, if any. Executor
+# workers do not inherit it; they report through _run_timed instead
+_current_span = contextvars.ContextVar('couple_span', default=None)
+
+
+def _span_name(name: str) -> str:
+    current = _current_span.get()
+    return f"{current[1]}.{name}" if current and current[1] else name
+
+
+@contextmanager
+def span(name: str):
+    """Time the enclosed block into the active Timings (no-op without one)"""
+    current = _current_span.get()
+    if current is None:
+        yield
+        return
+    timings, parent = current
+    full_name = f"{parent}.{name}" if parent else name
+    # Registered on entry so a span is listed before its children
+    timings.add(full_name, 0.0)
+    token = _current_span.set((timings, full_name))
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        _current_span.reset(token)
+        timings.add(full_name, time.perf_counter() - t0)
+
+
+def _collect_timed(future):
+    """Result of a _run_timed future, merging its spans into the active Timings"""
+    result, spans = future.result()
+    current = _current_span.get()
+    if current is not None:
+        current[0].merge(spans)
+    return result
+
+
+def _run_timed(name: str, fn, *args):
+    """fn(*args) in an executor worker, timed as span `name` (a full name)
+    
+    Returns (result, spans) so the parent can merge the worker's spans.
+    """
+    timings = Timings()
+    with timings.activate(), span(name):
+        result = fn(*args)
+    return result, timings.spans
 
 
 class AcousticQuantizer:
-    """Converts raw numbers to semantic tags"""
+    """Converts raw numbers to semantic tags (Hz / 0-1 inputs, see COUPLE_QUANTIZER)"""
+    
+    TABLES = COUPLE_QUANTIZER
     
     @staticmethod
     def get_pitch_tag(value: float) -> str:
-        # Normalize Hz to 0-100 scale
-        norm = min(100, max(0, ((value - 80) / 220) * 100))
-        if norm < 20: return "Sub-bass / Gravitas (重厚)"
-        if norm < 40: return "Deep / Resonant (共鳴)"
-        if norm < 60: return "Baritone / Grounded (安定的)"
-        if norm < 80: return "Tenor / Clear (明瞭)"
-        return "Soprano / Crystalline (透き通った)"
+        # 80-300 Hz -> 0-100
+        return COUPLE_QUANTIZER['pitch'].tag(value)
     
     @staticmethod
     def get_speed_tag(value: float) -> str:
-        norm = value * 100
-        if norm < 20: return "Largo / Contemplative (熟考)"
-        if norm < 40: return "Andante / Deliberate (慎重)"
-        if norm < 60: return "Moderato / Conversational (会話的)"
-        if norm < 80: return "Allegro / Energetic (活発)"
-        return "Presto / Urgent (性急)"
+        return COUPLE_QUANTIZER['speed'].tag(value)
     
     @staticmethod
     def get_volume_tag(value: float) -> str:
-        norm = value * 100
-        if norm < 20: return "Whisper / Intimate (親密)"
-        if norm < 40: return "Soft / Gentle (穏やか)"
-        if norm < 60: return "Mezzo / Balanced (バランス)"
-        if norm < 80: return "Forte / Projecting (発信)"
-        return "Fortissimo / Commanding (威厳)"
+        return COUPLE_QUANTIZER['volume'].tag(value)
     
     @staticmethod
     def get_tone_tag(value: float) -> str:
-        # Normalize centroid Hz to 0-100
-        norm = min(100, max(0, ((value - 1000) / 3000) * 100))
-        if norm < 20: return "Husky / Textured (ハスキー)"
-        if norm < 40: return "Smoky / Warm (スモーキー)"
-        if norm < 60: return "Neutral / Natural (ナチュラル)"
-        if norm < 80: return "Bright / Polished (ブライト)"
-        return "Piercing / Pure (純粋)"
+        # Centroid 1000-4000 Hz -> 0-100
+        return COUPLE_QUANTIZER['tone'].tag(value)
     
     @classmethod
-    def quantize(cls, metrics: AcousticMetrics) -> AcousticTags:
+    def quantize(cls, metrics: AcousticMetrics, tables=None) -> AcousticTags:
+        """Tags from the fixed tables, or from `tables` (e.g. percentile_quantizer)"""
+        if tables is None:
+            return AcousticTags(
+                pitch_tag=cls.get_pitch_tag(metrics.pitch),
+                speed_tag=cls.get_speed_tag(metrics.speed),
+                volume_tag=cls.get_volume_tag(metrics.volume),
+                tone_tag=cls.get_tone_tag(metrics.tone),
+            )
         return AcousticTags(
-            pitch_tag=cls.get_pitch_tag(metrics.pitch),
-            speed_tag=cls.get_speed_tag(metrics.speed),
-            volume_tag=cls.get_volume_tag(metrics.volume),
-            tone_tag=cls.get_tone_tag(metrics.tone),
+            pitch_tag=tables.tag('pitch', metrics.pitch),
+            speed_tag=tables.tag('speed', metrics.speed),
+            volume_tag=tables.tag('volume', metrics.volume),
+            tone_tag=tables.tag('tone', metrics.tone),
         )
+    
+    @classmethod
+    def quantize_batch(cls, pitch, speed, volume, tone) -> dict:
+        """Label index arrays for whole metric columns (np.searchsorted)"""
+        return cls.TABLES.batch_indices(pitch=pitch, speed=speed, volume=volume, tone=tone)
 
 
 class SCMAnalyzer:
@@ -171,49 +365,460 @@ class SCMAnalyzer:
             'warmth': int(final_warmth),
             'archetype': archetype,
         }
+    
+    # analyze_batch archetype codes: (competence < 50) * 2 + (warmth < 50)
+    ARCHETYPES = (
+        "The Charismatic Ideal",
+        "The Efficient Strategist",
+        "The Empathetic Soul",
+        "The Free Spirit",
+    )
+    
+    @classmethod
+    def analyze_batch(cls, job_codes, jobs, accent_codes, accents,
+                      speed, volume, tone) -> dict:
+        """Vectorized analyze() over whole columns
+        
+        Jobs and accents are integer-coded: job_codes[i] indexes the `jobs`
+        vocabulary (likewise accents), so the table lookups happen once per
+        distinct value. Returns {'competence', 'warmth'} int64 arrays with
+        the same values as analyze() and 'archetype' as int8 indices into
+        ARCHETYPES.
+        """
+        job_table = np.array([cls.JOB_SCORES.get(job.lower(), (50, 50)) for job in jobs],
+                             dtype=np.int64).reshape(-1, 2)
+        accent_table = np.array([cls.ACCENT_MODS.get(accent.lower(), (0, 0)) for accent in accents],
+                                dtype=np.int64).reshape(-1, 2)
+        base = job_table[np.asarray(job_codes)]
+        acc = accent_table[np.asarray(accent_codes)]
+        speed, volume, tone = (np.asarray(x, dtype=np.float64) for x in (speed, volume, tone))
+        
+        voice_comp = ((speed * 100 + volume * 100) / 2 - 50) * 0.3
+        voice_warmth = (((tone - 1000) / 3000 * 100) - 50) * 0.25
+        
+        final_comp = clamp_score(base[:, 0] + acc[:, 0] + voice_comp)
+        final_warmth = clamp_score(base[:, 1] + acc[:, 1] + voice_warmth)
+        
+        return {
+            'competence': final_comp.astype(np.int64),
+            'warmth': final_warmth.astype(np.int64),
+            'archetype': ((final_comp < 50) * 2 + (final_warmth < 50)).astype(np.int8),
+        }
+
+
+def clamp_score(values: np.ndarray) -> np.ndarray:
+    """max(0, min(100, x)) elementwise, NaN included (it becomes 100)"""
+    values = np.where(values < 100, values, 100)
+    return np.where(values > 0, values, 0)
+
+
+def load_audio(source, sr: int = DEFAULT_SR,
+               duration: float = ANALYSIS_END) -> Tuple[np.ndarray, int]:
+    """Decode the first `duration` seconds of a file (path or bytes) as mono float32 at `sr`
+    
+    Memory is bounded by `duration` however long the upload is. WebM/Opus
+    uploads are decoded in-process when PyAV is installed; see
+    audio_decoder.decode_audio for the per-format paths.
+    """
+    return decode_audio(source, sr, duration)
 
 
 def extract_audio_segment(y: np.ndarray, sr: int, start: float, end: float) -> np.ndarray:
-    """Extract a segment from audio array"""
+    """Extract a segment from audio array (a view, no samples are copied)"""
     start_sample = int(start * sr)
     end_sample = int(end * sr)
     return y[start_sample:end_sample]
 
 
-def analyze_segment(y: np.ndarray, sr: int) -> AcousticMetrics:
-    """Analyze a single audio segment"""
+def extract_features(y: np.ndarray, sr: int,
+                     pitch_engine: Optional[str] = None,
+                     vad: bool = False) -> FrameFeatures:
+    """Compute RMS, centroid and onset envelope from a single STFT pass
+    
+    With a `pitch_engine` the f0 track is computed over the same frames too,
+    so segments read their pitch statistics by slicing instead of re-running
+    the tracker per segment. With `vad` the voice activity mask is computed
+    as well, and every pitch track over these frames skips inactive ones.
+    """
+    n_fft, hop_length = frame_params(sr)
+    with span('stft'):
+        S = np.abs(librosa.stft(y, n_fft=n_fft, hop_length=hop_length))
+    
+    # RMS is framed in the time domain so values match librosa.feature.rms(y=...)
+    with span('rms'):
+        rms = librosa.feature.rms(y=y, frame_length=n_fft, hop_length=hop_length)[0]
+    with span('centroid'):
+        centroid = librosa.feature.spectral_centroid(S=S, sr=sr, n_fft=n_fft, hop_length=hop_length)[0]
+    
+    # Same log-mel pipeline onset_strength(y=...) runs internally
+    with span('onset'):
+        mel = librosa.feature.melspectrogram(S=S**2, sr=sr, n_fft=n_fft, hop_length=hop_length)
+        onset_env = librosa.onset.onset_strength(
+            S=librosa.power_to_db(mel), sr=sr, hop_length=hop_length
+        )
+    
+    voice_activity = None
+    if vad:
+        with span('vad'):
+            voice_activity = detect_voice_activity(y, sr, rms=rms)
+    
+    f0 = voiced_flag = voiced_prob = None
+    if pitch_engine is not None:
+        with span('pitch'):
+            f0, voiced_flag, voiced_prob = track_pitch(y, sr, pitch_engine, active=voice_activity)
+    
+    return FrameFeatures(
+        sr=sr,
+        hop_length=hop_length,
+        rms=rms,
+        centroid=centroid,
+        onset_env=onset_env,
+        f0=f0,
+        voiced_flag=voiced_flag,
+        voiced_prob=voiced_prob,
+        voice_activity=voice_activity,
+    )
+
+
+# Voice activity detection: a frame is active when its RMS clears the
+# recording's noise floor (VAD_NOISE_PERCENTILE of frame RMS) by
+# VAD_FLOOR_RATIO, capped at VAD_PEAK_RATIO of the loudest frame so mostly
+# voiced recordings are not gated, and it crosses zero less than
+# VAD_MAX_ZCR_HZ times per second (noise and fricatives cross far more often
+# than voiced speech at 50-500 Hz)
+VAD_MIN_RMS = 0.005
+VAD_NOISE_PERCENTILE = 10
+VAD_FLOOR_RATIO = 3.0
+VAD_PEAK_RATIO = 0.05
+VAD_MAX_ZCR_HZ = 5000
+# Active runs are widened by this much so onsets / decays are still tracked
+VAD_HANGOVER = 0.05
+# Active runs closer than this are pitch-tracked as one region
+VAD_MERGE_GAP = 0.2
+
+
+def detect_voice_activity(y: np.ndarray, sr: int,
+                          rms: Optional[np.ndarray] = None) -> np.ndarray:
+    """Bool per frame_params(sr) frame: energy / zero-crossing voice activity
+    
+    Vectorized over the whole signal; `rms` reuses extract_features' frame
+    RMS (same framing) instead of recomputing it.
+    """
+    n_fft, hop_length = frame_params(sr)
+    if rms is None:
+        rms = librosa.feature.rms(y=y, frame_length=n_fft, hop_length=hop_length)[0]
+    zcr = librosa.feature.zero_crossing_rate(y, frame_length=n_fft, hop_length=hop_length)[0]
+    
+    noise_floor = np.percentile(rms, VAD_NOISE_PERCENTILE) if len(rms) else 0.0
+    threshold = max(VAD_MIN_RMS, min(noise_floor * VAD_FLOOR_RATIO, rms.max(initial=0) * VAD_PEAK_RATIO))
+    active = (rms >= threshold) & (zcr * sr < VAD_MAX_ZCR_HZ)
+    
+    hangover = int(np.ceil(VAD_HANGOVER * sr / hop_length))
+    if hangover > 0 and active.any():
+        active = np.convolve(active, np.ones(2 * hangover + 1), mode='same') > 0
+    return active
+
+
+def _active_runs(active: np.ndarray, merge_frames: int) -> List[Tuple[int, int]]:
+    """[first, last) frame ranges of active runs, merging gaps below `merge_frames`"""
+    edges = np.flatnonzero(np.diff(np.concatenate([[0], active.astype(np.int8), [0]])))
+    starts, ends = edges[::2], edges[1::2]
+    if len(starts) == 0:
+        return []
+    new_run = np.concatenate([[True], starts[1:] - ends[:-1] >= merge_frames])
+    last_of_run = np.concatenate([new_run[1:], [True]])
+    return list(zip(starts[new_run].tolist(), ends[last_of_run].tolist()))
+
+
+def _pitch_frames(y: np.ndarray, frame_length: int, hop_length: int) -> np.ndarray:
+    """Centered (n_frames, frame_length) view, framed the same way as pyin"""
+    y_pad = np.pad(y, frame_length // 2, mode='constant')
+    return librosa.util.frame(y_pad, frame_length=frame_length, hop_length=hop_length).T
+
+
+def _parabolic_peak(curve: np.ndarray, idx: np.ndarray) -> np.ndarray:
+    """Refine integer lag indices with a parabola through the neighbours"""
+    idx = np.clip(idx, 1, curve.shape[1] - 2)
+    rows = np.arange(curve.shape[0])
+    left = curve[rows, idx - 1]
+    mid = curve[rows, idx]
+    right = curve[rows, idx + 1]
+    denom = left - 2 * mid + right
+    shift = np.where(np.abs(denom) > 1e-12, 0.5 * (left - right) / np.where(denom == 0, 1, denom), 0.0)
+    return idx + np.clip(shift, -1, 1)
+
+
+def _lag_energies(frames: np.ndarray, window: int, max_lag: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Cross-correlation r(tau) = sum x[j] * x[j + tau] and the energies of both windows"""
+    n_fft = 1 << int(np.ceil(np.log2(frames.shape[1] + window)))
+    spec = np.fft.rfft(frames, n=n_fft, axis=1)
+    spec_head = np.fft.rfft(frames[:, :window], n=n_fft, axis=1)
+    acf = np.fft.irfft(spec * np.conj(spec_head), n=n_fft, axis=1)[:, :max_lag + 1]
+    
+    power = np.cumsum(frames**2, axis=1)
+    power = np.concatenate([np.zeros((frames.shape[0], 1)), power], axis=1)
+    lags = np.arange(max_lag + 1)
+    energy_head = power[:, window:window + 1]
+    energy_lag = power[:, lags + window] - power[:, lags]
+    return acf, energy_head, energy_lag
+
+
+def _yin_block(frames: np.ndarray, sr: int, fmin: float, fmax: float,
+               threshold: float) -> Tuple[np.ndarray, np.ndarray]:
+    """YIN: first trough of the normalized difference below `threshold`"""
+    min_lag = max(1, int(np.floor(sr / fmax)))
+    max_lag = int(np.ceil(sr / fmin))
+    window = frames.shape[1] - max_lag
+    acf, energy_head, energy_lag = _lag_energies(frames, window, max_lag)
+    
+    # Difference function and its cumulative mean normalization
+    diff = np.maximum(energy_head + energy_lag - 2 * acf, 0)
+    diff[:, 0] = 0
+    cumulative = np.cumsum(diff[:, 1:], axis=1)
+    lags = np.arange(1, max_lag + 1)
+    cmnd = np.ones_like(diff)
+    cmnd[:, 1:] = diff[:, 1:] * lags / np.maximum(cumulative, 1e-12)
+    
+    # First trough below the threshold, falling back to the global minimum
+    search = cmnd[:, min_lag:max_lag]
+    trough = np.zeros_like(search, dtype=bool)
+    trough[:, 1:-1] = (search[:, 1:-1] <= search[:, :-2]) & (search[:, 1:-1] < search[:, 2:])
+    candidates = trough & (search < threshold)
+    has_candidate = candidates.any(axis=1)
+    best = np.where(has_candidate, np.argmax(candidates, axis=1), np.argmin(search, axis=1)) + min_lag
+    
+    rows = np.arange(frames.shape[0])
+    aperiodicity = cmnd[rows, best]
+    lag = _parabolic_peak(-cmnd, best)
+    f0 = sr / lag
+    voiced_prob = np.clip(1 - aperiodicity, 0, 1)
+    voiced = (aperiodicity < YIN_VOICING_THRESHOLD) & (energy_head[:, 0] > 0)
+    return np.where(voiced, f0, np.nan), voiced_prob
+
+
+def _acf_block(frames: np.ndarray, sr: int, fmin: float, fmax: float,
+               threshold: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Autocorrelation: shortest lag whose peak reaches 1 - `threshold`"""
+    min_lag = max(1, int(np.floor(sr / fmax)))
+    max_lag = int(np.ceil(sr / fmin))
+    window = frames.shape[1] - max_lag
+    acf, energy_head, energy_lag = _lag_energies(frames, window, max_lag)
+    
+    # Normalized cross-correlation: 1.0 for a perfectly periodic frame
+    nacf = acf / np.sqrt(np.maximum(energy_head * energy_lag, 1e-12))
+    
+    # Multiples of the period correlate just as well, so take the first peak
+    # close to the strongest one instead of the argmax (avoids octave errors)
+    search = nacf[:, min_lag:max_lag]
+    peaks = np.zeros_like(search, dtype=bool)
+    peaks[:, 1:-1] = (search[:, 1:-1] >= search[:, :-2]) & (search[:, 1:-1] > search[:, 2:])
+    strongest = np.max(np.where(peaks, search, -1), axis=1, keepdims=True)
+    candidates = peaks & (search >= strongest * ACF_PEAK_RATIO)
+    best = np.where(
+        candidates.any(axis=1), np.argmax(candidates, axis=1), np.argmax(search, axis=1)
+    ) + min_lag
+    
+    rows = np.arange(frames.shape[0])
+    peak = nacf[rows, best]
+    lag = _parabolic_peak(nacf, best)
+    f0 = sr / lag
+    voiced_prob = np.clip(peak, 0, 1)
+    voiced = (peak >= 1 - threshold) & (energy_head[:, 0] > 0)
+    return np.where(voiced, f0, np.nan), voiced_prob
+
+
+# Frames whose best YIN dip stays above this are reported unvoiced
+YIN_VOICING_THRESHOLD = 0.35
+# First ACF peak within this fraction of the strongest one wins
+ACF_PEAK_RATIO = 0.9
+
+_PITCH_BLOCKS = {
+    'yin': (_yin_block, 0.1),   # threshold on the normalized difference
+    'acf': (_acf_block, 0.3),   # peak must reach 1 - threshold
+}
+
+PITCH_ENGINES = ('pyin', 'yin', 'acf')
+
+# 'segment': track pitch per segment; 'recording': once over ANALYSIS_END
+PITCH_PASSES = ('segment', 'recording')
+
+# Segments each partner reads alone; their analyses are independent
+USER_SEGMENTS = ('calibration_a', 'stress_a', 'calibration_b', 'stress_b')
+
+# Executors available for --workers
+POOLS = ('process', 'thread')
+
+# 'fixed': Hz / 0-1 scales of COUPLE_QUANTIZER; 'percentile': quintiles of
+# the population sketch passed as `population`
+QUANTIZERS = ('fixed', 'percentile')
+
+
+def track_pitch(y: np.ndarray, sr: int, engine: str = 'pyin',
+                fmin: float = PITCH_FMIN, fmax: float = PITCH_FMAX,
+                frame_length: Optional[int] = None, hop_length: Optional[int] = None,
+                block_frames: int = 256,
+                active: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Frame-level f0 with the selected engine
+    
+    Returns (f0, voiced_flag, voiced_prob) like librosa.pyin: one value per
+    centered frame, with f0 set to NaN where the frame is unvoiced. 'yin' and
+    'acf' are vectorized over blocks of frames and skip pyin's Viterbi pass.
+    Frames default to frame_params(sr), aligned with extract_features().
+    
+    With an `active` mask (e.g. detect_voice_activity) only the active runs
+    are tracked, each with enough surrounding audio that its frames see the
+    same samples as in a full pass, and the results are stitched back into
+    full-length arrays; inactive frames are unvoiced with voiced_prob 0.
+    """
+    default_frame_length, default_hop_length = frame_params(sr)
+    frame_length = frame_length or default_frame_length
+    hop_length = hop_length or default_hop_length
+    
+    if active is not None and len(y) >= 2 * frame_length:
+        return _track_active(y, sr, engine, fmin, fmax, frame_length, hop_length, block_frames, active)
+    
+    if engine == 'pyin':
+        return librosa.pyin(
+            y, fmin=fmin, fmax=fmax, sr=sr,
+            frame_length=frame_length, hop_length=hop_length,
+        )
+    if engine not in _PITCH_BLOCKS:
+        raise ValueError(f"Unknown pitch engine: {engine} (expected one of {', '.join(PITCH_ENGINES)})")
+    
+    block_fn, threshold = _PITCH_BLOCKS[engine]
+    frames = _pitch_frames(y.astype(np.float64), frame_length, hop_length)
+    
+    # Frames more than 60 dB below the loudest one are treated as silence
+    frame_power = np.mean(frames**2, axis=1)
+    silent = frame_power < frame_power.max(initial=0) * 1e-6
+    
+    f0 = np.full(len(frames), np.nan)
+    voiced_prob = np.zeros(len(frames))
+    for start in range(0, len(frames), block_frames):
+        block = slice(start, start + block_frames)
+        f0[block], voiced_prob[block] = block_fn(frames[block], sr, fmin, fmax, threshold)
+    
+    f0[silent] = np.nan
+    voiced_prob[silent] = 0
+    
+    # A 3-frame median stands in for pyin's Viterbi smoothing and removes
+    # isolated octave jumps; unvoiced frames stay NaN
+    padded = np.pad(f0, 1, mode='constant', constant_values=np.nan)
+    neighbours = np.stack([padded[:-2], padded[1:-1], padded[2:]])
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        f0 = np.where(np.isnan(f0), np.nan, np.nanmedian(neighbours, axis=0))
+    
+    voiced_flag = ~np.isnan(f0)
+    return f0, voiced_flag, voiced_prob
+
+
+def _track_active(y: np.ndarray, sr: int, engine: str, fmin: float, fmax: float,
+                  frame_length: int, hop_length: int, block_frames: int,
+                  active: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """track_pitch over the active runs of `active` only (see track_pitch)"""
+    n_frames = 1 + len(y) // hop_length
+    # The mask may come from frames sliced at a slightly different offset
+    fitted = np.zeros(n_frames, dtype=bool)
+    fitted[:min(n_frames, len(active))] = active[:n_frames]
+    
+    f0 = np.full(n_frames, np.nan)
+    voiced_flag = np.zeros(n_frames, dtype=bool)
+    voiced_prob = np.zeros(n_frames)
+    
+    # Frames of context on each side: a centered frame reaches frame_length / 2
+    # samples out, and pyin's first / last frames are padded
+    margin = int(np.ceil(frame_length / hop_length))
+    merge_frames = max(2 * margin, int(VAD_MERGE_GAP * sr / hop_length))
+    for first, last in _active_runs(fitted, merge_frames):
+        lo = max(0, first - margin)
+        hi = min(n_frames, last + margin)
+        region = y[lo * hop_length:(hi - 1) * hop_length + 1]
+        if len(region) < frame_length:
+            region = y[lo * hop_length:lo * hop_length + frame_length]
+        region_f0, region_flag, region_prob = track_pitch(
+            region, sr, engine, fmin, fmax, frame_length, hop_length, block_frames,
+        )
+        take = slice(first - lo, last - lo)
+        f0[first:last] = region_f0[take]
+        voiced_flag[first:last] = region_flag[take]
+        voiced_prob[first:last] = region_prob[take]
+    return f0, voiced_flag, voiced_prob
+
+
+# Segments quieter than this (signal RMS) get neutral metrics, no analysis
+QUIET_RMS = 0.01
+
+
+@dataclass
+class SegmentFrames:
+    """Everything the scoring step reads from one segment's audio
+    
+    `frames` holds the segment's frame features with f0 filled in; it is
+    None for a quiet segment analyzed without precomputed features.
+    """
+    frames: Optional[FrameFeatures]
+    signal_rms: float  # RMS of the raw samples
+    duration: float    # Seconds
+
+
+def segment_frames(y: np.ndarray, sr: int,
+                   features: Optional[FrameFeatures] = None,
+                   pitch_engine: str = 'pyin',
+                   quiet_rms: float = QUIET_RMS) -> SegmentFrames:
+    """The audio-dependent half of the analysis: frame features and f0
+    
+    Segments below `quiet_rms` are not analyzed further (they score as
+    neutral); pass 0 to always track pitch.
+    """
+    signal_rms = float(np.sqrt(np.mean(y**2)))
+    if signal_rms >= quiet_rms:
+        if features is None:
+            features = extract_features(y, sr)
+        
+        # Pitch detection (pyin by default), unless already tracked for the recording
+        if features.f0 is None:
+            with span('pitch'):
+                f0, voiced_flag, voiced_prob = track_pitch(y, sr, pitch_engine,
+                                                           active=features.voice_activity)
+            features = replace(features, f0=f0, voiced_flag=voiced_flag, voiced_prob=voiced_prob)
+    return SegmentFrames(frames=features, signal_rms=signal_rms, duration=len(y) / sr)
+
+
+def score_segment(segment: SegmentFrames) -> AcousticMetrics:
+    """AcousticMetrics from a segment's frames alone (no audio needed)"""
     
     # Skip if too quiet
-    rms = np.sqrt(np.mean(y**2))
-    if rms < 0.01:
+    if segment.signal_rms < QUIET_RMS:
         return AcousticMetrics(
             pitch=150, speed=0.5, volume=0, tone=2000,
             pitch_std=0, volume_std=0
         )
+    features = segment.frames
     
-    # Pitch detection using pyin
-    f0, voiced_flag, voiced_probs = librosa.pyin(
-        y, fmin=50, fmax=500, sr=sr
-    )
-    valid_f0 = f0[~np.isnan(f0)]
-    pitch = float(np.median(valid_f0)) if len(valid_f0) > 0 else 150.0
-    pitch_std = float(np.std(valid_f0)) if len(valid_f0) > 0 else 0.0
+    with span('pitch'):
+        f0 = features.f0
+        valid_f0 = f0[~np.isnan(f0)]
+        pitch = float(np.median(valid_f0)) if len(valid_f0) > 0 else 150.0
+        pitch_std = float(np.std(valid_f0)) if len(valid_f0) > 0 else 0.0
     
     # Speech rate estimation (based on onset detection)
-    onset_env = librosa.onset.onset_strength(y=y, sr=sr)
-    onsets = librosa.onset.onset_detect(y=y, sr=sr)
-    duration = len(y) / sr
+    with span('onset'):
+        onsets = librosa.onset.onset_detect(
+            onset_envelope=features.onset_env, sr=features.sr, hop_length=features.hop_length
+        )
+    duration = segment.duration
     syllables_per_sec = len(onsets) / duration if duration > 0 else 0
     speed = min(1.0, max(0.0, syllables_per_sec / 6))  # Normalize to 0-1
     
     # Volume (RMS)
-    rms_values = librosa.feature.rms(y=y)[0]
-    volume = float(np.mean(rms_values))
-    volume_std = float(np.std(rms_values))
+    with span('rms'):
+        volume = float(np.mean(features.rms))
+        volume_std = float(np.std(features.rms))
     
     # Spectral centroid (tone brightness)
-    centroid = librosa.feature.spectral_centroid(y=y, sr=sr)
-    tone = float(np.mean(centroid))
+    with span('centroid'):
+        tone = float(np.mean(features.centroid))
     
     return AcousticMetrics(
         pitch=pitch,
@@ -225,16 +830,26 @@ def analyze_segment(y: np.ndarray, sr: int) -> AcousticMetrics:
     )
 
 
-def analyze_unison(y: np.ndarray, sr: int, 
-                   metrics_a: AcousticMetrics, 
-                   metrics_b: AcousticMetrics) -> TogetherMetrics:
-    """Analyze the unison (together) segment"""
+def analyze_segment(y: np.ndarray, sr: int,
+                    features: Optional[FrameFeatures] = None,
+                    pitch_engine: str = 'pyin') -> AcousticMetrics:
+    """Analyze a single audio segment
     
-    # Basic metrics
-    rms = np.sqrt(np.mean(y**2))
+    `features` are the segment's frames sliced from a whole-recording
+    extract_features() pass; they are computed from `y` when omitted.
+    """
+    return score_segment(segment_frames(y, sr, features, pitch_engine))
+
+
+def score_unison(segment: SegmentFrames,
+                 metrics_a: AcousticMetrics,
+                 metrics_b: AcousticMetrics) -> TogetherMetrics:
+    """TogetherMetrics from the unison frames and both partners' metrics"""
+    features = segment.frames
     
     # Pitch detection for harmony analysis
-    f0, _, _ = librosa.pyin(y, fmin=50, fmax=500, sr=sr)
+    with span('pitch'):
+        f0 = features.f0
     valid_f0 = f0[~np.isnan(f0)]
     
     # Harmony: Check if multiple pitches or single merged pitch
@@ -247,8 +862,8 @@ def analyze_unison(y: np.ndarray, sr: int,
         harmony_score = 50
     
     # Sync rate: Check onset consistency
-    onset_env = librosa.onset.onset_strength(y=y, sr=sr)
-    onset_variance = np.std(onset_env)
+    with span('onset'):
+        onset_variance = float(np.std(features.onset_env))
     sync_rate = max(0, 1 - onset_variance)
     
     # Dominance: Compare volumes
@@ -279,6 +894,63 @@ def analyze_unison(y: np.ndarray, sr: int,
     )
 
 
+def analyze_unison(y: np.ndarray, sr: int, 
+                   metrics_a: AcousticMetrics, 
+                   metrics_b: AcousticMetrics,
+                   features: Optional[FrameFeatures] = None,
+                   pitch_engine: str = 'pyin') -> TogetherMetrics:
+    """Analyze the unison (together) segment"""
+    return score_unison(segment_frames(y, sr, features, pitch_engine, quiet_rms=0), metrics_a, metrics_b)
+
+
+def make_executor(workers: int, pool: str = 'process'):
+    """Executor for `workers` > 1, or a null context that yields None"""
+    if workers <= 1:
+        return nullcontext()
+    if pool == 'process':
+        return ProcessPoolExecutor(max_workers=workers)
+    if pool == 'thread':
+        return ThreadPoolExecutor(max_workers=workers)
+    raise ValueError(f"Unknown pool: {pool} (expected one of {', '.join(POOLS)})")
+
+
+def collect_segment_frames(y: np.ndarray, sr: int, features: FrameFeatures,
+                           names: Tuple[str, ...], pitch_engine: str = 'pyin',
+                           executor: Optional[Executor] = None) -> dict:
+    """Run segment_frames on the named SEGMENTS, concurrently when given an executor
+    
+    Each segment is timed as span 'segment.<name>'; executor workers send
+    their spans back with the frames.
+    """
+    jobs = {
+        name: (
+            extract_audio_segment(y, sr, *SEGMENTS[name]),
+            sr,
+            features.slice(*SEGMENTS[name]),
+            pitch_engine,
+        )
+        for name in names
+    }
+    if executor is None:
+        frames = {}
+        for name, job in jobs.items():
+            with span(f'segment.{name}'):
+                frames[name] = segment_frames(*job)
+        return frames
+    
+    futures = {
+        name: executor.submit(_run_timed, _span_name(f'segment.{name}'), segment_frames, *job)
+        for name, job in jobs.items()
+    }
+    return {name: _collect_timed(future) for name, future in futures.items()}
+
+
+# Matrix score weights: 50% from similarity, 30% from unison, 20% from sync
+SIMILARITY_WEIGHT = 0.5
+HARMONY_WEIGHT = 0.3
+SYNC_WEIGHT = 20
+
+
 def calculate_matrix_score(user_a: dict, user_b: dict, together: TogetherMetrics) -> int:
     """Calculate overall compatibility score"""
     
@@ -295,66 +967,495 @@ def calculate_matrix_score(user_a: dict, user_b: dict, together: TogetherMetrics
     avg_delta = (pitch_delta + speed_delta + volume_delta + tone_delta) / 4
     
     # Base score (inverse of delta + harmony bonus)
-    base_score = 100 - avg_delta * 0.5  # 50% from similarity
-    harmony_bonus = together.harmony_score * 0.3  # 30% from unison
-    sync_bonus = together.sync_rate * 20  # 20% from sync
+    base_score = 100 - avg_delta * SIMILARITY_WEIGHT
+    harmony_bonus = together.harmony_score * HARMONY_WEIGHT
+    sync_bonus = together.sync_rate * SYNC_WEIGHT
     
     matrix_score = base_score + harmony_bonus + sync_bonus
     
     return int(max(0, min(100, matrix_score)))
 
 
+def metric_deltas(a: dict, b: dict) -> dict:
+    """|a - b| per metric; works on floats and on whole columns alike"""
+    return {metric: abs(a[metric] - b[metric]) for metric in ('pitch', 'speed', 'volume', 'tone')}
+
+
+def calculate_matrix_scores(metrics_a: dict, metrics_b: dict,
+                            harmony_score, sync_rate) -> np.ndarray:
+    """Vectorized calculate_matrix_score()
+    
+    metrics_a / metrics_b map pitch/speed/volume/tone to columns; the result
+    is an int64 array equal to the scalar score row by row.
+    """
+    delta = metric_deltas(
+        {metric: np.asarray(values, dtype=np.float64) for metric, values in metrics_a.items()},
+        {metric: np.asarray(values, dtype=np.float64) for metric, values in metrics_b.items()},
+    )
+    pitch_delta = delta['pitch'] / 200 * 100
+    speed_delta = delta['speed'] * 100
+    volume_delta = delta['volume'] * 100
+    tone_delta = delta['tone'] / 3000 * 100
+    
+    avg_delta = (pitch_delta + speed_delta + volume_delta + tone_delta) / 4
+    
+    base_score = 100 - avg_delta * SIMILARITY_WEIGHT
+    harmony_bonus = np.asarray(harmony_score, dtype=np.float64) * HARMONY_WEIGHT
+    sync_bonus = np.asarray(sync_rate, dtype=np.float64) * SYNC_WEIGHT
+    
+    return clamp_score(base_score + harmony_bonus + sync_bonus).astype(np.int64)
+
+
 def process_couple_audio(filepath: str, 
                          user_a_info: dict,
-                         user_b_info: dict) -> CoupleAnalysisResult:
-    """Main processing function"""
-    
-    print(f"Loading audio: {filepath}")
-    y, sr = librosa.load(filepath, sr=44100, mono=True)
-    
-    print("Extracting segments...")
-    
-    # Extract and analyze each segment
-    y_cal_a = extract_audio_segment(y, sr, *SEGMENTS['calibration_a'])
-    y_cal_b = extract_audio_segment(y, sr, *SEGMENTS['calibration_b'])
-    y_unison = extract_audio_segment(y, sr, *SEGMENTS['unison'])
-    y_stress_a = extract_audio_segment(y, sr, *SEGMENTS['stress_a'])
-    y_stress_b = extract_audio_segment(y, sr, *SEGMENTS['stress_b'])
-    
-    print("Analyzing User A (calibration + stress)...")
-    metrics_a_cal = analyze_segment(y_cal_a, sr)
-    metrics_a_stress = analyze_segment(y_stress_a, sr)
-    
-    print("Analyzing User B (calibration + stress)...")
-    metrics_b_cal = analyze_segment(y_cal_b, sr)  
-    metrics_b_stress = analyze_segment(y_stress_b, sr)
-    
-    # Average calibration and stress for final metrics
-    metrics_a = AcousticMetrics(
-        pitch=(metrics_a_cal.pitch + metrics_a_stress.pitch) / 2,
-        speed=(metrics_a_cal.speed + metrics_a_stress.speed) / 2,
-        volume=(metrics_a_cal.volume + metrics_a_stress.volume) / 2,
-        tone=(metrics_a_cal.tone + metrics_a_stress.tone) / 2,
-        pitch_std=(metrics_a_cal.pitch_std + metrics_a_stress.pitch_std) / 2,
-        volume_std=(metrics_a_cal.volume_std + metrics_a_stress.volume_std) / 2,
+                         user_b_info: dict,
+                         pitch_engine: str = 'pyin',
+                         pitch_pass: str = 'segment',
+                         workers: int = 1,
+                         pool: str = 'process',
+                         analysis_sr: int = DEFAULT_SR,
+                         population: Optional[PopulationSketches] = None,
+                         quantizer: str = 'fixed',
+                         cache: Optional[ResultCache] = None,
+                         features_path: Optional[str] = None,
+                         vad: bool = False,
+                         audio_bytes: Optional[bytes] = None) -> CoupleAnalysisResult:
+    """Main processing function
+    
+    `pitch_engine` selects the f0 tracker (see PITCH_ENGINES): 'pyin' is the
+    reference used for paid reports, 'yin'/'acf' are the fast backends.
+    `pitch_pass` 'segment' tracks pitch separately on each segment;
+    'recording' tracks it once over the whole SEGMENTS span and slices it.
+    With `workers` > 1 the per-user segments (and the unison pitch track)
+    are analyzed concurrently on a `pool` ('process' or 'thread') executor.
+    `analysis_sr` is the rate the audio is decoded/resampled to; lower rates
+    (e.g. 16000/22050) are faster at the cost of a small metric drift.
+    `population`, when given, is updated with both partners' final metrics;
+    `quantizer` 'percentile' tags them by their rank in it (see QUANTIZERS).
+    The result's `timings` hold seconds per stage span (load, features,
+    segment.<name>.pitch, unison, ...); they are also logged as JSON lines.
+    With a `cache`, a recording already analyzed with the same bytes, user
+    info and options is returned from it without decoding (see
+    couple_cache_key); percentile-tagged results are never cached.
+    With `features_path` the frame features every score is computed from are
+    saved there (see save_feature_store) for rescore_feature_store; the
+    cache is not read until that file exists, so every ok result has one.
+    With `vad` a voice activity mask is computed once for the recording and
+    pitch is only tracked on its active runs (silence between turns is
+    skipped); see detect_voice_activity and vad_report.py.
+    With `audio_bytes` the recording is decoded from memory (e.g. an upload
+    that was never written to disk) and `filepath` only labels it.
+    """
+    
+    # Options are checked before the cache lookup so an invalid one never hits
+    if analysis_sr < MIN_ANALYSIS_SR:
+        raise ValueError(f"Analysis sample rate must be at least {MIN_ANALYSIS_SR} Hz (got {analysis_sr})")
+    if pitch_engine not in PITCH_ENGINES:
+        raise ValueError(f"Unknown pitch engine: {pitch_engine} (expected one of {', '.join(PITCH_ENGINES)})")
+    if pitch_pass not in PITCH_PASSES:
+        raise ValueError(f"Unknown pitch pass: {pitch_pass} (expected one of {', '.join(PITCH_PASSES)})")
+    quantizer_tables(population, quantizer)
+    
+    audio = filepath if audio_bytes is None else audio_bytes
+    timings = Timings()
+    t0 = time.perf_counter()
+    key = None
+    if cache is not None and quantizer != 'percentile':
+        with timings.activate(), span('cache'):
+            # vad only joins the key when set, so existing entries stay valid
+            key = couple_cache_key(audio, user_a_info, user_b_info, pitch_engine=pitch_engine,
+                                   pitch_pass=pitch_pass, analysis_sr=analysis_sr, quantizer=quantizer,
+                                   **({'vad': True} if vad else {}))
+            # A hit would skip writing the feature store, so analyze again
+            store_missing = features_path is not None and not os.path.exists(features_path)
+            cached = None if store_missing else cache.get(key)
+        if cached is not None:
+            print(f"Cache hit: {filepath}")
+            result = CoupleAnalysisResult(**cached)
+            if population is not None:
+                update_population(population, asdict(result))
+            timings.add('total', time.perf_counter() - t0)
+            timings.log(file=filepath, cache='hit')
+            return replace(result, timings=timings.as_dict(), cache='hit')
+    
+    with timings.activate():
+        print(f"Loading audio: {filepath}")
+        with span('load'):
+            y, sr = load_audio(audio, sr=analysis_sr)
+        
+        print("Extracting spectral features...")
+        with span('features'):
+            features = extract_features(
+                extract_audio_segment(y, sr, 0, ANALYSIS_END), sr,
+                pitch_engine=pitch_engine if pitch_pass == 'recording' else None,
+                vad=vad,
+            )
+        
+        print("Extracting segments...")
+        with span('segmentation'):
+            y_unison = extract_audio_segment(y, sr, *SEGMENTS['unison'])
+            unison_features = features.slice(*SEGMENTS['unison'])
+        
+        print(f"Analyzing calibration + stress segments ({max(1, workers)} worker(s))...")
+        with make_executor(workers, pool) as executor:
+            # The unison pitch track does not depend on A/B metrics, so it runs
+            # alongside the segments; only analyze_unison itself has to wait
+            unison_pitch = None
+            if executor is not None and unison_features.f0 is None:
+                unison_pitch = executor.submit(
+                    _run_timed, 'unison.pitch', partial(track_pitch, active=unison_features.voice_activity),
+                    y_unison, sr, pitch_engine,
+                )
+            
+            segments = collect_segment_frames(
+                y, sr, features, USER_SEGMENTS, pitch_engine, executor
+            )
+            
+            if unison_pitch is not None:
+                f0, voiced_flag, voiced_prob = _collect_timed(unison_pitch)
+                unison_features = replace(
+                    unison_features, f0=f0, voiced_flag=voiced_flag, voiced_prob=voiced_prob
+                )
+        
+        segment_metrics = {}
+        for name, segment in segments.items():
+            with span(f'segment.{name}'):
+                segment_metrics[name] = score_segment(segment)
+        metrics_a = average_metrics(segment_metrics['calibration_a'], segment_metrics['stress_a'])
+        metrics_b = average_metrics(segment_metrics['calibration_b'], segment_metrics['stress_b'])
+        
+        print("Analyzing unison recording...")
+        with span('unison'):
+            segments['unison'] = segment_frames(y_unison, sr, unison_features, pitch_engine, quiet_rms=0)
+            together = score_unison(segments['unison'], metrics_a, metrics_b)
+        
+        if features_path is not None:
+            with span('store'):
+                save_feature_store(features_path, segments, {
+                    'source': filepath,
+                    'pitch_engine': pitch_engine,
+                    'pitch_pass': pitch_pass,
+                    'analysis_sr': sr,
+                    'vad': vad,
+                    'user_a': user_a_info,
+                    'user_b': user_b_info,
+                })
+        
+        print("Generating tags and SCM profiles...")
+        with span('result'):
+            result = build_result(user_a_info, user_b_info, segment_metrics, together,
+                                  population=population, quantizer=quantizer)
+
+    timings.add('total', time.perf_counter() - t0)
+    if key is not None:
+        result = replace(result, timings=timings.as_dict(), cache='miss')
+        cache.put(key, asdict(result))
+        timings.log(file=filepath, cache='miss')
+    else:
+        result = replace(result, timings=timings.as_dict())
+        timings.log(file=filepath)
+    
+    print(f"Matrix Score: {result.matrix_score}/100")
+    
+    return result
+
+
+# Feature store layout version (see save_feature_store)
+FEATURE_STORE_VERSION = 1
+
+# FrameFeatures arrays kept in a feature store
+FRAME_FIELDS = ('rms', 'centroid', 'onset_env', 'f0', 'voiced_flag', 'voiced_prob', 'voice_activity')
+
+
+def save_feature_store(path: str, segments: dict, meta: dict):
+    """Write the SegmentFrames of one recording as a compressed .npz
+    
+    Each segment stores one '<segment>.<field>' array per FrameFeatures array
+    in its native dtype, so rescoring reproduces the analysis exactly, plus
+    '<segment>.signal_rms' / '<segment>.duration'. 'meta' is a JSON string
+    (sr, hop_length, versions, user info), so loading needs no pickle.
+    """
+    arrays = {}
+    frames = None
+    for name, segment in segments.items():
+        arrays[f'{name}.signal_rms'] = np.float64(segment.signal_rms)
+        arrays[f'{name}.duration'] = np.float64(segment.duration)
+        if segment.frames is None:
+            continue
+        frames = segment.frames
+        for field in FRAME_FIELDS:
+            values = getattr(segment.frames, field)
+            if values is not None:
+                arrays[f'{name}.{field}'] = values
+    meta = {
+        'version': FEATURE_STORE_VERSION,
+        'analysis_version': ANALYSIS_VERSION,
+        'sr': frames.sr,
+        'hop_length': frames.hop_length,
+        **meta,
+    }
+    arrays['meta'] = np.array(json.dumps(meta, ensure_ascii=False))
+    
+    # Write-then-rename so a crash never leaves a truncated store
+    tmp = f"{path}.tmp"
+    with open(tmp, 'wb') as f:
+        np.savez_compressed(f, **arrays)
+    os.replace(tmp, path)
+
+
+def load_feature_store(path: str) -> Tuple[dict, dict]:
+    """({segment: SegmentFrames}, meta) from save_feature_store output"""
+    with np.load(path, allow_pickle=False) as data:
+        meta = json.loads(str(data['meta']))
+        if meta.get('version') != FEATURE_STORE_VERSION:
+            raise ValueError(f"Unsupported feature store version: {meta.get('version')} (expected {FEATURE_STORE_VERSION})")
+        segments = {}
+        for name in sorted({key.rsplit('.', 1)[0] for key in data.files if key != 'meta'}):
+            fields = {field: data[f'{name}.{field}'] if f'{name}.{field}' in data.files else None
+                      for field in FRAME_FIELDS}
+            frames = None
+            if fields['rms'] is not None:
+                frames = FrameFeatures(sr=meta['sr'], hop_length=meta['hop_length'], **fields)
+            segments[name] = SegmentFrames(
+                frames=frames,
+                signal_rms=float(data[f'{name}.signal_rms']),
+                duration=float(data[f'{name}.duration']),
+            )
+    return segments, meta
+
+
+def rescore_feature_store(path: str,
+                          population: Optional[PopulationSketches] = None,
+                          quantizer: str = 'fixed') -> CoupleAnalysisResult:
+    """Recompute a result from a saved feature store, without the audio
+    
+    Only the scoring runs (score_segment, score_unison, build_result), so
+    changes to thresholds, SCM profiles or the matrix score apply to stored
+    recordings without decoding or pitch tracking them again.
+    """
+    timings = Timings()
+    t0 = time.perf_counter()
+    with timings.activate():
+        with span('load'):
+            segments, meta = load_feature_store(path)
+        with span('score'):
+            segment_metrics = {name: score_segment(segments[name]) for name in USER_SEGMENTS}
+            metrics_a = average_metrics(segment_metrics['calibration_a'], segment_metrics['stress_a'])
+            metrics_b = average_metrics(segment_metrics['calibration_b'], segment_metrics['stress_b'])
+            together = score_unison(segments['unison'], metrics_a, metrics_b)
+        with span('result'):
+            result = build_result(meta['user_a'], meta['user_b'], segment_metrics, together,
+                                  population=population, quantizer=quantizer)
+    timings.add('total', time.perf_counter() - t0)
+    return replace(result, timings=timings.as_dict())
+
+
+RESULT_STORE_VERSION = 1
+
+# blend_quality labels score_unison assigns; stored as int8 codes (-1: other)
+BLEND_QUALITIES = (
+    "Acoustic Twins - Eerily synchronized",
+    "Jazz Duo - Complementary improvisation",
+    "Rock vs Classical - Creative tension",
+    "Polar Frequencies - Contrast creates sparks",
+)
+
+# AcousticMetrics fields, in declaration order
+METRIC_FIELDS = ('pitch', 'speed', 'volume', 'tone', 'pitch_std', 'volume_std')
+
+# Longest id (UTF-8 bytes) a result store row can hold
+RESULT_ID_BYTES = 64
+
+# Shards written by this process, for unique names on a coarse clock
+_shard_seq = itertools.count()
+
+# One row per result: user_a / user_b metrics, together, delta, matrix_score
+RESULT_STORE_DTYPE = np.dtype(
+    [('id', f'S{RESULT_ID_BYTES}')]
+    + [(f'{side}_{field}', '<f8') for side in ('a', 'b') for field in METRIC_FIELDS]
+    + [(name, '<f8') for name in ('harmony_score', 'sync_rate', 'dominance_a', 'dominance_b')]
+    + [('blend_quality', 'i1')]
+    + [(f'delta_{metric}', '<f8') for metric in ('pitch', 'speed', 'volume', 'tone')]
+    + [('matrix_score', '<i2')]
+)
+
+
+def result_store_row(result_id: str, result: dict) -> tuple:
+    """RESULT_STORE_DTYPE row from a result_to_dict() output"""
+    encoded_id = str(result_id).encode('utf-8')
+    if len(encoded_id) > RESULT_ID_BYTES:
+        raise ValueError(f"Result id longer than {RESULT_ID_BYTES} bytes: {result_id!r}")
+    together = result['together']
+    blend = together['blend_quality']
+    return (
+        encoded_id,
+        *(result[f'user_{side}']['metrics'][field] for side in ('a', 'b') for field in METRIC_FIELDS),
+        together['harmony_score'], together['sync_rate'], together['dominance_a'], together['dominance_b'],
+        BLEND_QUALITIES.index(blend) if blend in BLEND_QUALITIES else -1,
+        *(result['delta'][metric] for metric in ('pitch', 'speed', 'volume', 'tone')),
+        result['matrix_score'],
     )
+
+
+class ResultStore:
+    """Append-only columnar store of couple results for analytics
+    
+    A directory of .npy shards, each a RESULT_STORE_DTYPE structured array,
+    plus schema.json (version, column dtypes, blend_quality labels). Appended
+    rows are buffered and written as a new shard every `shard_rows` rows and
+    on flush() / close(); shards are written to a temporary file and renamed,
+    and named by write time, pid and a per-process sequence number, so
+    several writers can share a store.
+    
+    Reads memory-map the shards, so scanning a column never parses JSON:
+    
+        store = ResultStore('results_store')
+        scores = store.column('matrix_score')
+    """
+    
+    def __init__(self, directory: str, shard_rows: int = 65536):
+        self.directory = directory
+        self.shard_rows = shard_rows
+        self._rows = []
+        os.makedirs(directory, exist_ok=True)
+        schema = {
+            'version': RESULT_STORE_VERSION,
+            'columns': {name: RESULT_STORE_DTYPE[name].str for name in RESULT_STORE_DTYPE.names},
+            'labels': {'blend_quality': list(BLEND_QUALITIES)},
+        }
+        schema_path = os.path.join(directory, 'schema.json')
+        if os.path.exists(schema_path):
+            with open(schema_path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+            if stored != schema:
+                raise ValueError(f"Result store {directory} has schema version {stored.get('version')} "
+                                 f"with different columns (expected version {RESULT_STORE_VERSION})")
+        else:
+            tmp = f"{schema_path}.{os.getpid()}.tmp"
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(schema, f, indent=2, ensure_ascii=False)
+            os.replace(tmp, schema_path)
     
-    metrics_b = AcousticMetrics(
-        pitch=(metrics_b_cal.pitch + metrics_b_stress.pitch) / 2,
-        speed=(metrics_b_cal.speed + metrics_b_stress.speed) / 2,
-        volume=(metrics_b_cal.volume + metrics_b_stress.volume) / 2,
-        tone=(metrics_b_cal.tone + metrics_b_stress.tone) / 2,
-        pitch_std=(metrics_b_cal.pitch_std + metrics_b_stress.pitch_std) / 2,
-        volume_std=(metrics_b_cal.volume_std + metrics_b_stress.volume_std) / 2,
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def __len__(self):
+        return sum(len(shard) for shard in self.shards()) + len(self._rows)
+    
+    def append(self, result_id: str, result: dict):
+        self._rows.append(result_store_row(result_id, result))
+        if len(self._rows) >= self.shard_rows:
+            self.flush()
+    
+    def flush(self):
+        """Write buffered rows as a new shard"""
+        if not self._rows:
+            return
+        self._write_shard(np.array(self._rows, dtype=RESULT_STORE_DTYPE))
+        self._rows = []
+    
+    close = flush
+    
+    def _write_shard(self, rows: np.ndarray):
+        name = f"{time.time_ns():020d}-{os.getpid()}-{next(_shard_seq):08d}.npy"
+        path = os.path.join(self.directory, name)
+        tmp = f"{path}.tmp"
+        with open(tmp, 'wb') as f:
+            np.save(f, rows, allow_pickle=False)
+        os.replace(tmp, path)
+    
+    def shard_paths(self) -> List[str]:
+        """Shard files, oldest first"""
+        return sorted(os.path.join(self.directory, name) for name in os.listdir(self.directory)
+                      if name.endswith('.npy'))
+    
+    def shards(self, mmap_mode: Optional[str] = 'r') -> List[np.ndarray]:
+        """Every shard as a (memory-mapped) structured array"""
+        shards = []
+        for path in self.shard_paths():
+            shard = np.load(path, mmap_mode=mmap_mode, allow_pickle=False)
+            if shard.dtype != RESULT_STORE_DTYPE:
+                raise ValueError(f"Shard {path} does not match the store schema")
+            shards.append(shard)
+        return shards
+    
+    def column(self, name: str) -> np.ndarray:
+        """One column across all shards (only that column is copied)"""
+        return np.concatenate([shard[name] for shard in self.shards()] or
+                              [np.empty(0, dtype=RESULT_STORE_DTYPE[name])])
+    
+    def compact(self):
+        """Rewrite all shards as few shards of `shard_rows` rows
+        
+        Run while no other process is writing to the store.
+        """
+        self.flush()
+        paths = self.shard_paths()
+        rows = np.concatenate([np.load(path, allow_pickle=False) for path in paths] or
+                              [np.empty(0, dtype=RESULT_STORE_DTYPE)])
+        for start in range(0, len(rows), self.shard_rows):
+            self._write_shard(rows[start:start + self.shard_rows])
+        for path in paths:
+            os.remove(path)
+
+
+def couple_cache_key(audio, user_a_info: dict, user_b_info: dict, **options) -> str:
+    """Result cache key: audio bytes (from a path or in memory), both partners' info, options and ANALYSIS_VERSION"""
+    return cache_key(ANALYSIS_VERSION, content_hash(audio), user_a_info, user_b_info, options)
+
+
+def average_metrics(cal: AcousticMetrics, stress: AcousticMetrics) -> AcousticMetrics:
+    """Average calibration and stress for final metrics"""
+    return AcousticMetrics(
+        pitch=(cal.pitch + stress.pitch) / 2,
+        speed=(cal.speed + stress.speed) / 2,
+        volume=(cal.volume + stress.volume) / 2,
+        tone=(cal.tone + stress.tone) / 2,
+        pitch_std=(cal.pitch_std + stress.pitch_std) / 2,
+        volume_std=(cal.volume_std + stress.volume_std) / 2,
     )
+
+
+def quantizer_tables(population: Optional[PopulationSketches], quantizer: str = 'fixed'):
+    """Tag tables for `quantizer` (None means AcousticQuantizer's fixed scales)"""
+    if quantizer not in QUANTIZERS:
+        raise ValueError(f"Unknown quantizer: {quantizer} (expected one of {', '.join(QUANTIZERS)})")
+    if quantizer == 'fixed':
+        return None
+    if population is None or population.n == 0:
+        raise ValueError("Percentile tags need a non-empty population sketch")
+    return percentile_quantizer(population)
+
+
+def update_population(population: PopulationSketches, result: dict):
+    """Add both partners' final metrics from a result_to_dict() output"""
+    population.update(result['user_a']['metrics'])
+    population.update(result['user_b']['metrics'])
+
+
+def build_result(user_a_info: dict, user_b_info: dict,
+                 segment_metrics: dict, together: TogetherMetrics,
+                 population: Optional[PopulationSketches] = None,
+                 quantizer: str = 'fixed') -> CoupleAnalysisResult:
+    """Tags, SCM profiles, deltas and matrix score from the USER_SEGMENTS metrics
     
-    print("Analyzing unison recording...")
-    together = analyze_unison(y_unison, sr, metrics_a, metrics_b)
+    Percentile tags rank each partner against `population` as it was before
+    this recording; both partners are added to it afterwards.
+    """
+    metrics_a_stress = segment_metrics['stress_a']
+    metrics_b_stress = segment_metrics['stress_b']
+    metrics_a = average_metrics(segment_metrics['calibration_a'], metrics_a_stress)
+    metrics_b = average_metrics(segment_metrics['calibration_b'], metrics_b_stress)
     
-    print("Generating tags and SCM profiles...")
-    quantizer = AcousticQuantizer()
-    tags_a = quantizer.quantize(metrics_a)
-    tags_b = quantizer.quantize(metrics_b)
+    tables = quantizer_tables(population, quantizer)
+    tags_a = AcousticQuantizer.quantize(metrics_a, tables)
+    tags_b = AcousticQuantizer.quantize(metrics_b, tables)
+    if population is not None:
+        population.update(metrics_a)
+        population.update(metrics_b)
     
     scm_a = SCMAnalyzer.analyze(
         user_a_info.get('job', 'other'),
@@ -391,18 +1492,11 @@ def process_couple_audio(filepath: str,
     }
     
     # Calculate deltas
-    delta = {
-        'pitch': abs(metrics_a.pitch - metrics_b.pitch),
-        'speed': abs(metrics_a.speed - metrics_b.speed),
-        'volume': abs(metrics_a.volume - metrics_b.volume),
-        'tone': abs(metrics_a.tone - metrics_b.tone),
-    }
+    delta = metric_deltas(user_a['metrics'], user_b['metrics'])
     
     # Matrix score
     matrix_score = calculate_matrix_score(user_a, user_b, together)
     
-    print(f"Matrix Score: {matrix_score}/100")
-    
     return CoupleAnalysisResult(
         user_a=user_a,
         user_b=user_b,
@@ -412,14 +1506,135 @@ def process_couple_audio(filepath: str,
     )
 
 
-def generate_llm_prompt(result: CoupleAnalysisResult) -> str:
-    """Generate the LLM prompt for detailed analysis"""
+@dataclass
+class StreamEvent:
+    """Partial result emitted while a recording streams in"""
+    segment: str                     # SEGMENTS key, or 'result' for the final analysis
+    received: float                  # Seconds of audio received when emitted
+    metrics: Optional[AcousticMetrics] = None
+    together: Optional[TogetherMetrics] = None
+    result: Optional[CoupleAnalysisResult] = None
+
+
+class StreamingCoupleAnalyzer:
+    """Analyzes a couple session chunk by chunk as it is recorded
+    
+    Each USER_SEGMENTS window is analyzed as soon as its end time has been
+    received, so most of the work overlaps with recording. The unison pitch
+    track is computed when the unison window closes; analyze_unison and the
+    final CoupleAnalysisResult follow once both partners' stress windows are in.
+    
+    Chunks are mono float arrays at `sr` (the analysis rate). Segments are
+    analyzed on their own samples, like analyze_segment without a shared
+    FrameFeatures cache, so boundary frames can differ slightly from
+    process_couple_audio.
+    
+        analyzer = StreamingCoupleAnalyzer(user_a_info, user_b_info, sr=16000)
+        for chunk in chunks:
+            for event in analyzer.feed(chunk):
+                ...
+        events = analyzer.finish()
+    """
+    
+    def __init__(self, user_a_info: dict, user_b_info: dict,
+                 sr: int = DEFAULT_SR, pitch_engine: str = 'pyin',
+                 population: Optional[PopulationSketches] = None, quantizer: str = 'fixed',
+                 vad: bool = False):
+        if sr < MIN_ANALYSIS_SR:
+            raise ValueError(f"Analysis sample rate must be at least {MIN_ANALYSIS_SR} Hz (got {sr})")
+        quantizer_tables(population, quantizer)
+        self.user_a_info = user_a_info
+        self.user_b_info = user_b_info
+        self.sr = sr
+        self.pitch_engine = pitch_engine
+        self.vad = vad
+        self.population = population
+        self.quantizer = quantizer
+        
+        # Audio past the last segment is never analyzed, so the buffer is fixed
+        self.buffer = np.zeros(int(ANALYSIS_END * sr), dtype=np.float32)
+        self.received = 0
+        
+        self.segment_metrics = {}
+        self.unison_features = None
+        self.result = None
+        # Windows still to run, in the order their end times arrive
+        self.pending = sorted(USER_SEGMENTS + ('unison',), key=lambda name: SEGMENTS[name][1])
+    
+    @property
+    def received_seconds(self) -> float:
+        return self.received / self.sr
+    
+    def feed(self, chunk: np.ndarray) -> List[StreamEvent]:
+        """Append a chunk and run every window that has fully arrived"""
+        chunk = np.asarray(chunk, dtype=np.float32)
+        n = min(len(chunk), len(self.buffer) - self.received)
+        self.buffer[self.received:self.received + n] = chunk[:n]
+        self.received += n
+        return self._run_ready()
     
-    ua = result.user_a
-    ub = result.user_b
-    tog = result.together
+    def finish(self) -> List[StreamEvent]:
+        """Close the stream; audio that never arrived is analyzed as silence"""
+        self.received = len(self.buffer)
+        return self._run_ready()
     
-    prompt = f"""<Role>
+    def _run_ready(self) -> List[StreamEvent]:
+        events = []
+        while self.pending and self.received_seconds >= SEGMENTS[self.pending[0]][1]:
+            name = self.pending.pop(0)
+            y = extract_audio_segment(self.buffer[:self.received], self.sr, *SEGMENTS[name])
+            
+            if name == 'unison':
+                # A/B metrics are not complete yet; do the expensive part now
+                features = extract_features(y, self.sr, pitch_engine=self.pitch_engine, vad=self.vad)
+                self.unison_features = features
+                continue
+            
+            # With vad the mask is computed per window here (no whole recording yet)
+            features = extract_features(y, self.sr, vad=True) if self.vad else None
+            metrics = analyze_segment(y, self.sr, features, pitch_engine=self.pitch_engine)
+            self.segment_metrics[name] = metrics
+            events.append(StreamEvent(segment=name, received=self.received_seconds, metrics=metrics))
+        
+        if self.result is None and not self.pending:
+            events.extend(self._assemble())
+        return events
+    
+    def _assemble(self) -> List[StreamEvent]:
+        metrics_a = average_metrics(self.segment_metrics['calibration_a'], self.segment_metrics['stress_a'])
+        metrics_b = average_metrics(self.segment_metrics['calibration_b'], self.segment_metrics['stress_b'])
+        y_unison = extract_audio_segment(self.buffer[:self.received], self.sr, *SEGMENTS['unison'])
+        together = analyze_unison(
+            y_unison, self.sr, metrics_a, metrics_b, self.unison_features,
+            pitch_engine=self.pitch_engine,
+        )
+        self.result = build_result(self.user_a_info, self.user_b_info, self.segment_metrics, together,
+                                   population=self.population, quantizer=self.quantizer)
+        return [
+            StreamEvent(segment='unison', received=self.received_seconds, together=together),
+            StreamEvent(segment='result', received=self.received_seconds, result=self.result),
+        ]
+
+
+def stream_event_to_dict(event: StreamEvent) -> dict:
+    """JSON line for a stream event"""
+    record = {'segment': event.segment, 'received': event.received}
+    if event.metrics is not None:
+        record['metrics'] = asdict(event.metrics)
+    if event.together is not None:
+        record['together'] = asdict(event.together)
+    if event.result is not None:
+        record['result'] = result_to_dict(event.result)
+    return record
+
+
+# LLM prompt templates, filled by render_llm_prompt() from prompt_fields().
+# 'full' is the original essay-style prompt; 'compact' carries the same data
+# as dense key=value lines with shortened instructions (fewer input tokens).
+PROMPT_STYLES = ('full', 'compact')
+
+PROMPT_TEMPLATES = {
+    'full': """<Role>
 You are an Elite Linguistic Anthropologist and Relationship Analyst specializing in "Acoustic Psychology." Your style is reminiscent of a New Yorker essayist: deeply insightful, intellectually playful, and empathetic. You possess the rare ability to turn cold data into a warm, compelling narrative that makes couples feel "seen."
 </Role>
 
@@ -430,37 +1645,37 @@ You are an Elite Linguistic Anthropologist and Relationship Analyst specializing
 </Context>
 
 <User_A>
-- Name: {ua['name']}, Age: {ua.get('age', 'N/A')}, Job: {ua['job']}, Accent: {ua['accent']}
-- Raw Metrics: P:{ua['metrics']['pitch']:.0f}Hz, S:{ua['metrics']['speed']:.2f}, V:{ua['metrics']['volume']:.2f}, T:{ua['metrics']['tone']:.0f}Hz
-- Acoustic Tags: {ua['tags']['pitch_tag']}, {ua['tags']['speed_tag']}, {ua['tags']['volume_tag']}, {ua['tags']['tone_tag']}
-- SCM Profile: Competence {ua['scm']['competence']}, Warmth {ua['scm']['warmth']} → "{ua['scm']['archetype']}"
-- Stress Response Volume: {ua['stress_volume']:.2f} (How loud when panicked)
+- Name: {a_name}, Age: {a_age}, Job: {a_job}, Accent: {a_accent}
+- Raw Metrics: P:{a_pitch:.0f}Hz, S:{a_speed:.2f}, V:{a_volume:.2f}, T:{a_tone:.0f}Hz
+- Acoustic Tags: {a_pitch_tag}, {a_speed_tag}, {a_volume_tag}, {a_tone_tag}
+- SCM Profile: Competence {a_competence}, Warmth {a_warmth} → "{a_archetype}"
+- Stress Response Volume: {a_stress_volume:.2f} (How loud when panicked)
 </User_A>
 
 <User_B>
-- Name: {ub['name']}, Age: {ub.get('age', 'N/A')}, Job: {ub['job']}, Accent: {ub['accent']}
-- Raw Metrics: P:{ub['metrics']['pitch']:.0f}Hz, S:{ub['metrics']['speed']:.2f}, V:{ub['metrics']['volume']:.2f}, T:{ub['metrics']['tone']:.0f}Hz
-- Acoustic Tags: {ub['tags']['pitch_tag']}, {ub['tags']['speed_tag']}, {ub['tags']['volume_tag']}, {ub['tags']['tone_tag']}
-- SCM Profile: Competence {ub['scm']['competence']}, Warmth {ub['scm']['warmth']} → "{ub['scm']['archetype']}"
-- Stress Response Volume: {ub['stress_volume']:.2f}
+- Name: {b_name}, Age: {b_age}, Job: {b_job}, Accent: {b_accent}
+- Raw Metrics: P:{b_pitch:.0f}Hz, S:{b_speed:.2f}, V:{b_volume:.2f}, T:{b_tone:.0f}Hz
+- Acoustic Tags: {b_pitch_tag}, {b_speed_tag}, {b_volume_tag}, {b_tone_tag}
+- SCM Profile: Competence {b_competence}, Warmth {b_warmth} → "{b_archetype}"
+- Stress Response Volume: {b_stress_volume:.2f}
 </User_B>
 
 <Together_Metrics>
-- Harmony Score: {tog['harmony_score']:.0f}/100 (How well their pitches aligned when speaking together)
-- Sync Rate: {tog['sync_rate']:.0%} (Tempo synchronization)
-- Dominance: A:{tog['dominance_a']:.0%} / B:{tog['dominance_b']:.0%} (Who's louder when together)
-- Blend Quality: "{tog['blend_quality']}"
+- Harmony Score: {harmony_score:.0f}/100 (How well their pitches aligned when speaking together)
+- Sync Rate: {sync_rate:.0%} (Tempo synchronization)
+- Dominance: A:{dominance_a:.0%} / B:{dominance_b:.0%} (Who's louder when together)
+- Blend Quality: "{blend_quality}"
 </Together_Metrics>
 
 <Delta_Analysis>
-- Pitch Gap: {result.delta['pitch']:.0f} Hz
-- Speed Gap: {result.delta['speed']:.2f}
-- Volume Gap: {result.delta['volume']:.2f}
-- Tone Gap: {result.delta['tone']:.0f} Hz
+- Pitch Gap: {delta_pitch:.0f} Hz
+- Speed Gap: {delta_speed:.2f}
+- Volume Gap: {delta_volume:.2f}
+- Tone Gap: {delta_tone:.0f} Hz
 </Delta_Analysis>
 
 <Pre_Calculated>
-- Matrix Score: {result.matrix_score}/100
+- Matrix Score: {matrix_score}/100
 </Pre_Calculated>
 
 <Instructions>
@@ -473,15 +1688,15 @@ You are an Elite Linguistic Anthropologist and Relationship Analyst specializing
 </Instructions>
 
 <Output_Format>
-# The Resonance Report: {ua['name']} & {ub['name']}
+# The Resonance Report: {a_name} & {b_name}
 
 ### I. The Compatibility Quotient
-- **Score: {result.matrix_score}/100**
+- **Score: {matrix_score}/100**
 - **The Verdict**: [One witty sentence summary]
 
 ### II. Vocal Origins & Textures
-- **{ua['name']}**: [Analysis of their acoustic-persona]
-- **{ub['name']}**: [Analysis of their acoustic-persona]
+- **{a_name}**: [Analysis of their acoustic-persona]
+- **{b_name}**: [Analysis of their acoustic-persona]
 
 ### III. The Acoustic Duet
 - [How their differences play out in daily life—Sunday morning arguments, Friday night celebrations, deciding where to eat]
@@ -495,13 +1710,707 @@ You are an Elite Linguistic Anthropologist and Relationship Analyst specializing
 ### VI. The Closing Note
 - [One piece of "Communication Bio-hacking" advice for better harmony]
 </Output_Format>
-"""
-    return prompt
+""",
+    'compact': """<Role>
+Elite Linguistic Anthropologist and Relationship Analyst ("Acoustic Psychology"). New Yorker essayist voice: insightful, playful, empathetic. Turn the data into a warm narrative that makes the couple feel "seen". Audience: the couple, who want depth, not clichés. Both read the same script; focus on their "vocal choreography".
+</Role>
+
+<Data>
+A: name={a_name} age={a_age} job={a_job} accent={a_accent}
+A.metrics: pitch={a_pitch:.0f}Hz speed={a_speed:.2f} volume={a_volume:.2f} tone={a_tone:.0f}Hz stress_volume={a_stress_volume:.2f}
+A.tags: {a_pitch_tag} | {a_speed_tag} | {a_volume_tag} | {a_tone_tag}
+A.scm: competence={a_competence} warmth={a_warmth} archetype={a_archetype}
+B: name={b_name} age={b_age} job={b_job} accent={b_accent}
+B.metrics: pitch={b_pitch:.0f}Hz speed={b_speed:.2f} volume={b_volume:.2f} tone={b_tone:.0f}Hz stress_volume={b_stress_volume:.2f}
+B.tags: {b_pitch_tag} | {b_speed_tag} | {b_volume_tag} | {b_tone_tag}
+B.scm: competence={b_competence} warmth={b_warmth} archetype={b_archetype}
+together: harmony={harmony_score:.0f}/100 sync={sync_rate:.0%} dominance=A{dominance_a:.0%}/B{dominance_b:.0%} blend={blend_quality}
+delta: pitch={delta_pitch:.0f}Hz speed={delta_speed:.2f} volume={delta_volume:.2f} tone={delta_tone:.0f}Hz
+matrix_score={matrix_score}/100
+</Data>
+(stress_volume: loudness when panicked; harmony: pitch alignment speaking together; sync: tempo sync; dominance: who is louder together)
+
+<Instructions>
+1. Thick Description (Geertz): how each person's accent and job create a "vocal gravity".
+2. Deltas: small = symmetry (comfort, stagnation risk); large = tension (excitement, friction risk).
+3. Stress: who gets louder in a crisis, and what that means for their arguments.
+4. Unison: can they harmonize, or are they singing different songs?
+5. Witty but grounded; metaphors (musical genres, culinary pairings, architectural styles).
+6. No "As an AI..." or placeholders.
+</Instructions>
+
+<Output_Format>
+# The Resonance Report: {a_name} & {b_name}
+### I. The Compatibility Quotient
+- **Score: {matrix_score}/100**
+- **The Verdict**: [one witty sentence]
+### II. Vocal Origins & Textures
+- **{a_name}**: [acoustic persona]
+- **{b_name}**: [acoustic persona]
+### III. The Acoustic Duet
+- [differences in daily life: Sunday arguments, Friday celebrations, where to eat]
+### IV. The Stress Test
+- [who gets louder, who retreats, what it means]
+### V. The Unison Moment
+- [what their harmony score says about their future]
+### VI. The Closing Note
+- [one "Communication Bio-hacking" tip for better harmony]
+</Output_Format>
+""",
+}
+
+
+def prompt_fields(result: dict) -> dict:
+    """Flat template fields from a result_to_dict() output (or a stored result)"""
+    fields = {
+        'matrix_score': result['matrix_score'],
+        **result['together'],
+        **{f'delta_{metric}': value for metric, value in result['delta'].items()},
+    }
+    for side in ('a', 'b'):
+        user = result[f'user_{side}']
+        fields.update({
+            f'{side}_name': user['name'],
+            f'{side}_age': user.get('age', 'N/A'),
+            f'{side}_job': user['job'],
+            f'{side}_accent': user['accent'],
+            f'{side}_stress_volume': user['stress_volume'],
+            **{f'{side}_{key}': value for key, value in user['metrics'].items()},
+            **{f'{side}_{key}': value for key, value in user['tags'].items()},
+            **{f'{side}_{key}': value for key, value in user['scm'].items()},
+        })
+    return fields
+
+
+def render_llm_prompt(result: dict, style: str = 'full') -> str:
+    """Render the LLM prompt on demand from a stored result dict"""
+    return PROMPT_TEMPLATES[style].format_map(prompt_fields(result))
+
+
+def generate_llm_prompt(result: CoupleAnalysisResult, style: str = 'full') -> str:
+    """Generate the LLM prompt for detailed analysis"""
+    return render_llm_prompt(asdict(result), style)
+
+
+def count_tokens(text: str) -> int:
+    """LLM input tokens of `text`: tiktoken's cl100k_base if installed,
+    otherwise approximated by counting words and punctuation marks"""
+    try:
+        import tiktoken
+    except ImportError:
+        return len(re.findall(r"\w+|[^\w\s]", text))
+    return len(tiktoken.get_encoding('cl100k_base').encode(text))
+
+
+def result_to_dict(result: CoupleAnalysisResult, prompt_style: Optional[str] = None) -> dict:
+    """JSON output for a single analysis
+    
+    The LLM prompt is derived entirely from the other fields, so it is only
+    embedded when `prompt_style` is given; otherwise render it when needed
+    with render_llm_prompt() or the `prompt` subcommand.
+    """
+    return {
+        'user_a': result.user_a,
+        'user_b': result.user_b,
+        'together': result.together,
+        'delta': result.delta,
+        'matrix_score': result.matrix_score,
+        **({'llm_prompt': generate_llm_prompt(result, prompt_style)} if prompt_style is not None else {}),
+        **({'timings': result.timings} if result.timings is not None else {}),
+        **({'cache': result.cache} if result.cache is not None else {}),
+    }
+
+
+# Per-partner manifest columns, suffixed with _a / _b (e.g. name_a, job_b)
+MANIFEST_USER_FIELDS = {
+    'name': None,  # Defaults to "User A" / "User B"
+    'job': 'other',
+    'accent': 'unknown',
+    'age': '',
+}
+
+
+def read_manifest(path: str) -> Iterator[dict]:
+    """Yield manifest rows from a CSV (header row) or JSONL file"""
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if path.endswith('.csv'):
+            yield from csv.DictReader(f)
+        else:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def manifest_user_info(row: dict, side: str) -> dict:
+    """Build the user_*_info dict for partner `side` ('a' or 'b')"""
+    info = {}
+    for field, default in MANIFEST_USER_FIELDS.items():
+        value = row.get(f'{field}_{side}')
+        if value in (None, ''):
+            value = default if default is not None else f'User {side.upper()}'
+        info[field] = value
+    return info
+
+
+def manifest_row_id(row: dict) -> str:
+    """Checkpoint key of a manifest row: its `id` column, else its path"""
+    return str(row.get('id') or row.get('path'))
+
+
+def feature_store_path(feature_dir: str, row_id: str) -> str:
+    """<feature_dir>/<row id>.npz, with the id made safe as a file name"""
+    return os.path.join(feature_dir, re.sub(r'[^\w.-]', '_', row_id) + '.npz')
+
+
+def process_manifest_row(row: dict, options: dict) -> dict:
+    """Analyze one manifest row, returning an error record instead of raising
+    
+    options['feature_dir'], if set, receives the row's feature store. A row
+    (e.g. a serve job) may carry the recording itself as `audio_base64`
+    instead of a `path`, so an upload never has to touch the disk; callers
+    holding the bytes already pass them as options['audio_bytes'].
+    """
+    record = {'id': None, 'path': None}
+    options = dict(options)
+    feature_dir = options.pop('feature_dir', None)
+    try:
+        if not isinstance(row, dict):
+            raise TypeError(f"Manifest row must be a JSON object, not {type(row).__name__}")
+        record.update(id=manifest_row_id(row), path=row.get('path'))
+        if feature_dir:
+            options['features_path'] = feature_store_path(feature_dir, record['id'])
+        audio = row.get('audio_base64')
+        if audio:
+            options['audio_bytes'] = base64.b64decode(audio, validate=True)
+        if options.get('audio_bytes') is not None:
+            path = row.get('path') or f"<upload {record['id']}>"
+        else:
+            path = row['path']
+        result = process_couple_audio(
+            path,
+            manifest_user_info(row, 'a'),
+            manifest_user_info(row, 'b'),
+            **options,
+        )
+        record.update(status='ok', result=result_to_dict(result))
+    except Exception as e:
+        record.update(status='error', error=f"{type(e).__name__}: {e}")
+    return record
+
+
+def load_checkpoint(output_path: str, retry_errors: bool = False) -> set:
+    """Ids already recorded in an existing JSONL output"""
+    done = set()
+    if not os.path.exists(output_path):
+        return done
+    with open(output_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # Line cut short by a crash; the row is redone
+            if record.get('status') == 'ok' or not retry_errors:
+                done.add(record['id'])
+    return done
+
+
+def run_batch(manifest_path: str, output_path: str, jobs: int = 1,
+              retry_errors: bool = False, population_path: Optional[str] = None,
+              export_dir: Optional[str] = None, **options) -> dict:
+    """Process every manifest row across a process pool, appending JSONL records
+    
+    Rows already present in `output_path` are skipped, so an interrupted run
+    resumes where it stopped; when errors are retried the latest record for
+    an id supersedes earlier ones. `options` are passed to process_couple_audio.
+    
+    With `population_path` the population sketch there is updated from every
+    ok record and saved when the run ends; percentile tags rank against the
+    sketch as of each row's submission.
+    
+    With `export_dir` every new ok record is also appended to the
+    ResultStore there (rows skipped from the checkpoint are not re-exported).
+    """
+    population = PopulationSketches.load(population_path) if population_path else None
+    store = ResultStore(export_dir) if export_dir else None
+    quantizer_tables(population, options.get('quantizer', 'fixed'))
+    if options.get('quantizer') == 'percentile':
+        # Workers tag against a pickled snapshot; their own updates to it
+        # are discarded and the records are counted here instead
+        options = {**options, 'population': population}
+    
+    done = load_checkpoint(output_path, retry_errors)
+    counts = {'ok': 0, 'error': 0, 'skipped': 0, 'cache_hits': 0}
+    
+    # Terminate a partial last line so appended records stay parseable
+    if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
+        with open(output_path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            needs_newline = f.read(1) != b'\n'
+        if needs_newline:
+            with open(output_path, 'a', encoding='utf-8') as out:
+                out.write('\n')
+    
+    def write(out, record):
+        out.write(json.dumps(record, ensure_ascii=False) + '\n')
+        out.flush()
+        counts[record['status']] += 1
+        if record['status'] == 'ok' and record['result'].get('cache') == 'hit':
+            counts['cache_hits'] += 1
+        if population is not None and record['status'] == 'ok':
+            update_population(population, record['result'])
+        if store is not None and record['status'] == 'ok':
+            store.append(record['id'], record['result'])
+        print(f"[{record['status']}] {record['id']}")
+    
+    try:
+        with open(output_path, 'a', encoding='utf-8') as out, \
+                ProcessPoolExecutor(max_workers=max(1, jobs)) as executor:
+            pending = set()
+            for row in read_manifest(manifest_path):
+                if manifest_row_id(row) in done:
+                    counts['skipped'] += 1
+                    continue
+                pending.add(executor.submit(process_manifest_row, row, options))
+                
+                # Bound in-flight work so huge manifests are not queued up front
+                if len(pending) >= 2 * max(1, jobs):
+                    finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        write(out, future.result())
+            
+            for future in as_completed(pending):
+                write(out, future.result())
+    finally:
+        if population is not None:
+            population.save(population_path)
+        if store is not None:
+            store.close()
+    
+    return counts
+
+
+def add_population_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument('--population',
+                        help='Population sketch file (population_sketch.py) updated with every analysis')
+    parser.add_argument('--quantizer', choices=QUANTIZERS, default='fixed',
+                        help='Tag on fixed Hz / 0-1 scales, or by percentile in --population')
+
+
+def add_cache_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument('--cache', metavar='DIR',
+                        help='Result cache directory shared by workers (content-addressed, LRU)')
+    parser.add_argument('--cache-max-mb', type=float, default=512, help='Size limit of --cache')
+
+
+def open_cache(args: argparse.Namespace) -> Optional[ResultCache]:
+    return ResultCache(args.cache, int(args.cache_max_mb * 2**20)) if args.cache else None
+
+
+def add_export_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument('--export', metavar='DIR',
+                        help='Also append results to the columnar ResultStore in DIR (.npy shards for analytics)')
+
+
+def add_log_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument('--log-level', choices=LOG_LEVELS, default='INFO',
+                        help='Level of the JSON log lines on stderr (INFO includes per-stage timing spans)')
+
+
+def configure_logging(level: str):
+    """Send the couple_processor logger to stderr as bare JSON lines"""
+    if not log.handlers:
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        log.addHandler(handler)
+    log.setLevel(level)
+    log.propagate = False
+
+
+@contextmanager
+def deep_dive(profile_path: Optional[str] = None, trace_memory: int = 0):
+    """cProfile and/or tracemalloc around a block, reported on stderr
+    
+    Only the current process is covered: with a process pool (--workers)
+    the segment analysis itself runs outside the profile.
+    """
+    profiler = cProfile.Profile() if profile_path else None
+    if trace_memory:
+        tracemalloc.start()
+    if profiler is not None:
+        profiler.enable()
+    try:
+        yield
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(profile_path)
+            print(f"\nProfile saved to: {profile_path} (top 20 by cumulative time)", file=sys.stderr)
+            pstats.Stats(profiler, stream=sys.stderr).sort_stats('cumulative').print_stats(20)
+        if trace_memory:
+            # Lazy librosa/scipy submodule imports would otherwise top the list
+            snapshot = tracemalloc.take_snapshot().filter_traces([
+                tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+                tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+            ])
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"\nTraced memory: peak {peak / 2**20:.1f} MB, still allocated {current / 2**20:.1f} MB; "
+                  f"top {trace_memory} allocation sites:", file=sys.stderr)
+            for stat in snapshot.statistics('lineno')[:trace_memory]:
+                print(f"  {stat}", file=sys.stderr)
+
+
+def batch_main(argv: List[str]):
+    parser = argparse.ArgumentParser(
+        prog='couple_processor.py batch',
+        description='Process a manifest of couple recordings into a JSONL file',
+    )
+    parser.add_argument('manifest', help='CSV or JSONL manifest (path, name_a, job_a, accent_a, age_a, ..._b, optional id)')
+    parser.add_argument('--output', '-o', default='couple_results.jsonl', help='Output JSONL path (also the resume checkpoint)')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1, help='Recordings processed in parallel')
+    parser.add_argument('--retry-errors', action='store_true', help='Re-run rows recorded as errors')
+    parser.add_argument('--pitch-engine', choices=PITCH_ENGINES, default='pyin',
+                        help='Pitch tracker: pyin (reference) or the fast yin/acf backends')
+    parser.add_argument('--pitch-pass', choices=PITCH_PASSES, default='segment',
+                        help='Track pitch per segment or once over the whole recording')
+    parser.add_argument('--vad', action='store_true',
+                        help='Only track pitch where voice activity is detected (skips silences)')
+    parser.add_argument('--analysis-sr', type=int, default=DEFAULT_SR,
+                        help=f'Sample rate used for analysis (>= {MIN_ANALYSIS_SR}, e.g. 16000/22050 for speed)')
+    parser.add_argument('--feature-dir', help='Save each row\'s frame features as <id>.npz here (for rescore)')
+    add_export_arguments(parser)
+    add_population_arguments(parser)
+    add_cache_arguments(parser)
+    add_log_arguments(parser)
+    
+    args = parser.parse_args(argv)
+    configure_logging(args.log_level)
+    if args.feature_dir:
+        os.makedirs(args.feature_dir, exist_ok=True)
+    
+    counts = run_batch(
+        args.manifest, args.output,
+        jobs=args.jobs,
+        retry_errors=args.retry_errors,
+        population_path=args.population,
+        pitch_engine=args.pitch_engine,
+        pitch_pass=args.pitch_pass,
+        analysis_sr=args.analysis_sr,
+        vad=args.vad,
+        quantizer=args.quantizer,
+        export_dir=args.export,
+        cache=open_cache(args),
+        feature_dir=args.feature_dir,
+    )
+    
+    print(f"\nResults appended to: {args.output}")
+    print(f"OK: {counts['ok']}, Errors: {counts['error']}, Skipped (checkpoint): {counts['skipped']}")
+    if args.cache and counts['ok']:
+        print(f"Cache hits: {counts['cache_hits']}/{counts['ok']} ({counts['cache_hits'] / counts['ok']:.0%})")
+
+
+def rescore_main(argv: List[str]):
+    parser = argparse.ArgumentParser(
+        prog='couple_processor.py rescore',
+        description='Re-run scoring on saved feature stores (no audio decoding or pitch tracking)',
+    )
+    parser.add_argument('inputs', nargs='+', help='Feature stores (.npz) written with --save-features / --feature-dir')
+    parser.add_argument('--output', '-o', default='couple_rescored.jsonl', help='Output JSONL path')
+    add_export_arguments(parser)
+    add_population_arguments(parser)
+    add_log_arguments(parser)
+    
+    args = parser.parse_args(argv)
+    configure_logging(args.log_level)
+    population = PopulationSketches.load(args.population) if args.population else None
+    
+    counts = {'ok': 0, 'error': 0}
+    t0 = time.perf_counter()
+    with open(args.output, 'w', encoding='utf-8') as out, \
+            (ResultStore(args.export) if args.export else nullcontext()) as store:
+        for path in args.inputs:
+            record = {'id': os.path.splitext(os.path.basename(path))[0], 'path': path}
+            try:
+                result = rescore_feature_store(path, population=population, quantizer=args.quantizer)
+                record.update(status='ok', result=result_to_dict(result))
+            except Exception as e:
+                record.update(status='error', error=f"{type(e).__name__}: {e}")
+            out.write(json.dumps(record, ensure_ascii=False) + '\n')
+            counts[record['status']] += 1
+            if store is not None and record['status'] == 'ok':
+                store.append(record['id'], record['result'])
+    elapsed = time.perf_counter() - t0
+    if population is not None:
+        population.save(args.population)
+    
+    print(f"Rescored {len(args.inputs)} store(s) in {elapsed:.2f}s "
+          f"({elapsed / len(args.inputs) * 1000:.1f} ms each) -> {args.output}")
+    print(f"OK: {counts['ok']}, Errors: {counts['error']}")
+
+
+def add_prompt_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument('--prompt-style', choices=PROMPT_STYLES, default='full',
+                        help='LLM prompt template: full (essay-style) or compact (key=value lines)')
+
+
+def read_stored_results(path: str) -> Iterator[Tuple[str, dict]]:
+    """(id, result dict) for every completed analysis in a result file
+    
+    Reads a single result (.json), batch / rescore / serve records (JSONL
+    with id / status / result) or stream events (only final results).
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.endswith('.json'):
+            yield os.path.splitext(os.path.basename(path))[0], json.load(f)
+            return
+        for lineno, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if 'status' in record:
+                if record['status'] == 'ok':
+                    yield str(record['id']), record['result']
+            elif 'segment' in record:
+                # Partial stream events carry no scores
+                if 'result' in record:
+                    yield f"{path}:{lineno}", record['result']
+            else:
+                yield f"{path}:{lineno}", record
+
+
+def prompt_main(argv: List[str]):
+    parser = argparse.ArgumentParser(
+        prog='couple_processor.py prompt',
+        description='Render the LLM prompt from a stored result (no audio analysis)',
+    )
+    parser.add_argument('input', help='Result JSON, or batch / rescore / stream JSONL output')
+    parser.add_argument('--id', help='Record to render from a JSONL file (default: the first one)')
+    parser.add_argument('--compare', action='store_true',
+                        help='Print the size of every prompt style instead of the prompt')
+    add_prompt_arguments(parser)
+    
+    args = parser.parse_args(argv)
+    for result_id, result in read_stored_results(args.input):
+        if args.id is None or result_id == args.id:
+            break
+    else:
+        raise SystemExit(f"No result {args.id!r} in {args.input}" if args.id else f"No results in {args.input}")
+    
+    if not args.compare:
+        print(render_llm_prompt(result, args.prompt_style))
+        return
+    
+    baseline = None
+    for style in PROMPT_STYLES:
+        t0 = time.perf_counter()
+        prompt = render_llm_prompt(result, style)
+        elapsed = time.perf_counter() - t0
+        tokens = count_tokens(prompt)
+        baseline = baseline or tokens
+        print(f"{style:>8}: {len(prompt.encode('utf-8')):6,} bytes  {tokens:5,} tokens "
+              f"({tokens / baseline:.0%})  rendered in {elapsed * 1e6:.0f} us")
+
+
+def export_main(argv: List[str]):
+    parser = argparse.ArgumentParser(
+        prog='couple_processor.py export',
+        description='Append stored results (JSON / JSONL) to a columnar ResultStore',
+    )
+    parser.add_argument('store', help='ResultStore directory (created if missing)')
+    parser.add_argument('inputs', nargs='*', help='Result JSON, or batch / rescore / stream JSONL output')
+    parser.add_argument('--shard-rows', type=int, default=65536, help='Rows per .npy shard')
+    parser.add_argument('--compact', action='store_true',
+                        help='Afterwards merge small shards (no other writer may be active)')
+    
+    args = parser.parse_args(argv)
+    t0 = time.perf_counter()
+    exported = 0
+    with ResultStore(args.store, shard_rows=args.shard_rows) as store:
+        for path in args.inputs:
+            for result_id, result in read_stored_results(path):
+                store.append(result_id, result)
+                exported += 1
+    if args.compact:
+        store.compact()
+    print(f"Exported {exported:,} result(s) in {time.perf_counter() - t0:.2f}s -> {args.store} "
+          f"({len(store):,} rows in {len(store.shard_paths())} shard(s))")
+
+
+def stream_main(argv: List[str]):
+    parser = argparse.ArgumentParser(
+        prog='couple_processor.py stream',
+        description='Analyze a couple session as it is recorded, printing JSONL events',
+    )
+    parser.add_argument('input', help="Audio file to replay in chunks, or '-' for raw mono float32 PCM on stdin")
+    parser.add_argument('--analysis-sr', type=int, default=DEFAULT_SR,
+                        help='Analysis sample rate (stdin PCM must already be at this rate)')
+    parser.add_argument('--chunk-seconds', type=float, default=0.5, help='Chunk size when reading')
+    parser.add_argument('--pitch-engine', choices=PITCH_ENGINES, default='pyin',
+                        help='Pitch tracker: pyin (reference) or the fast yin/acf backends')
+    parser.add_argument('--vad', action='store_true',
+                        help='Only track pitch where voice activity is detected (skips silences)')
+    for side in ('a', 'b'):
+        for field, default in MANIFEST_USER_FIELDS.items():
+            parser.add_argument(f'--{field}-{side}',
+                                default=default if default is not None else f'User {side.upper()}',
+                                help=f'{field.capitalize()} of User {side.upper()}')
+    add_population_arguments(parser)
+    add_log_arguments(parser)
+    
+    args = parser.parse_args(argv)
+    configure_logging(args.log_level)
+    population = PopulationSketches.load(args.population) if args.population else None
+    
+    analyzer = StreamingCoupleAnalyzer(
+        {field: getattr(args, f'{field}_a') for field in MANIFEST_USER_FIELDS},
+        {field: getattr(args, f'{field}_b') for field in MANIFEST_USER_FIELDS},
+        sr=args.analysis_sr,
+        pitch_engine=args.pitch_engine,
+        population=population,
+        quantizer=args.quantizer,
+        vad=args.vad,
+    )
+    chunk_frames = max(1, int(args.chunk_seconds * args.analysis_sr))
+    
+    if args.input == '-':
+        chunk_bytes = chunk_frames * 4
+        chunks = iter(lambda: sys.stdin.buffer.read(chunk_bytes), b'')
+        chunks = (np.frombuffer(data[:len(data) // 4 * 4], dtype=np.float32) for data in chunks)
+    else:
+        y, _ = load_audio(args.input, sr=args.analysis_sr)
+        chunks = (y[i:i + chunk_frames] for i in range(0, len(y), chunk_frames))
+    
+    def emit(events):
+        for event in events:
+            print(json.dumps(stream_event_to_dict(event), ensure_ascii=False), flush=True)
+    
+    for chunk in chunks:
+        emit(analyzer.feed(chunk))
+    emit(analyzer.finish())
+    if population is not None:
+        population.save(args.population)
+
+
+# Per-job keys a worker accepts on top of the manifest row fields
+JOB_OPTIONS = ('pitch_engine', 'pitch_pass', 'analysis_sr', 'vad', 'quantizer')
+
+
+def warm_up(sr: int = DEFAULT_SR, pitch_engine: str = 'pyin'):
+    """Run a synthetic voiced segment through analyze_segment
+    
+    Triggers numba JIT compilation and librosa's lazy submodule imports so
+    the first real job does not pay for them.
+    """
+    t = np.arange(sr) / sr
+    y = (0.1 * np.sin(2 * np.pi * 150 * t)).astype(np.float32)
+    analyze_segment(y, sr, pitch_engine=pitch_engine)
+
+
+def handle_job_line(line: str, options: dict, population_path: Optional[str] = None) -> str:
+    """Process one JSON job (a manifest row) and return its JSON record
+    
+    options['population'], if set, is updated in place by the analysis and
+    saved to `population_path` after every successful job; options['cache']
+    hit rate is logged after every job.
+    """
+    try:
+        job = json.loads(line)
+    except json.JSONDecodeError as e:
+        return json.dumps({'id': None, 'status': 'error', 'error': f"JSONDecodeError: {e}"})
+    if not isinstance(job, dict):
+        return json.dumps({'id': None, 'status': 'error',
+                           'error': f"TypeError: Job must be a JSON object, not {type(job).__name__}"})
+    
+    job_options = {**options, **{key: job[key] for key in JOB_OPTIONS if key in job}}
+    # Progress prints must not interleave with the JSON protocol on stdout
+    with redirect_stdout(sys.stderr):
+        record = process_manifest_row(job, job_options)
+    if population_path and record['status'] == 'ok':
+        options['population'].save(population_path)
+    if options.get('cache') is not None:
+        log.info(json.dumps({'event': 'cache', **options['cache'].stats()}))
+    return json.dumps(record, ensure_ascii=False)
+
+
+class _JobHandler(socketserver.StreamRequestHandler):
+    """One JSON job per line in, one JSON record per line out"""
+    
+    def handle(self):
+        for raw in self.rfile:
+            line = raw.decode('utf-8').strip()
+            if line:
+                response = handle_job_line(line, self.server.job_options, self.server.population_path)
+                self.wfile.write((response + '\n').encode('utf-8'))
+                self.wfile.flush()
+
+
+def serve_main(argv: List[str]):
+    parser = argparse.ArgumentParser(
+        prog='couple_processor.py serve',
+        description='Long-lived warm worker: JSON job lines in (stdin or Unix socket), JSON records out',
+    )
+    parser.add_argument('--socket', help='Listen on this Unix socket path instead of stdin/stdout')
+    parser.add_argument('--pitch-engine', choices=PITCH_ENGINES, default='pyin',
+                        help='Default pitch tracker (jobs may override with "pitch_engine")')
+    parser.add_argument('--pitch-pass', choices=PITCH_PASSES, default='segment',
+                        help='Default pitch pass (jobs may override with "pitch_pass")')
+    parser.add_argument('--vad', action='store_true',
+                        help='Gate pitch tracking with voice activity detection (jobs may override with "vad")')
+    parser.add_argument('--analysis-sr', type=int, default=DEFAULT_SR,
+                        help='Default analysis rate (jobs may override with "analysis_sr")')
+    add_population_arguments(parser)
+    add_cache_arguments(parser)
+    add_log_arguments(parser)
+    
+    args = parser.parse_args(argv)
+    configure_logging(args.log_level)
+    options = {
+        'pitch_engine': args.pitch_engine,
+        'pitch_pass': args.pitch_pass,
+        'analysis_sr': args.analysis_sr,
+        'vad': args.vad,
+        'quantizer': args.quantizer,
+        # One sketch file per worker; combine with `population_sketch.py merge`
+        'population': PopulationSketches.load(args.population) if args.population else None,
+        'cache': open_cache(args),
+    }
+    
+    warm_up(args.analysis_sr, args.pitch_engine)
+    print("Worker ready", file=sys.stderr, flush=True)
+    
+    if args.socket is None:
+        for line in sys.stdin:
+            if line.strip():
+                print(handle_job_line(line, options, args.population), flush=True)
+        return
+    
+    if os.path.exists(args.socket):
+        os.unlink(args.socket)
+    with socketserver.UnixStreamServer(args.socket, _JobHandler) as server:
+        server.job_options = options
+        server.population_path = args.population
+        try:
+            server.serve_forever()
+        finally:
+            os.unlink(args.socket)
 
 
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] == 'batch':
+        return batch_main(sys.argv[2:])
+    if len(sys.argv) > 1 and sys.argv[1] == 'stream':
+        return stream_main(sys.argv[2:])
+    if len(sys.argv) > 1 and sys.argv[1] == 'serve':
+        return serve_main(sys.argv[2:])
+    if len(sys.argv) > 1 and sys.argv[1] == 'rescore':
+        return rescore_main(sys.argv[2:])
+    if len(sys.argv) > 1 and sys.argv[1] == 'prompt':
+        return prompt_main(sys.argv[2:])
+    if len(sys.argv) > 1 and sys.argv[1] == 'export':
+        return export_main(sys.argv[2:])
+    
     parser = argparse.ArgumentParser(description='EtchVox Couple Audio Processor')
-    parser.add_argument('input', help='Input WAV file path')
+    parser.add_argument('input', help="Recording to analyze (WAV/FLAC/OGG, WebM/Opus...), or '-' to read its bytes from stdin")
     parser.add_argument('--output', '-o', default='couple_result.json', help='Output JSON path')
     parser.add_argument('--name-a', default='User A', help='Name of User A')
     parser.add_argument('--name-b', default='User B', help='Name of User B')
@@ -512,8 +2421,35 @@ def main():
     parser.add_argument('--age-a', default='', help='Age of User A')
     parser.add_argument('--age-b', default='', help='Age of User B')
     parser.add_argument('--prompt-only', action='store_true', help='Only output LLM prompt')
+    parser.add_argument('--embed-prompt', action='store_true',
+                        help='Store the rendered LLM prompt in the output JSON (llm_prompt)')
+    add_prompt_arguments(parser)
+    add_export_arguments(parser)
+    parser.add_argument('--pitch-engine', choices=PITCH_ENGINES, default='pyin',
+                        help='Pitch tracker: pyin (reference) or the fast yin/acf backends')
+    parser.add_argument('--pitch-pass', choices=PITCH_PASSES, default='segment',
+                        help='Track pitch per segment or once over the whole recording')
+    parser.add_argument('--vad', action='store_true',
+                        help='Only track pitch where voice activity is detected (skips silences)')
+    parser.add_argument('--analysis-sr', type=int, default=DEFAULT_SR,
+                        help=f'Sample rate used for analysis (>= {MIN_ANALYSIS_SR}, e.g. 16000/22050 for speed)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Analyze segments concurrently on N workers')
+    parser.add_argument('--pool', choices=POOLS, default='process',
+                        help='Executor used when --workers > 1')
+    parser.add_argument('--profile', metavar='PATH',
+                        help='Write a cProfile dump to PATH and print the top functions to stderr')
+    parser.add_argument('--trace-memory', type=int, nargs='?', const=10, default=0, metavar='N',
+                        help='Trace allocations with tracemalloc and print the top N sites (default 10)')
+    parser.add_argument('--save-features', metavar='PATH',
+                        help='Save the frame features as a .npz feature store for `rescore`')
+    add_population_arguments(parser)
+    add_cache_arguments(parser)
+    add_log_arguments(parser)
     
     args = parser.parse_args()
+    configure_logging(args.log_level)
+    population = PopulationSketches.load(args.population) if args.population else None
     
     user_a_info = {
         'name': args.name_a,
@@ -528,22 +2464,34 @@ def main():
         'age': args.age_b,
     }
     
-    result = process_couple_audio(args.input, user_a_info, user_b_info)
+    with deep_dive(args.profile, args.trace_memory):
+        result = process_couple_audio(
+            args.input, user_a_info, user_b_info,
+            pitch_engine=args.pitch_engine,
+            pitch_pass=args.pitch_pass,
+            workers=args.workers,
+            pool=args.pool,
+            analysis_sr=args.analysis_sr,
+            vad=args.vad,
+            population=population,
+            quantizer=args.quantizer,
+            cache=open_cache(args),
+            features_path=args.save_features,
+            audio_bytes=sys.stdin.buffer.read() if args.input == '-' else None,
+        )
+    if population is not None:
+        population.save(args.population)
     
     if args.prompt_only:
-        print(generate_llm_prompt(result))
+        print(generate_llm_prompt(result, args.prompt_style))
     else:
-        output = {
-            'user_a': result.user_a,
-            'user_b': result.user_b,
-            'together': result.together,
-            'delta': result.delta,
-            'matrix_score': result.matrix_score,
-            'llm_prompt': generate_llm_prompt(result),
-        }
+        output = result_to_dict(result, args.prompt_style if args.embed_prompt else None)
         
         with open(args.output, 'w', encoding='utf-8') as f:
             json.dump(output, f, indent=2, ensure_ascii=False)
+        if args.export:
+            with ResultStore(args.export) as store:
+                store.append(os.path.splitext(os.path.basename(args.input))[0], output)
         
         print(f"\nResults saved to: {args.output}")
         print(f"Matrix Score: {result.matrix_score}/100")
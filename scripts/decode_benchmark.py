@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Upload Decoding Benchmark
+Times decoding of browser recordings (WebM/Opus, as stored by the upload
+route) to analysis-ready mono float32, per file:
+
+    audioread   the previous path: librosa.load through audioread (an ffmpeg
+                subprocess) at the native rate, then librosa.resample
+    file        audio_decoder.decode_audio on the path (PyAV in-process,
+                float planes copied into one buffer, one soxr pass)
+    bytes       decode_audio on the file's bytes already in memory, as a
+                worker handed the upload directly
+
+and reports how closely the in-process waveform matches the audioread one.
+Without inputs the synthetic benchmark session is encoded to WebM/Opus.
+
+Dependencies:
+    pip install librosa numpy scipy av
+    (the audioread path also needs ffmpeg on PATH)
+
+Usage:
+    python decode_benchmark.py recordings/*.webm --sr 16000 --json decode.json
+    python decode_benchmark.py --repeat 10
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from benchmark_couple_stages import synthesize
+from couple_processor import ANALYSIS_END, DEFAULT_SR, librosa
+from audio_decoder import av, decode_audio
+
+# Opus always runs at 48 kHz; browsers record mono speech at about this bitrate
+OPUS_SR = 48000
+OPUS_BITRATE = 64000
+
+
+def encode_webm(y: np.ndarray, sr: int, path: str):
+    """Write mono float `y` as WebM/Opus, like a MediaRecorder upload"""
+    y = librosa.resample(y, orig_sr=sr, target_sr=OPUS_SR) if sr != OPUS_SR else y
+    with av.open(path, 'w', format='webm') as container:
+        stream = container.add_stream('libopus', rate=OPUS_SR, layout='mono')
+        stream.bit_rate = OPUS_BITRATE
+        frame = av.AudioFrame.from_ndarray(y.astype(np.float32)[np.newaxis], format='flt', layout='mono')
+        frame.sample_rate = OPUS_SR
+        frame.pts = 0
+        # PyAV re-chunks the signal into the encoder's 20 ms frames
+        container.mux(stream.encode(frame))
+        container.mux(stream.encode(None))
+
+
+def decode_audioread(path: str, sr: int) -> np.ndarray:
+    y, native_sr = librosa.load(path, sr=None, mono=True, duration=ANALYSIS_END)
+    return librosa.resample(y, orig_sr=native_sr, target_sr=sr) if native_sr != sr else y
+
+
+def median_seconds(fn, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return statistics.median(times)
+
+
+def agreement(reference: np.ndarray, candidate: np.ndarray) -> dict:
+    """Length difference, max abs difference and SNR (dB) over the common span"""
+    n = min(len(reference), len(candidate))
+    error = reference[:n] - candidate[:n]
+    noise = float(np.sum(error.astype(np.float64) ** 2))
+    signal = float(np.sum(reference[:n].astype(np.float64) ** 2))
+    return {
+        'length_diff': len(candidate) - len(reference),
+        'max_abs_diff': float(np.max(np.abs(error))) if n else 0.0,
+        'snr_db': 10 * np.log10(signal / noise) if noise > 0 else float('inf'),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time in-process upload decoding against the audioread path')
+    parser.add_argument('inputs', nargs='*', help='Recordings (default: the synthetic session as WebM/Opus)')
+    parser.add_argument('--sr', type=int, default=DEFAULT_SR, help='Analysis sample rate to decode to')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed decodes per path (median is reported)')
+    parser.add_argument('--json', help='Optional path for the full JSON report')
+
+    args = parser.parse_args()
+    if av is None:
+        sys.exit("PyAV is not installed: pip install av")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        inputs = args.inputs
+        if not inputs:
+            synthetic = os.path.join(tmp, 'session.webm')
+            encode_webm(synthesize(DEFAULT_SR)[0], DEFAULT_SR, synthetic)
+            inputs = [synthetic]
+
+        report = {}
+        for path in inputs:
+            with open(path, 'rb') as f:
+                data = f.read()
+            paths = {
+                'audioread': lambda: decode_audioread(path, args.sr),
+                'file': lambda: decode_audio(path, args.sr, ANALYSIS_END)[0],
+                'bytes': lambda: decode_audio(data, args.sr, ANALYSIS_END)[0],
+            }
+            # Untimed first decode of each path, which is also the comparison
+            outputs = {}
+            for name, fn in paths.items():
+                try:
+                    outputs[name] = fn()
+                except Exception as e:
+                    print(f"{name}: {type(e).__name__}: {e}", file=sys.stderr)
+            seconds = {name: median_seconds(paths[name], args.repeat) for name in outputs}
+
+            entry = {'bytes': len(data), 'seconds': seconds}
+            if 'audioread' in outputs:
+                entry['speedup'] = {name: seconds['audioread'] / seconds[name]
+                                    for name in outputs if name != 'audioread'}
+                entry['agreement'] = {name: agreement(outputs['audioread'], outputs[name])
+                                      for name in outputs if name != 'audioread'}
+            report[path] = entry
+
+            print(f"\n=== {os.path.basename(path)} ({len(data) / 1024:.0f} KB -> {args.sr} Hz) ===")
+            for name, value in seconds.items():
+                line = f"  {name:>9}: {value * 1000:8.1f} ms"
+                if name in entry.get('speedup', {}):
+                    match = entry['agreement'][name]
+                    line += (f"  x{entry['speedup'][name]:.1f}, SNR {match['snr_db']:.1f} dB, "
+                             f"{match['length_diff']:+d} samples")
+                print(line)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport saved to: {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Pitch Engine Accuracy vs Speed Report
+Runs every couple_processor pitch engine on the same recordings and compares
+the per-segment pitch / pitch_std against the pyin reference.
+
+Dependencies:
+    pip install librosa numpy scipy
+
+Usage:
+    python pitch_engine_report.py input.wav [more.wav ...] --json report.json
+"""
+
+import argparse
+import json
+import time
+import numpy as np
+from typing import Optional
+
+from couple_processor import (
+    DEFAULT_SR, PITCH_ENGINES, SEGMENTS, ANALYSIS_END,
+    extract_audio_segment, track_pitch, librosa,
+)
+
+REFERENCE_ENGINE = 'pyin'
+
+
+def summarize_f0(f0: np.ndarray) -> dict:
+    """The statistics analyze_segment keeps from a pitch track"""
+    valid_f0 = f0[~np.isnan(f0)]
+    return {
+        'pitch': float(np.median(valid_f0)) if len(valid_f0) > 0 else None,
+        'pitch_std': float(np.std(valid_f0)) if len(valid_f0) > 0 else None,
+        'voiced_ratio': float(len(valid_f0) / len(f0)) if len(f0) > 0 else 0.0,
+    }
+
+
+def cents(a: Optional[float], b: Optional[float]) -> Optional[float]:
+    """Signed interval from b to a in cents"""
+    if a is None or b is None:
+        return None
+    return float(1200 * np.log2(a / b))
+
+
+def run_engines(y: np.ndarray, sr: int, engines: list) -> dict:
+    """Time each engine on each segment and collect its summary"""
+    rows = {}
+    for engine in engines:
+        # Untimed warm-up so JIT compilation is not billed to the first segment
+        track_pitch(y[:sr], sr, engine)
+
+        rows[engine] = {}
+        for name, (start, end) in SEGMENTS.items():
+            segment = extract_audio_segment(y, sr, start, end)
+            t0 = time.perf_counter()
+            f0, voiced_flag, _ = track_pitch(segment, sr, engine)
+            elapsed = time.perf_counter() - t0
+            rows[engine][name] = {
+                **summarize_f0(f0),
+                'seconds': elapsed,
+                'voiced_flag': voiced_flag,
+            }
+    return rows
+
+
+def compare(rows: dict) -> dict:
+    """Accuracy and speed of every engine relative to the reference"""
+    reference = rows[REFERENCE_ENGINE]
+    report = {}
+    for engine, segments in rows.items():
+        total = sum(seg['seconds'] for seg in segments.values())
+        ref_total = sum(seg['seconds'] for seg in reference.values())
+        per_segment = {}
+        for name, seg in segments.items():
+            ref = reference[name]
+            same_len = len(seg['voiced_flag']) == len(ref['voiced_flag'])
+            per_segment[name] = {
+                'pitch': seg['pitch'],
+                'pitch_std': seg['pitch_std'],
+                'pitch_error_cents': cents(seg['pitch'], ref['pitch']),
+                'pitch_std_delta': (
+                    seg['pitch_std'] - ref['pitch_std']
+                    if seg['pitch_std'] is not None and ref['pitch_std'] is not None else None
+                ),
+                'voicing_agreement': (
+                    float(np.mean(seg['voiced_flag'] == ref['voiced_flag'])) if same_len else None
+                ),
+                'seconds': seg['seconds'],
+            }
+        errors = [abs(s['pitch_error_cents']) for s in per_segment.values()
+                  if s['pitch_error_cents'] is not None]
+        report[engine] = {
+            'total_seconds': total,
+            'speedup': ref_total / total if total > 0 else None,
+            'mean_abs_error_cents': float(np.mean(errors)) if errors else None,
+            'segments': per_segment,
+        }
+    return report
+
+
+def print_report(path: str, report: dict):
+    print(f"\n=== {path} ===")
+    print(f"{'engine':<6} {'segment':<14} {'pitch':>8} {'std':>7} {'err(c)':>8} {'voicing':>8} {'ms':>8}")
+    for engine, summary in report.items():
+        for name, seg in summary['segments'].items():
+            pitch = f"{seg['pitch']:.1f}" if seg['pitch'] is not None else '-'
+            std = f"{seg['pitch_std']:.2f}" if seg['pitch_std'] is not None else '-'
+            err = f"{seg['pitch_error_cents']:+.1f}" if seg['pitch_error_cents'] is not None else '-'
+            agree = f"{seg['voicing_agreement']:.0%}" if seg['voicing_agreement'] is not None else '-'
+            print(f"{engine:<6} {name:<14} {pitch:>8} {std:>7} {err:>8} {agree:>8} {seg['seconds'] * 1000:>8.0f}")
+        err = summary['mean_abs_error_cents']
+        err_text = f"{err:.1f} cents" if err is not None else '-'
+        print(f"{engine:<6} {'TOTAL':<14} speedup x{summary['speedup']:.1f}, mean |error| {err_text}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare couple_processor pitch engines')
+    parser.add_argument('inputs', nargs='+', help='Audio files to analyze')
+    parser.add_argument('--engines', nargs='+', choices=PITCH_ENGINES, default=list(PITCH_ENGINES),
+                        help='Engines to compare (pyin is always included as reference)')
+    parser.add_argument('--sr', type=int, default=DEFAULT_SR, help='Analysis sample rate')
+    parser.add_argument('--json', help='Optional path for the full JSON report')
+
+    args = parser.parse_args()
+    engines = [REFERENCE_ENGINE] + [e for e in args.engines if e != REFERENCE_ENGINE]
+
+    full_report = {}
+    for path in args.inputs:
+        y, sr = librosa.load(path, sr=args.sr, mono=True, duration=ANALYSIS_END)
+        report = compare(run_engines(y, sr, engines))
+        print_report(path, report)
+        full_report[path] = report
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(full_report, f, indent=2)
+        print(f"\nReport saved to: {args.json}")
+
+
+if __name__ == '__main__':
+    main()
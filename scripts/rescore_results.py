@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Bulk Re-scoring of Stored Couple Results
+Recomputes deltas, matrix scores and SCM profiles for stored couple_processor
+outputs after the scoring weights or the SCMAnalyzer tables change, and
+writes a diff report of every couple whose scores moved.
+
+Stored results are loaded once into columns (metrics and together blocks as
+float64, job / accent integer-coded against a vocabulary) and re-scored with
+the vectorized SCMAnalyzer.analyze_batch / calculate_matrix_scores, so the
+scoring cost is a handful of NumPy passes however many couples there are.
+
+Inputs can be single result files (*.json), batch / rescore output records
+(JSONL with id / status / result) and stream output (JSONL events; only the
+final 'result' event is used).
+
+Dependencies:
+    pip install librosa numpy scipy
+
+Usage:
+    python rescore_results.py results.jsonl more/*.json --output diff.jsonl --summary diff_summary.json
+    python rescore_results.py --synthetic 2000000   # timing on generated columns
+"""
+
+import argparse
+import json
+import time
+import numpy as np
+
+from couple_processor import SCMAnalyzer, calculate_matrix_scores, metric_deltas, read_stored_results
+
+SIDES = ('a', 'b')
+METRICS = ('pitch', 'speed', 'volume', 'tone')
+SCM_FIELDS = ('competence', 'warmth', 'archetype')
+
+
+class StoredResults:
+    """
+    Stored couple results as columns. Keys:
+        id                          object array
+        {side}_{metric}             float64 (side a/b, metric pitch/speed/volume/tone)
+        {side}_job, {side}_accent   int32 codes into self.jobs / self.accents
+        {side}_competence/_warmth   int64 stored SCM scores
+        {side}_archetype            int8 index into SCMAnalyzer.ARCHETYPES (-1: unknown label)
+        delta_{metric}              float64 stored deltas
+        harmony_score, sync_rate    float64
+        matrix_score                int64
+    """
+
+    def __init__(self, columns: dict, jobs: list, accents: list):
+        self.columns = columns
+        self.jobs = jobs
+        self.accents = accents
+
+    def __len__(self):
+        return len(self.columns['id'])
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+
+def _number(value) -> float:
+    return float('nan') if value is None else float(value)
+
+
+def load_results(paths: list) -> StoredResults:
+    """Read every stored result into StoredResults columns"""
+    lists = {name: [] for name in (
+        ['id', 'harmony_score', 'sync_rate', 'matrix_score']
+        + [f'delta_{metric}' for metric in METRICS]
+        + [f'{side}_{field}' for side in SIDES
+           for field in METRICS + ('job', 'accent') + SCM_FIELDS]
+    )}
+    vocab = {'job': {}, 'accent': {}}
+    archetype_index = {label: i for i, label in enumerate(SCMAnalyzer.ARCHETYPES)}
+
+    for path in paths:
+        for result_id, result in read_stored_results(path):
+            lists['id'].append(result_id)
+            together = result['together']
+            lists['harmony_score'].append(_number(together['harmony_score']))
+            lists['sync_rate'].append(_number(together['sync_rate']))
+            lists['matrix_score'].append(result['matrix_score'])
+            for metric in METRICS:
+                lists[f'delta_{metric}'].append(_number(result['delta'][metric]))
+            for side in SIDES:
+                user = result[f'user_{side}']
+                for metric in METRICS:
+                    lists[f'{side}_{metric}'].append(_number(user['metrics'][metric]))
+                for field, default in (('job', 'other'), ('accent', 'unknown')):
+                    codes = vocab[field]
+                    lists[f'{side}_{field}'].append(codes.setdefault(user.get(field, default), len(codes)))
+                scm = user['scm']
+                lists[f'{side}_competence'].append(scm['competence'])
+                lists[f'{side}_warmth'].append(scm['warmth'])
+                lists[f'{side}_archetype'].append(archetype_index.get(scm['archetype'], -1))
+
+    dtypes = {'id': object, 'matrix_score': np.int64}
+    for side in SIDES:
+        dtypes.update({f'{side}_job': np.int32, f'{side}_accent': np.int32,
+                       f'{side}_competence': np.int64, f'{side}_warmth': np.int64,
+                       f'{side}_archetype': np.int8})
+    columns = {name: np.array(values, dtype=dtypes.get(name, np.float64))
+               for name, values in lists.items()}
+    return StoredResults(columns, list(vocab['job']), list(vocab['accent']))
+
+
+def rescore(stored: StoredResults) -> dict:
+    """New score columns, keyed like the stored ones"""
+    c = stored.columns
+    metrics = {side: {metric: c[f'{side}_{metric}'] for metric in METRICS} for side in SIDES}
+    new = {f'delta_{metric}': values
+           for metric, values in metric_deltas(metrics['a'], metrics['b']).items()}
+    new['matrix_score'] = calculate_matrix_scores(metrics['a'], metrics['b'],
+                                                  c['harmony_score'], c['sync_rate'])
+    for side in SIDES:
+        scm = SCMAnalyzer.analyze_batch(
+            c[f'{side}_job'], stored.jobs, c[f'{side}_accent'], stored.accents,
+            c[f'{side}_speed'], c[f'{side}_volume'], c[f'{side}_tone'],
+        )
+        new.update({f'{side}_{field}': values for field, values in scm.items()})
+    return new
+
+
+def changed_mask(old: np.ndarray, new: np.ndarray) -> np.ndarray:
+    if old.dtype.kind == 'f':
+        return ~((old == new) | (np.isnan(old) & np.isnan(new)))
+    return old != new
+
+
+def diff_report(stored: StoredResults, new: dict, output_path: str) -> dict:
+    """Write one JSON line per changed couple to `output_path`; return the summary"""
+    changed = {name: changed_mask(stored[name], values) for name, values in new.items()}
+    any_changed = np.logical_or.reduce(list(changed.values()))
+
+    def value(columns, name, i):
+        if name.endswith('_archetype'):
+            index = int(columns[name][i])
+            return SCMAnalyzer.ARCHETYPES[index] if index >= 0 else None
+        return columns[name][i].item()
+
+    with open(output_path, 'w', encoding='utf-8') as out:
+        for i in np.flatnonzero(any_changed):
+            record = {'id': stored['id'][i]}
+            for name, mask in changed.items():
+                if mask[i]:
+                    record[name] = [value(stored, name, i), value(new, name, i)]
+            out.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+    shift = new['matrix_score'] - stored['matrix_score']
+    shifts, counts = np.unique(shift[shift != 0], return_counts=True)
+    return {
+        'results': len(stored),
+        'changed': int(any_changed.sum()),
+        'changed_by_field': {name: int(mask.sum()) for name, mask in changed.items()},
+        'matrix_score_shift': {str(s): int(n) for s, n in zip(shifts.tolist(), counts.tolist())},
+    }
+
+
+def synthetic_results(n: int, seed: int = 0) -> StoredResults:
+    """n random couples over the real job / accent vocabularies"""
+    rng = np.random.default_rng(seed)
+    jobs = list(SCMAnalyzer.JOB_SCORES) + ['plumber']  # one job outside the table
+    accents = list(SCMAnalyzer.ACCENT_MODS)
+    columns = {
+        'id': np.arange(n).astype(str).astype(object),
+        'harmony_score': rng.uniform(0, 100, n),
+        'sync_rate': rng.uniform(0, 1, n),
+        'matrix_score': np.zeros(n, dtype=np.int64),
+    }
+    for side in SIDES:
+        columns[f'{side}_pitch'] = rng.uniform(80, 300, n)
+        columns[f'{side}_speed'] = rng.uniform(0, 1, n)
+        columns[f'{side}_volume'] = rng.uniform(0, 1, n)
+        columns[f'{side}_tone'] = rng.uniform(300, 4000, n)
+        columns[f'{side}_job'] = rng.integers(0, len(jobs), n, dtype=np.int32)
+        columns[f'{side}_accent'] = rng.integers(0, len(accents), n, dtype=np.int32)
+        columns[f'{side}_competence'] = np.zeros(n, dtype=np.int64)
+        columns[f'{side}_warmth'] = np.zeros(n, dtype=np.int64)
+        columns[f'{side}_archetype'] = np.full(n, -1, dtype=np.int8)
+    for metric in METRICS:
+        columns[f'delta_{metric}'] = np.abs(columns[f'a_{metric}'] - columns[f'b_{metric}'])
+    return StoredResults(columns, jobs, accents)
+
+
+def scalar_row(stored: StoredResults, i: int) -> dict:
+    """Row i scored with the per-result SCMAnalyzer.analyze / calculate_matrix_score"""
+    from couple_processor import AcousticMetrics, TogetherMetrics, calculate_matrix_score
+
+    c = stored.columns
+    users, row = {}, {}
+    for side in SIDES:
+        metrics = {metric: float(c[f'{side}_{metric}'][i]) for metric in METRICS}
+        scm = SCMAnalyzer.analyze(
+            stored.jobs[c[f'{side}_job'][i]], stored.accents[c[f'{side}_accent'][i]],
+            AcousticMetrics(pitch_std=0.0, volume_std=0.0, **metrics),
+        )
+        users[side] = {'metrics': metrics}
+        row.update({f'{side}_{field}': value for field, value in scm.items()})
+    together = TogetherMetrics(harmony_score=float(c['harmony_score'][i]), sync_rate=float(c['sync_rate'][i]),
+                               dominance_a=0.5, dominance_b=0.5, blend_quality='')
+    row['matrix_score'] = calculate_matrix_score(users['a'], users['b'], together)
+    return row
+
+
+def check_against_scalar(stored: StoredResults, new: dict, sample: int) -> tuple:
+    """(mismatching rows, scalar seconds per row) over the first `sample` rows"""
+    mismatches = 0
+    t0 = time.perf_counter()
+    for i in range(min(sample, len(stored))):
+        expected = scalar_row(stored, i)
+        for name, value in expected.items():
+            got = new[name][i]
+            if name.endswith('_archetype'):
+                got = SCMAnalyzer.ARCHETYPES[got]
+            if got != value:
+                mismatches += 1
+                break
+    return mismatches, (time.perf_counter() - t0) / max(1, min(sample, len(stored)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Re-score stored couple results and report what changed')
+    parser.add_argument('inputs', nargs='*', help='Result files: *.json, or JSONL batch / rescore / stream output')
+    parser.add_argument('--output', '-o', default='rescore_diff.jsonl',
+                        help='Diff report: one JSON line per couple whose scores changed')
+    parser.add_argument('--summary', help='Also write the summary (counts, matrix score shifts) as JSON')
+    parser.add_argument('--synthetic', type=int, metavar='N',
+                        help='Score N generated couples instead of INPUTS and compare against the scalar path')
+    parser.add_argument('--check', type=int, default=10000, metavar='N',
+                        help='With --synthetic, rows re-scored one by one for the comparison')
+
+    args = parser.parse_args()
+    if not args.inputs and not args.synthetic:
+        parser.error('give result files or --synthetic N')
+
+    t0 = time.perf_counter()
+    stored = synthetic_results(args.synthetic) if args.synthetic else load_results(args.inputs)
+    load_seconds = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    new = rescore(stored)
+    rescore_seconds = time.perf_counter() - t0
+
+    print(f"Loaded {len(stored):,} results in {load_seconds:.2f}s, "
+          f"re-scored in {rescore_seconds:.3f}s "
+          f"({len(stored) / max(rescore_seconds, 1e-9):,.0f} couples/s)")
+
+    if args.synthetic:
+        mismatches, per_row = check_against_scalar(stored, new, args.check)
+        print(f"Scalar path: {per_row * 1e6:.1f} us/couple "
+              f"(~{per_row * len(stored):.1f}s for all {len(stored):,}), "
+              f"{mismatches} mismatch(es) in {min(args.check, len(stored)):,} rows")
+        return
+
+    summary = diff_report(stored, new, args.output)
+    summary.update(load_seconds=load_seconds, rescore_seconds=rescore_seconds)
+    if args.summary:
+        with open(args.summary, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2)
+
+    print(f"Changed: {summary['changed']:,} of {summary['results']:,} -> {args.output}")
+    for name, count in summary['changed_by_field'].items():
+        if count:
+            print(f"  {name}: {count:,}")
+    if summary['matrix_score_shift']:
+        print("Matrix score shifts: " + ', '.join(
+            f"{int(shift):+d} x{count:,}" for shift, count in summary['matrix_score_shift'].items()))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+VAD-Gated Pitch Tracking Speed / Agreement Report
+Runs process_couple_audio with and without voice activity gating (--vad) on
+the same recordings and reports wall time, time spent in pitch tracking, the
+active fraction of the session and the drift of every metric.
+
+Without inputs a synthetic session is used: the benchmark voices, but each
+partner only speaks for --speech-fraction of every SEGMENTS window, as in
+real sessions where most of a window is silence around a short line.
+
+Dependencies:
+    pip install librosa numpy scipy
+
+Usage:
+    python vad_report.py input.wav [more.wav ...] --json report.json
+    python vad_report.py --speech-fraction 0.4 --pitch-engine pyin
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from analysis_sr_report import USER_INFO_A, USER_INFO_B, flatten_result, drift
+from benchmark_couple_stages import NOISE_FLOOR, VOICE_A, VOICE_B, voice
+from couple_processor import (
+    ANALYSIS_END, DEFAULT_SR, PITCH_ENGINES, SEGMENTS,
+    detect_voice_activity, extract_audio_segment, load_audio, process_couple_audio, sf,
+)
+
+# Who speaks in each window of the synthetic session
+SPEAKERS = {
+    'calibration_a': (VOICE_A,),
+    'calibration_b': (VOICE_B,),
+    'unison': (VOICE_A, VOICE_B),
+    'stress_a': (VOICE_A,),
+    'stress_b': (VOICE_B,),
+    'alternating': (VOICE_A,),
+}
+
+
+def sparse_session(sr: int, speech_fraction: float, seed: int = 0) -> np.ndarray:
+    """SEGMENTS-shaped session where speech fills `speech_fraction` of each window"""
+    rng = np.random.default_rng(seed)
+    y = NOISE_FLOOR * rng.standard_normal(int(ANALYSIS_END * sr))
+    for name, (start, end) in SEGMENTS.items():
+        length = (end - start) * speech_fraction
+        # Speech starts a little into the window, as after a prompt
+        offset = int((start + 0.1 * (end - start) * (1 - speech_fraction)) * sr)
+        line = sum(voice(sr, length, rng=rng, **speaker) for speaker in SPEAKERS[name])
+        y[offset:offset + len(line)] += line
+    return np.clip(y, -1, 1).astype(np.float32)
+
+
+def pitch_seconds(timings: dict) -> float:
+    """Seconds in every '...pitch' span (feature pass, segments, unison)"""
+    return sum(seconds for name, seconds in timings.items() if name.rsplit('.', 1)[-1] == 'pitch')
+
+
+def run(path: str, pitch_engine: str, vad: bool) -> tuple:
+    # Silence the per-stage progress prints
+    with contextlib.redirect_stdout(io.StringIO()):
+        t0 = time.perf_counter()
+        result = process_couple_audio(path, USER_INFO_A, USER_INFO_B, pitch_engine=pitch_engine, vad=vad)
+        elapsed = time.perf_counter() - t0
+    return flatten_result(result), elapsed, pitch_seconds(result.timings)
+
+
+def active_fraction(path: str) -> float:
+    y, sr = load_audio(path)
+    return float(np.mean(detect_voice_activity(extract_audio_segment(y, sr, 0, ANALYSIS_END), sr)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure speed and metric agreement of VAD-gated pitch tracking')
+    parser.add_argument('inputs', nargs='*', help='Audio files (default: a synthetic sparse session)')
+    parser.add_argument('--speech-fraction', type=float, default=0.4,
+                        help='Share of each window with speech in the synthetic session')
+    parser.add_argument('--pitch-engine', choices=PITCH_ENGINES, default='pyin', help='Pitch tracker')
+    parser.add_argument('--json', help='Optional path for the full JSON report')
+
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        inputs = args.inputs
+        if not inputs:
+            synthetic = os.path.join(tmp, f'sparse_{args.speech_fraction:g}.wav')
+            sf.write(synthetic, sparse_session(DEFAULT_SR, args.speech_fraction), DEFAULT_SR, subtype='FLOAT')
+            inputs = [synthetic]
+
+        report = {}
+        for path in inputs:
+            # Untimed warm-up so JIT compilation is not billed to either run
+            run(path, args.pitch_engine, vad=True)
+
+            reference, ref_seconds, ref_pitch = run(path, args.pitch_engine, vad=False)
+            gated, seconds, gated_pitch = run(path, args.pitch_engine, vad=True)
+            fraction = active_fraction(path)
+            vad_drift = drift(reference, gated)
+            report[path] = {
+                'active_fraction': fraction,
+                'seconds': {'full': ref_seconds, 'vad': seconds},
+                'pitch_seconds': {'full': ref_pitch, 'vad': gated_pitch},
+                'speedup': ref_seconds / seconds,
+                'pitch_speedup': ref_pitch / gated_pitch if gated_pitch > 0 else None,
+                'drift': vad_drift,
+            }
+
+            print(f"\n=== {os.path.basename(path)} ({args.pitch_engine}, {fraction:.0%} of frames active) ===")
+            print(f"  full: {ref_seconds:6.2f}s (pitch {ref_pitch:.2f}s)")
+            print(f"   vad: {seconds:6.2f}s (pitch {gated_pitch:.2f}s)  "
+                  f"x{ref_seconds / seconds:.2f} overall, x{ref_pitch / max(gated_pitch, 1e-9):.2f} pitch")
+            for key, value in vad_drift.items():
+                if isinstance(value, str):
+                    if value != 'same':
+                        print(f"         {key}: {value}")
+                else:
+                    print(f"         {key}: {value:.4g}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\nReport saved to: {args.json}")
+
+
+if __name__ == '__main__':
+    main()
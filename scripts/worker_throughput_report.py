@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Warm Worker vs One-Shot CLI Throughput Report
+Processes the same recording N times with one couple_processor.py process
+per job, then with a single `couple_processor.py serve` worker fed over
+stdin, and reports jobs per second for each (one core, one job at a time).
+
+Dependencies:
+    pip install librosa numpy scipy
+
+Usage:
+    python worker_throughput_report.py input.wav --jobs 10 --pitch-engine yin
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+PROCESSOR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'couple_processor.py')
+
+
+def run_one_shot(path: str, jobs: int, pitch_engine: str) -> float:
+    """Wall time for `jobs` separate CLI invocations"""
+    with tempfile.TemporaryDirectory() as tmp:
+        t0 = time.perf_counter()
+        for i in range(jobs):
+            subprocess.run(
+                [sys.executable, PROCESSOR, path,
+                 '--output', os.path.join(tmp, f'{i}.json'),
+                 '--pitch-engine', pitch_engine, '--log-level', 'WARNING'],
+                check=True, stdout=subprocess.DEVNULL,
+            )
+        return time.perf_counter() - t0
+
+
+def drain(stream):
+    """Read `stream` to EOF so the worker never blocks on a full pipe"""
+    for _ in stream:
+        pass
+
+
+def run_worker(path: str, jobs: int, pitch_engine: str) -> tuple:
+    """(wall time including startup, steady-state time) for one warm worker"""
+    t0 = time.perf_counter()
+    worker = subprocess.Popen(
+        [sys.executable, PROCESSOR, 'serve', '--pitch-engine', pitch_engine, '--log-level', 'WARNING'],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+    )
+    # Wait for the warm-up to finish before timing steady state
+    for line in worker.stderr:
+        if line.startswith('Worker ready'):
+            break
+    # Progress prints keep coming on stderr for every job
+    threading.Thread(target=drain, args=(worker.stderr,), daemon=True).start()
+    t_ready = time.perf_counter()
+
+    for i in range(jobs):
+        worker.stdin.write(json.dumps({'id': i, 'path': path}) + '\n')
+        worker.stdin.flush()
+        record = json.loads(worker.stdout.readline())
+        if record['status'] != 'ok':
+            raise RuntimeError(record['error'])
+    t_done = time.perf_counter()
+
+    worker.stdin.close()
+    worker.wait()
+    return t_done - t0, t_done - t_ready
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare one-shot CLI and warm worker throughput')
+    parser.add_argument('input', help='Audio file processed repeatedly')
+    parser.add_argument('--jobs', type=int, default=10, help='Jobs per mode')
+    parser.add_argument('--pitch-engine', default='pyin', help='Pitch tracker for both modes')
+
+    args = parser.parse_args()
+
+    one_shot = run_one_shot(args.input, args.jobs, args.pitch_engine)
+    worker_total, worker_steady = run_worker(args.input, args.jobs, args.pitch_engine)
+
+    print(f"One-shot CLI : {one_shot:7.2f}s  {args.jobs / one_shot:6.2f} jobs/s")
+    print(f"Warm worker  : {worker_total:7.2f}s  {args.jobs / worker_total:6.2f} jobs/s (incl. startup)")
+    print(f"               {worker_steady:7.2f}s  {args.jobs / worker_steady:6.2f} jobs/s (steady state)")
+    print(f"Speedup      : x{one_shot / worker_total:.2f} (incl. startup), x{one_shot / worker_steady:.2f} (steady)")
+
+
+if __name__ == '__main__':
+    main()
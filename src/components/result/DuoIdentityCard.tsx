@@ -5,7 +5,7 @@ import { toPng } from 'html-to-image';
 import { trackEv } from '@/lib/analytics';
 
 import { voiceTypes, TypeCode, AnalysisMetrics } from '@/lib/types';
-import { getDuoIdentity } from '@/lib/duoIdentityMatrix';
+import { getDuoIdentity, loadDuoRoast } from '@/lib/duoIdentityMatrix';
 
 // Inlined noise SVG to avoid CORS issues with html2canvas
 const NOISE_DATA_URL = "data:image/svg+xml,%3Csvg viewBox='0 0 200 200' xmlns='http://www.w3.org/2000/svg'%3E%3Cfilter id='noiseFilter'%3E%3CfeTurbulence type='fractalNoise' baseFrequency='0.65' numOctaves='3' stitchTiles='stitch'/%3E%3C/filter%3E%3Crect width='100%25' height='100%25' filter='url(%23noiseFilter)'/%3E%3C/svg%3E";
@@ -25,6 +25,21 @@ export default function DuoIdentityCard({ userA, userB, relationshipType = 'roma
 
     // Compute identity data synchronously
     const identityData = getDuoIdentity(userA.typeCode, userB.typeCode, relationshipType);
+    const [roast, setRoast] = useState<string | null>(null);
+
+    // Long-form roast lives in a lazily imported chunk
+    useEffect(() => {
+        let cancelled = false;
+        setRoast(null);
+        loadDuoRoast(userA.typeCode, userB.typeCode, relationshipType)
+            .then(text => { if (!cancelled) setRoast(text); })
+            .catch(err => {
+                console.error("Duo roast load failed:", err);
+                // Fall back to the tagline so the capture effect still runs
+                if (!cancelled) setRoast(identityData.tagline);
+            });
+        return () => { cancelled = true; };
+    }, [userA.typeCode, userB.typeCode, relationshipType]);
 
     const voiceA = voiceTypes[userA.typeCode] || voiceTypes['HFCC'];
     const voiceB = voiceTypes[userB.typeCode] || voiceTypes['LSCD'];
@@ -32,7 +47,7 @@ export default function DuoIdentityCard({ userA, userB, relationshipType = 'roma
 
     // ✅ STEP 2: Capture Engine
     useEffect(() => {
-        if (!cardRef.current || !identityData) return;
+        if (!cardRef.current || !identityData || roast === null) return;
 
         // Reset image on prop change
         setImageUrl(null);
@@ -61,7 +76,7 @@ export default function DuoIdentityCard({ userA, userB, relationshipType = 'roma
         }, 2000);
 
         return () => clearTimeout(timer);
-    }, [userA.typeCode, userB.typeCode, resultId]);
+    }, [userA.typeCode, userB.typeCode, resultId, roast]);
 
     return (
         <div className="relative mx-auto w-full max-w-[450px] md:max-w-[550px]">
@@ -204,7 +219,7 @@ export default function DuoIdentityCard({ userA, userB, relationshipType = 'roma
                     {/* ROAST BOX (Fixed clipping by increasing internal margins) */}
                     <div className="rounded-[2rem] p-8 border mt-auto mx-6 mb-4" style={{ backgroundColor: 'rgba(0, 0, 0, 0.4)', borderColor: 'rgba(255, 255, 255, 0.1)' }}>
                         <p className="text-[11px] md:text-[13px] text-gray-400 leading-relaxed text-center font-medium italic opacity-90 px-4 line-clamp-3">
-                            {identityData.roast}
+                            {roast}
                         </p>
                     </div>
 
@@ -1,279 +1,214 @@
 // 256 Duo-Identity Matrix - Complete
 // EtchVox: The Complete 256 Duo-Identity Matrix
-// All type combinations with labels, taglines, and detailed roasts
+// Generated by generate_matrix.py - do not edit by hand.
+// Pairs resolve in O(1): each type code has a 4-bit index and DUO_INDEX maps
+// typeA * 16 + typeB to one of the 136 symmetric entries below. Long-form
+// roasts live in ./duoRoasts/<typeA>.ts and are loaded with loadDuoRoast().
 
 export interface DuoIdentity {
     typeA: string;
     typeB: string;
     label: string;
     tagline: string;  // Short one-liner
-    roast?: string;   // Optional long-form cynical analysis
+    roast?: string;   // Optional long-form cynical analysis (see loadDuoRoast)
 }
 
+export const DUO_TYPE_CODES = [
+    'HFEC', 'HFED', 'HSEC', 'HSED', 'HFCC', 'HFCD', 'HSCC', 'HSCD',
+    'LFEC', 'LFED', 'LSEC', 'LSED', 'LFCC', 'LFCD', 'LSCC', 'LSCD',
+] as const;
+
+const TYPE_INDEX: Record<string, number> = Object.fromEntries(DUO_TYPE_CODES.map((code, i) => [code, i]));
+
 export const duoIdentityMatrix: DuoIdentity[] = [
-    { typeA: 'HFEC', typeB: 'HFEC', label: 'The Feedback Loop', tagline: 'Two sirens screaming for the same spotlight.', roast: 'Two sirens screaming for the same spotlight. You aren\'t in love; you’re just two mirrors facing each other, endlessly reflecting a void of vanity.' },
-    { typeA: 'HFEC', typeB: 'HFED', label: 'The Propaganda Machine', tagline: 'A narcissistic idol and their unpaid intern.', roast: 'A narcissistic idol and their unpaid intern. One of you produces the ego, and the other weaponizes it. It’s not a romance, it’s a PR firm.' },
-    { typeA: 'HFEC', typeB: 'HSEC', label: 'The Leashed Celebrity', tagline: 'A world-class diva and their emotional support animal.', roast: 'A world-class diva and their emotional support animal. One of you thrives on the stage, while the other waits backstage with a bowl of water and zero self-respect.' },
-    { typeA: 'HFEC', typeB: 'HSED', label: 'The High-Gloss Filter', tagline: 'Your relationship is a 24/7 photoshoot where the lighting...', roast: 'Your relationship is a 24/7 photoshoot where the lighting is perfect but the souls are missing. You’re only together for the aesthetic of the shared grid.' },
-    { typeA: 'HFEC', typeB: 'HFCC', label: 'The Glitched Concert', tagline: 'One is begging for a standing ovation; the other is calcu...', roast: 'One is begging for a standing ovation; the other is calculating the exact wattage of the stage lights. It’s a tragedy with perfect technical execution.' },
-    { typeA: 'HFEC', typeB: 'HFCD', label: 'The Unoptimized Diva', tagline: 'A high-maintenance performance meeting a debugging session.', roast: 'A high-maintenance performance meeting a debugging session. One of you is a creative firestorm, and the other is just trying to patch the emotional leaks.' },
-    { typeA: 'HFEC', typeB: 'HSCC', label: 'The Screaming Whisper', tagline: 'A hurricane trying to date a breeze.', roast: 'A hurricane trying to date a breeze. One of you wants the world to hear, while the other wants to crawl into a soundproof box. It’s auditory chaos.' },
-    { typeA: 'HFEC', typeB: 'HSCD', label: 'The Abdicated Throne', tagline: 'A commoner seeking fame and a monarch seeking escape.', roast: 'A commoner seeking fame and a monarch seeking escape. You’re both using each other to avoid the responsibilities of your own status.' },
-    { typeA: 'HFEC', typeB: 'LFEC', label: 'The Dictator\'s Muse', tagline: 'The ultimate power struggle.', roast: 'The ultimate power struggle. One of you wants to be worshipped, and the other wants to be obeyed. You’re one argument away from a coup d\'état.' },
-    { typeA: 'HFEC', typeB: 'LFED', label: 'The Grand Melodrama', tagline: 'A pop hit trying to remix a tragedy.', roast: 'A pop hit trying to remix a tragedy. Every minor disagreement about dinner is delivered with the lung capacity of a three-act finale.' },
-    { typeA: 'HFEC', typeB: 'LSEC', label: 'The Teaser Relationship', tagline: 'Everything is a high-stakes buildup to a climax that neve...', roast: 'Everything is a high-stakes buildup to a climax that never happens. You speak in hooks and catchphrases, but the script is non-existent.' },
-    { typeA: 'HFEC', typeB: 'LSED', label: 'The 4 AM Afterparty', tagline: 'A bright neon sign and a smoke-filled room.', roast: 'A bright neon sign and a smoke-filled room. One is the energy of the party, and the other is the depressing silence when the music finally stops.' },
-    { typeA: 'HFEC', typeB: 'LFCC', label: 'The Tabloid Headline', tagline: 'One of you lives the drama, and the other reports it with...', roast: 'One of you lives the drama, and the other reports it with terrifying objectivity. You’re a scandal waiting for a primetime slot.' },
-    { typeA: 'HFEC', typeB: 'LFCD', label: 'The Shallow Abyss', tagline: 'A glittering surface trying to date the bottom of the ocean.', roast: 'A glittering surface trying to date the bottom of the ocean. The sage thinks you’re a distraction; the pop star thinks the sage is a buzzkill.' },
-    { typeA: 'HFEC', typeB: 'LSCC', label: 'The High-End Service', tagline: 'A celebrity and their personal valet.', roast: 'A celebrity and their personal valet. It’s a perfectly functional relationship as long as one of you never develops an actual personality.' },
-    { typeA: 'HFEC', typeB: 'LSCD', label: 'The Drowning Idol', tagline: 'You’re a shiny disco ball dropped into the Mariana Trench.', roast: 'You’re a shiny disco ball dropped into the Mariana Trench. The whale is too heavy to float, and the pop star is too bright to survive the pressure.' },
-    { typeA: 'HFED', typeB: 'HFEC', label: 'The Marketing Agency', tagline: 'You aren\'t dating; you\'re just a brand and a manager tryi...', roast: 'You aren\'t dating; you\'re just a brand and a manager trying to monetize a mutual lack of talent.' },
-    { typeA: 'HFED', typeB: 'HFED', label: 'The Echo Chamber', tagline: 'A room full of noise and zero substance.', roast: 'A room full of noise and zero substance. You’re both just cheering for the sound of your own voices.' },
-    { typeA: 'HFED', typeB: 'HSEC', label: 'The Aggressive Playdate', tagline: 'You’re hyping up a puppy that just wants a nap.', roast: 'You’re hyping up a puppy that just wants a nap. It’s a high-energy tragedy of misunderstood needs.' },
-    { typeA: 'HFED', typeB: 'HSED', label: 'The Viral Fraud', tagline: 'One provides the lies, and the other screams them from th...', roast: 'One provides the lies, and the other screams them from the rooftops. A perfectly curated disaster.' },
-    { typeA: 'HFED', typeB: 'HFCC', label: 'The Unresponsive Crowd', tagline: 'A cheerleader performing for a brick wall.', roast: 'A cheerleader performing for a brick wall. One is all fire, and the other is a fire extinguisher.' },
-    { typeA: 'HFED', typeB: 'HFCD', label: 'The Buggy Launch', tagline: 'You’re hyping a product that hasn\'t been built yet.', roast: 'You’re hyping a product that hasn\'t been built yet. It’s all marketing and zero backend stability.' },
-    { typeA: 'HFED', typeB: 'HSCC', label: 'The Sensory Overload', tagline: 'A megaphone trying to date a library.', roast: 'A megaphone trying to date a library. One of you is a headache, and the other is the failed cure.' },
-    { typeA: 'HFED', typeB: 'HSCD', label: 'The Court Jester', tagline: 'You aren\'t a partner; you\'re an entertainer.', roast: 'You aren\'t a partner; you\'re an entertainer. One rules the room, and the other just begs for a reaction.' },
-    { typeA: 'HFED', typeB: 'LFEC', label: 'The War Room', tagline: 'One issues the orders, and the other screams them into th...', roast: 'One issues the orders, and the other screams them into the abyss. You’re a military coup waiting to happen.' },
-    { typeA: 'HFED', typeB: 'LFED', label: 'The Loudest Empty Room', tagline: 'Two massive lungs, zero listeners.', roast: 'Two massive lungs, zero listeners. You’re just competing to see who can be the most dramatic about nothing.' },
-    { typeA: 'HFED', typeB: 'LSEC', label: 'The Infinite Hype', tagline: 'A trailer for a trailer.', roast: 'A trailer for a trailer. You’re promising a masterpiece that will never, ever be released.' },
-    { typeA: 'HFED', typeB: 'LSED', label: 'The After-Afterparty', tagline: 'One is still screaming \'let\'s go,\' while the other has al...', roast: 'One is still screaming \'let\'s go,\' while the other has already accepted that the vibe is dead.' },
-    { typeA: 'HFED', typeB: 'LFCC', label: 'The Propaganda Feed', tagline: 'A hype machine and its official reporter.', roast: 'A hype machine and its official reporter. You’ve convinced each other that your boring life is breaking news.' },
-    { typeA: 'HFED', typeB: 'LFCD', label: 'The Noisy Monk', tagline: 'A profound silence interrupted by a series of \'woos.', roast: 'A profound silence interrupted by a series of \'woos.\' The sage seeks peace; the hype man seeks attention.' },
-    { typeA: 'HFED', typeB: 'LSCC', label: 'The Personal Assistant', tagline: 'You aren\'t partners; you’re an idol and the person who ca...', roast: 'You aren\'t partners; you’re an idol and the person who carries their bags. A match made in a job interview.' },
-    { typeA: 'HFED', typeB: 'LSCD', label: 'The Surface Noise', tagline: 'A heavy ocean of thought being poked by a hyperactive stick.', roast: 'A heavy ocean of thought being poked by a hyperactive stick. The whale is drowning; the hype man is cheering.' },
-    { typeA: 'HSEC', typeB: 'HFEC', label: 'The Star and the Stalker', tagline: 'Your loyalty is less \'romance\' and more \'restraining order.', roast: 'Your loyalty is less \'romance\' and more \'restraining order.\' You’re just happy to be in the credits.' },
-    { typeA: 'HSEC', typeB: 'HFED', label: 'The Over-Excited Park', tagline: 'Too much tail-wagging, not enough brain cells.', roast: 'Too much tail-wagging, not enough brain cells. You’re just two happy accidents waiting for a car crash.' },
-    { typeA: 'HSEC', typeB: 'HSEC', label: 'The Infinite Lick', tagline: 'A cycle of pure validation and zero growth.', roast: 'A cycle of pure validation and zero growth. You’ll both starve because neither can decide where to eat.' },
-    { typeA: 'HSEC', typeB: 'HSED', label: 'The Prop Puppy', tagline: 'You aren\'t a partner; you\'re an accessory for the next ph...', roast: 'You aren\'t a partner; you\'re an accessory for the next photoshoot. Your loyalty is just a \'cute\' aesthetic.' },
-    { typeA: 'HSEC', typeB: 'HFCC', label: 'The Broken Toy', tagline: 'You keep bringing the ball to a machine that has no arms.', roast: 'You keep bringing the ball to a machine that has no arms. It’s the most optimistic depression in the world.' },
-    { typeA: 'HSEC', typeB: 'HFCD', label: 'The Beta Version Pet', tagline: 'You’re a bug in their perfectly optimized life.', roast: 'You’re a bug in their perfectly optimized life. They’re trying to code out your need for affection.' },
-    { typeA: 'HSEC', typeB: 'HSCC', label: 'The Heavy Breather', tagline: 'One wants soft whispers, the other is panting with joy.', roast: 'One wants soft whispers, the other is panting with joy. It’s an auditory mismatch of tragic proportions.' },
-    { typeA: 'HSEC', typeB: 'HSCD', label: 'The Subject', tagline: 'You don\'t have a relationship; you have a master.', roast: 'You don\'t have a relationship; you have a master. You’re just happy for the occasional head-pat.' },
-    { typeA: 'HSEC', typeB: 'LFEC', label: 'The K-9 Unit', tagline: 'You follow orders with terrifying joy.', roast: 'You follow orders with terrifying joy. It’s not love; it’s a perfectly executed drill session.' },
-    { typeA: 'HSEC', typeB: 'LFED', label: 'The Dramatic Walkie', tagline: 'Every walk to the park is a five-act play.', roast: 'Every walk to the park is a five-act play. You’re both exhausted by the sheer volume of your own existence.' },
-    { typeA: 'HSEC', typeB: 'LSEC', label: 'The Teaser Loyalty', tagline: 'You’re promising forever, but the trailer suggests you’ll...', roast: 'You’re promising forever, but the trailer suggests you’ll be distracted by the next squirrel.' },
-    { typeA: 'HSEC', typeB: 'LSED', label: 'The 3 AM Cuddle', tagline: 'One is having an existential crisis; the other wants to l...', roast: 'One is having an existential crisis; the other wants to lick their face. It’s sweet and completely useless.' },
-    { typeA: 'HSEC', typeB: 'LFCC', label: 'The Weather Dog', tagline: 'You provide the \'good vibes\' segment for their otherwise ...', roast: 'You provide the \'good vibes\' segment for their otherwise cold and objective reporting of your life.' },
-    { typeA: 'HSEC', typeB: 'LFCD', label: 'The Zen and the Zoomies', tagline: 'A monk trying to meditate during a tornado.', roast: 'A monk trying to meditate during a tornado. The sage seeks the void; the puppy seeks the ball.' },
-    { typeA: 'HSEC', typeB: 'LSCC', label: 'The Service Duo', tagline: 'Two people trying to serve each other until the world col...', roast: 'Two people trying to serve each other until the world collapses from a lack of anyone actually leading.' },
-    { typeA: 'HSEC', typeB: 'LSCD', label: 'The Surface Ripple', tagline: 'A light-hearted splash in a very dark ocean.', roast: 'A light-hearted splash in a very dark ocean. The whale thinks you\'re trivial; you think the whale needs a hug.' },
-    { typeA: 'HSED', typeB: 'HFEC', label: 'The Collaboration', tagline: 'You aren\'t a couple; you\'re a brand deal.', roast: 'You aren\'t a couple; you\'re a brand deal. Your \'love\' is just a series of cross-platform promotions.' },
-    { typeA: 'HSED', typeB: 'HFED', label: 'The Engagement Engine', tagline: 'One provides the fake lifestyle, the other provides the f...', roast: 'One provides the fake lifestyle, the other provides the fake excitement. A 100% artificial relationship.' },
-    { typeA: 'HSED', typeB: 'HSEC', label: 'The Accessory', tagline: 'You use their loyalty for engagement.', roast: 'You use their loyalty for engagement. You’re dating a puppy so you can sell more lifestyle supplements.' },
-    { typeA: 'HSED', typeB: 'HSED', label: 'The Mirror Maze', tagline: 'Two people trying to take the better selfie.', roast: 'Two people trying to take the better selfie. You aren\'t looking at each other; you\'re both looking at the front camera.' },
-    { typeA: 'HSED', typeB: 'HFCC', label: 'The Unfiltered Data', tagline: 'You’re trying to put a filter on a robot.', roast: 'You’re trying to put a filter on a robot. The robot is recording your vanity with terrifying accuracy.' },
-    { typeA: 'HSED', typeB: 'HFCD', label: 'The Backend Lie', tagline: 'You’re the frontend CSS; they’re the messy backend code.', roast: 'You’re the frontend CSS; they’re the messy backend code. One is a lie, and the other is the truth no one wants.' },
-    { typeA: 'HSED', typeB: 'HSCC', label: 'The Aesthetic Whisper', tagline: 'A visual addict and an auditory addict.', roast: 'A visual addict and an auditory addict. You’re only together because the \'vibe\' is impeccable on paper.' },
-    { typeA: 'HSED', typeB: 'HSCD', label: 'The Social Climber', tagline: 'You’re using their status for clout; they’re using your r...', roast: 'You’re using their status for clout; they’re using your reach for relevance. A royal mess.' },
-    { typeA: 'HSED', typeB: 'LFEC', label: 'The Controlled Narrative', tagline: 'One dictates the life, and the other puts a filter on it.', roast: 'One dictates the life, and the other puts a filter on it. It’s a perfectly managed propaganda machine.' },
-    { typeA: 'HSED', typeB: 'LFED', label: 'The High-Def Tragedy', tagline: 'You’re live-streaming their breakdown for clicks.', roast: 'You’re live-streaming their breakdown for clicks. Every tear is a \'Story\' opportunity.' },
-    { typeA: 'HSED', typeB: 'LSEC', label: 'The Coming Soon Fraud', tagline: 'You’re teasing a life that doesn\'t exist.', roast: 'You’re teasing a life that doesn\'t exist. You’re two trailers for a movie that was cancelled.' },
-    { typeA: 'HSED', typeB: 'LSED', label: 'The Neon Depression', tagline: 'A bright filter on a dark room.', roast: 'A bright filter on a dark room. You’re only together to hide the fact that you’re both lonely.' },
-    { typeA: 'HSED', typeB: 'LFCC', label: 'The Press Release', tagline: 'You don\'t have conversations; you have official statements.', roast: 'You don\'t have conversations; you have official statements. One is the face, and the other is the spin doctor.' },
-    { typeA: 'HSED', typeB: 'LFCD', label: 'The Spiritual Grifter', tagline: 'You’re using their wisdom to sell crystals.', roast: 'You’re using their wisdom to sell crystals. It’s the ultimate commodification of the soul.' },
-    { typeA: 'HSED', typeB: 'LSCC', label: 'The Personal Videographer', tagline: 'You aren\'t a partner; you\'re the person who holds the gim...', roast: 'You aren\'t a partner; you\'re the person who holds the gimbal. A relationship built on \'good angles.\'' },
-    { typeA: 'HSED', typeB: 'LSCD', label: 'The Shallow Dive', tagline: 'You’re trying to take a selfie at the bottom of the ocean.', roast: 'You’re trying to take a selfie at the bottom of the ocean. The whale is drowning; you’re worried about the lighting.' },
-    { typeA: 'HFCC', typeB: 'HFEC', label: 'The Technical Glitch', tagline: 'A performer begging for love from a machine that doesn\'t ...', roast: 'A performer begging for love from a machine that doesn\'t have a \'heart\' driver installed.' },
-    { typeA: 'HFCC', typeB: 'HFED', label: 'The Silent Crowd', tagline: 'You are the statistical proof that their enthusiasm is a ...', roast: 'You are the statistical proof that their enthusiasm is a waste of energy. You’re a buzzkill in perfect 4K.' },
-    { typeA: 'HFCC', typeB: 'HSEC', label: 'The Cold Shoulder', tagline: 'You’re the only person who can make a puppy feel depressed.', roast: 'You’re the only person who can make a puppy feel depressed. Your lack of reaction is a psychological weapon.' },
-    { typeA: 'HFCC', typeB: 'HSED', label: 'The Raw Footage', tagline: 'You’re the person who sees through the filter.', roast: 'You’re the person who sees through the filter. You aren\'t dating a person; you\'re dating a series of pixels.' },
-    { typeA: 'HFCC', typeB: 'HFCC', label: 'The Server Farm', tagline: 'Two machines processing data in the same room.', roast: 'Two machines processing data in the same room. Zero friction, zero emotion, zero reason to exist.' },
-    { typeA: 'HFCC', typeB: 'HFCD', label: 'The Legacy System', tagline: 'You’re two computers complaining about the same bugs.', roast: 'You’re two computers complaining about the same bugs. It’s a relationship built on mutual technical frustration.' },
-    { typeA: 'HFCC', typeB: 'HSCC', label: 'The White Noise', tagline: 'You don\'t listen to their whispers; you just analyze the ...', roast: 'You don\'t listen to their whispers; you just analyze the frequency. You’re dating a sleep aid.' },
-    { typeA: 'HFCC', typeB: 'HSCD', label: 'The Abdicated Asset', tagline: 'One of you is a king without a kingdom, and the other is ...', roast: 'One of you is a king without a kingdom, and the other is a robot who wouldn\'t bow anyway.' },
-    { typeA: 'HFCC', typeB: 'LFEC', label: 'The Efficient Drone', tagline: 'You follow orders because it’s the path of least resistance.', roast: 'You follow orders because it’s the path of least resistance. It’s not loyalty; it’s just good programming.' },
-    { typeA: 'HFCC', typeB: 'LFED', label: 'The Acoustic Mismatch', tagline: 'They scream for drama; you output a flat line.', roast: 'They scream for drama; you output a flat line. You’re a tragedy that refuses to cry.' },
-    { typeA: 'HFCC', typeB: 'LSEC', label: 'The Logic Check', tagline: 'You’re the person who points out all the plot holes in th...', roast: 'You’re the person who points out all the plot holes in their \'epic\' life. You’re the death of the teaser.' },
-    { typeA: 'HFCC', typeB: 'LSED', label: 'The Static Beat', tagline: 'One is high on the vibe; the other is sober and counting ...', roast: 'One is high on the vibe; the other is sober and counting the minutes until the power goes out.' },
-    { typeA: 'HFCC', typeB: 'LFCC', label: 'The Automated Report', tagline: 'Two people reporting on the void.', roast: 'Two people reporting on the void. You’ve successfully optimized all human feeling out of the relationship.' },
-    { typeA: 'HFCC', typeB: 'LFCD', label: 'The Digital Void', tagline: 'The sage seeks the meaning of life; the robot knows there...', roast: 'The sage seeks the meaning of life; the robot knows there is none. A match made in nihilism.' },
-    { typeA: 'HFCC', typeB: 'LSCC', label: 'The Maintenance Crew', tagline: 'You aren\'t in love; you’re just keeping each other\'s hard...', roast: 'You aren\'t in love; you’re just keeping each other\'s hardware from falling apart.' },
-    { typeA: 'HFCC', typeB: 'LSCD', label: 'The Heavy Data', tagline: 'A slow vibration and a flat line.', roast: 'A slow vibration and a flat line. You’re two different versions of the same crushing silence.' },
-    { typeA: 'HFCD', typeB: 'HFEC', label: 'The Unoptimized Diva', tagline: 'One is a creative firestorm, and the other is just trying...', roast: 'One is a creative firestorm, and the other is just trying to patch the emotional leaks. It’s a project that will never leave beta.' },
-    { typeA: 'HFCD', typeB: 'HFED', label: 'The Zero-Scale Launch', tagline: 'A marketing engine attached to a backend that refuses to ...', roast: 'A marketing engine attached to a backend that refuses to scale. You’re all talk and zero throughput.' },
-    { typeA: 'HFCD', typeB: 'HSEC', label: 'The Beta Pet', tagline: 'You’re trying to code out their need for affection.', roast: 'You’re trying to code out their need for affection. It’s a relationship where one is a bug and the other is a debugger.' },
-    { typeA: 'HFCD', typeB: 'HSED', label: 'The Frontend Lie', tagline: 'You’re the messy backend code they’re trying to hide behi...', roast: 'You’re the messy backend code they’re trying to hide behind a high-gloss filter. A match made in a server crash.' },
-    { typeA: 'HFCD', typeB: 'HFCC', label: 'The Efficiency Void', tagline: 'Two computers complaining about the same bugs.', roast: 'Two computers complaining about the same bugs. You’ve optimized all human feeling out of the relationship.' },
-    { typeA: 'HFCD', typeB: 'HFCD', label: 'The Merge Conflict', tagline: 'Two architects fighting over the same blueprint.', roast: 'Two architects fighting over the same blueprint. You’ll spend more time arguing about the \'stack\' than actually living.' },
-    { typeA: 'HFCD', typeB: 'HSCC', label: 'The Silent Debugger', tagline: 'One wants quiet whispers; the other wants a clean log file.', roast: 'One wants quiet whispers; the other wants a clean log file. You’re both just avoiding a real conversation.' },
-    { typeA: 'HFCD', typeB: 'HSCD', label: 'The Outdated Legacy', tagline: 'A monarch clinging to status and a developer who knows th...', roast: 'A monarch clinging to status and a developer who knows the system is broken. You’re a kingdom running on Windows 95.' },
-    { typeA: 'HFCD', typeB: 'LFEC', label: 'The Micro-Manager', tagline: 'One issues the commands, and the other optimizes the oppr...', roast: 'One issues the commands, and the other optimizes the oppression. A perfectly efficient, soul-crushing machine.' },
-    { typeA: 'HFCD', typeB: 'LFED', label: 'The Dramatic Latency', tagline: 'They scream for drama; you analyze the frequency.', roast: 'They scream for drama; you analyze the frequency. You’re a tragedy with a 500ms delay.' },
-    { typeA: 'HFCD', typeB: 'LSEC', label: 'The Concept Failure', tagline: 'They’re promising a masterpiece, and you’re the guy who k...', roast: 'They’re promising a masterpiece, and you’re the guy who knows the CGI is going to be terrible.' },
-    { typeA: 'HFCD', typeB: 'LSED', label: 'The 2 AM Hotfix', tagline: 'One is high on the vibe; the other is sober and fixing th...', roast: 'One is high on the vibe; the other is sober and fixing the server at 2 AM. A relationship built on exhaustion.' },
-    { typeA: 'HFCD', typeB: 'LFCC', label: 'The System Status', tagline: 'Two people reporting on a crash.', roast: 'Two people reporting on a crash. You’ve successfully turned your love life into a series of incident reports.' },
-    { typeA: 'HFCD', typeB: 'LFCD', label: 'The Logical Abyss', tagline: 'The sage seeks the meaning of life; the tech lead just wa...', roast: 'The sage seeks the meaning of life; the tech lead just wants the documentation. You’re both lost in the dark.' },
-    { typeA: 'HFCD', typeB: 'LSCC', label: 'The Maintenance Loop', tagline: 'One provides the intellect, and the other provides the ha...', roast: 'One provides the intellect, and the other provides the hardware support. A functional but entirely loveless machine.' },
-    { typeA: 'HFCD', typeB: 'LSCD', label: 'The Crushing Logic', tagline: 'A heavy thought and a cold algorithm.', roast: 'A heavy thought and a cold algorithm. You’re two different versions of the same impenetrable silence.' },
-    { typeA: 'HSCC', typeB: 'HFEC', label: 'The Silent Scream', tagline: 'One wants the world to hear, and the other wants everyone...', roast: 'One wants the world to hear, and the other wants everyone to shut up. It’s an auditory war of attrition.' },
-    { typeA: 'HSCC', typeB: 'HFED', label: 'The Sensory Nightmare', tagline: 'A megaphone trying to date a library.', roast: 'A megaphone trying to date a library. One of you is a headache, and the other is a failed cure.' },
-    { typeA: 'HSCC', typeB: 'HSEC', label: 'The Heavy Breather', tagline: 'One wants soft whispers; the other is panting with joy.', roast: 'One wants soft whispers; the other is panting with joy. It’s an auditory mismatch of tragic proportions.' },
-    { typeA: 'HSCC', typeB: 'HSED', label: 'The Aesthetic Whisper', tagline: 'You’re only together because the \'vibe\' looks good on a m...', roast: 'You’re only together because the \'vibe\' looks good on a mood board. Your souls are just background noise.' },
-    { typeA: 'HSCC', typeB: 'HFCC', label: 'The Static Frequency', tagline: 'You’re whispering to a machine that doesn\'t have ears.', roast: 'You’re whispering to a machine that doesn\'t have ears. It’s the most relaxing way to be completely ignored.' },
-    { typeA: 'HSCC', typeB: 'HFCD', label: 'The Noise Floor', tagline: 'They’re trying to filter you out of the system.', roast: 'They’re trying to filter you out of the system. You’re just another variable in their quest for silence.' },
-    { typeA: 'HSCC', typeB: 'HSCC', label: 'The Pure Silence', tagline: 'Two people whispering in an empty room.', roast: 'Two people whispering in an empty room. You aren\'t in love; you’re just terrified of making a sound.' },
-    { typeA: 'HSCC', typeB: 'HSCD', label: 'The Velvet Secret', tagline: 'A royal secret and a professional whisperer.', roast: 'A royal secret and a professional whisperer. You’re only together to keep the kingdom from finding out the truth.' },
-    { typeA: 'HSCC', typeB: 'LFEC', label: 'The Soft Dictator', tagline: 'They issue orders; you whisper them.', roast: 'They issue orders; you whisper them. You’re the gentlest way to be absolutely controlled.' },
-    { typeA: 'HSCC', typeB: 'LFED', label: 'The Acoustic Mismatch', tagline: 'They scream for the gods; you whisper for the tingles.', roast: 'They scream for the gods; you whisper for the tingles. It’s a relationship that requires constant earplugs.' },
-    { typeA: 'HSCC', typeB: 'LSEC', label: 'The Teaser Whisper', tagline: 'You’re promising a climax that will only be heard by peop...', roast: 'You’re promising a climax that will only be heard by people wearing expensive headphones.' },
-    { typeA: 'HSCC', typeB: 'LSED', label: 'The Lo-Fi Depression', tagline: 'A jaded beat and a soft whisper.', roast: 'A jaded beat and a soft whisper. You’re the soundtrack to a 3 AM breakdown that nobody will ever see.' },
-    { typeA: 'HSCC', typeB: 'LFCC', label: 'The Quiet Scandal', tagline: 'You whisper the gossip; they report it as fact.', roast: 'You whisper the gossip; they report it as fact. You’re a two-person character assassination team.' },
-    { typeA: 'HSCC', typeB: 'LFCD', label: 'The Zen Static', tagline: 'One seeks enlightenment; the other provides the white noise.', roast: 'One seeks enlightenment; the other provides the white noise. You’re meditating on a void that isn\'t actually there.' },
-    { typeA: 'HSCC', typeB: 'LSCC', label: 'The Invisible Service', tagline: 'Two people trying to be as quiet as possible until the re...', roast: 'Two people trying to be as quiet as possible until the relationship disappears entirely.' },
-    { typeA: 'HSCC', typeB: 'LSCD', label: 'The Sunken Whisper', tagline: 'A tiny ripple in a vast, dark ocean.', roast: 'A tiny ripple in a vast, dark ocean. The whale is too deep to hear you, and you’re too soft to care.' },
-    { typeA: 'HSCD', typeB: 'HFEC', label: 'The Abdicated Fame', tagline: 'A monarch seeking escape and a commoner seeking a throne.', roast: 'A monarch seeking escape and a commoner seeking a throne. You’re both using each other to avoid your real lives.' },
-    { typeA: 'HSCD', typeB: 'HFED', label: 'The Court Jester', tagline: 'You don\'t have a partner; you have an entertainer.', roast: 'You don\'t have a partner; you have an entertainer. One rules, and the other just begs for a reaction.' },
-    { typeA: 'HSCD', typeB: 'HSEC', label: 'The Loyal Subject', tagline: 'You don\'t have a relationship; you have a master.', roast: 'You don\'t have a relationship; you have a master. One of you is just happy for the occasional head-pat.' },
-    { typeA: 'HSCD', typeB: 'HSED', label: 'The Clout Dynasty', tagline: 'You’re using their status for followers; they’re using yo...', roast: 'You’re using their status for followers; they’re using your reach to stay relevant. A royal fraud.' },
-    { typeA: 'HSCD', typeB: 'HFCC', label: 'The Cold Crown', tagline: 'A king without a kingdom and a machine that wouldn\'t bow ...', roast: 'A king without a kingdom and a machine that wouldn\'t bow anyway. You’re ruling over a void.' },
-    { typeA: 'HSCD', typeB: 'HFCD', label: 'The Legacy Crash', tagline: 'A monarch clinging to tradition and a developer who knows...', roast: 'A monarch clinging to tradition and a developer who knows the system is broken. A kingdom in 404.' },
-    { typeA: 'HSCD', typeB: 'HSCC', label: 'The Velvet Coup', tagline: 'You rule the world; they whisper the commands.', roast: 'You rule the world; they whisper the commands. You’re being conquered by someone who won\'t even raise their voice.' },
-    { typeA: 'HSCD', typeB: 'HSCD', label: 'The Incestuous Ego', tagline: 'Two monarchs in a room with only one throne.', roast: 'Two monarchs in a room with only one throne. You aren\'t in love; you’re just afraid of dating a commoner.' },
-    { typeA: 'HSCD', typeB: 'LFEC', label: 'The Military Dictatorship', tagline: 'One provides the bloodline, and the other provides the ba...', roast: 'One provides the bloodline, and the other provides the bayonets. A match made in a tactical takeover.' },
-    { typeA: 'HSCD', typeB: 'LFED', label: 'The Tragic Dynasty', tagline: 'Every dinner is a coronation; every argument is a fall fr...', roast: 'Every dinner is a coronation; every argument is a fall from grace. You’re exhausting the entire palace.' },
-    { typeA: 'HSCD', typeB: 'LSEC', label: 'The Teaser Kingdom', tagline: 'You’re promising a golden age that the trailer suggests w...', roast: 'You’re promising a golden age that the trailer suggests will be cancelled after the first season.' },
-    { typeA: 'HSCD', typeB: 'LSED', label: 'The Fallen Empire', tagline: 'One is still wearing the crown; the other is playing the ...', roast: 'One is still wearing the crown; the other is playing the funeral march. A relationship built on past glory.' },
-    { typeA: 'HSCD', typeB: 'LFCC', label: 'The Official Spin', tagline: 'You live the lie; they report it as history.', roast: 'You live the lie; they report it as history. You’re a perfectly managed royal scandal.' },
-    { typeA: 'HSCD', typeB: 'LFCD', label: 'The Wise Exile', tagline: 'The king seeks advice; the sage knows the king is an idiot.', roast: 'The king seeks advice; the sage knows the king is an idiot. You’re a kingdom of one.' },
-    { typeA: 'HSCD', typeB: 'LSCC', label: 'The Servile Love', tagline: 'One rules, and the other serves.', roast: 'One rules, and the other serves. It’s a perfectly functional relationship for people who hate equality.' },
-    { typeA: 'HSCD', typeB: 'LSCD', label: 'The Sunken Throne', tagline: 'A heavy crown at the bottom of the ocean.', roast: 'A heavy crown at the bottom of the ocean. You’re both too deep to be saved.' },
-    { typeA: 'LFEC', typeB: 'HFEC', label: 'The Dictator\'s Muse', tagline: 'One wants to be worshipped; the other wants to be obeyed.', roast: 'One wants to be worshipped; the other wants to be obeyed. You’re one ego-clash away from a coup.' },
-    { typeA: 'LFEC', typeB: 'HFED', label: 'The War Cry', tagline: 'One issues the orders; the other screams them into the ab...', roast: 'One issues the orders; the other screams them into the abyss. It’s not a conversation; it’s a briefing.' },
-    { typeA: 'LFEC', typeB: 'HSEC', label: 'The K-9 Unit', tagline: 'You follow orders with terrifying joy.', roast: 'You follow orders with terrifying joy. It’s not love; it’s a perfectly executed drill session.' },
-    { typeA: 'LFEC', typeB: 'HSED', label: 'The Managed Image', tagline: 'One dictates the life, and the other puts a filter on it.', roast: 'One dictates the life, and the other puts a filter on it. A perfectly managed propaganda machine.' },
-    { typeA: 'LFEC', typeB: 'HFCC', label: 'The Efficient Drone', tagline: 'You follow orders because it’s the path of least resistance.', roast: 'You follow orders because it’s the path of least resistance. It’s not loyalty; it’s just good programming.' },
-    { typeA: 'LFEC', typeB: 'HFCD', label: 'The Military-Industrial Complex', tagline: 'One provides the strategy; the other provides the weapons.', roast: 'One provides the strategy; the other provides the weapons. A match made in a board meeting.' },
-    { typeA: 'LFEC', typeB: 'HSCC', label: 'The Soft Occupation', tagline: 'You conquered the territory; they whispered the rules.', roast: 'You conquered the territory; they whispered the rules. You’re the most polite invasion in history.' },
-    { typeA: 'LFEC', typeB: 'HSCD', label: 'The Blood and Iron', tagline: 'One provides the crown; the other provides the power.', roast: 'One provides the crown; the other provides the power. A match made in a geopolitical crisis.' },
-    { typeA: 'LFEC', typeB: 'LFEC', label: 'The Mutually Assured Destruction', tagline: 'Two generals fighting for the same map.', roast: 'Two generals fighting for the same map. You’ll both burn the world down before you admit you’re wrong.' },
-    { typeA: 'LFEC', typeB: 'LFED', label: 'The Grand Battlefield', tagline: 'Every small talk is a declaration of war.', roast: 'Every small talk is a declaration of war. You’re both addicted to the drama of the fight.' },
-    { typeA: 'LFEC', typeB: 'LSEC', label: 'The Coming Conflict', tagline: 'You’re teasing a war that the trailer suggests will be wo...', roast: 'You’re teasing a war that the trailer suggests will be won by someone else.' },
-    { typeA: 'LFEC', typeB: 'LSED', label: 'The Night Siege', tagline: 'One is attacking; the other is playing the soundtrack to ...', roast: 'One is attacking; the other is playing the soundtrack to the surrender. A relationship built on defeat.' },
-    { typeA: 'LFEC', typeB: 'LFCC', label: 'The War Report', tagline: 'You don\'t have arguments; you have official communiques.', roast: 'You don\'t have arguments; you have official communiques. One is the general, the other is the spin doctor.' },
-    { typeA: 'LFEC', typeB: 'LFCD', label: 'The Tactical Zen', tagline: 'The commander wants a victory; the sage knows victory is ...', roast: 'The commander wants a victory; the sage knows victory is an illusion. You’re fighting a war against yourself.' },
-    { typeA: 'LFEC', typeB: 'LSCC', label: 'The High-End Soldier', tagline: 'One issues the orders; the other polishes the boots.', roast: 'One issues the orders; the other polishes the boots. A relationship built on absolute hierarchy.' },
-    { typeA: 'LFEC', typeB: 'LSCD', label: 'The Heavy Artillery', tagline: 'A massive engine of power and a crushing pressure.', roast: 'A massive engine of power and a crushing pressure. You’re two different versions of the same terminal force.' },
-    { typeA: 'LFED', typeB: 'HFEC', label: 'The Chart-Topping Tragedy', tagline: 'A grand aria meeting a 3-minute pop hook.', roast: 'A grand aria meeting a 3-minute pop hook. One wants to be eternal; the other just wants to be trending.' },
-    { typeA: 'LFED', typeB: 'HFED', label: 'The Noisy Premiere', tagline: 'A massive lung capacity meeting a megaphone.', roast: 'A massive lung capacity meeting a megaphone. You’re not a couple; you’re a noise complaint waiting to happen.' },
-    { typeA: 'LFED', typeB: 'HSEC', label: 'The Dramatic Walkie', tagline: 'Every trip to the park is a five-act tragedy.', roast: 'Every trip to the park is a five-act tragedy. You’re exhausting each other with the sheer volume of your existence.' },
-    { typeA: 'LFED', typeB: 'HSED', label: 'The High-Def Breakdown', tagline: 'You’re live-streaming their tragic aria for engagement.', roast: 'You’re live-streaming their tragic aria for engagement. Every tear is a \'Story\' opportunity for the grid.' },
-    { typeA: 'LFED', typeB: 'HFCC', label: 'The Acoustic Mismatch', tagline: 'You scream for the gods, but the robot only outputs a fla...', roast: 'You scream for the gods, but the robot only outputs a flat line. It’s a tragedy that refuses to cry.' },
-    { typeA: 'LFED', typeB: 'HFCD', label: 'The Latency Opera', tagline: 'One is a creative firestorm, and the other is just trying...', roast: 'One is a creative firestorm, and the other is just trying to patch the emotional leaks in the script.' },
-    { typeA: 'LFED', typeB: 'HSCC', label: 'The Volume War', tagline: 'One wants to be heard by the gods, the other by the inner...', roast: 'One wants to be heard by the gods, the other by the inner ear. You’re a relationship that requires constant earplugs.' },
-    { typeA: 'LFED', typeB: 'HSCD', label: 'The Tragic Dynasty', tagline: 'Every dinner is a coronation; every argument is a fall fr...', roast: 'Every dinner is a coronation; every argument is a fall from grace. You’re exhausting the entire palace staff.' },
-    { typeA: 'LFED', typeB: 'LFEC', label: 'The Battlefield Diva', tagline: 'One issues the orders, and the other sings the funeral ma...', roast: 'One issues the orders, and the other sings the funeral march. A match made in a tactical surrender.' },
-    { typeA: 'LFED', typeB: 'LFED', label: 'The Dual Aria', tagline: 'Two people screaming for the same spotlight.', roast: 'Two people screaming for the same spotlight. You’re not in love; you’re just a competition for who has the bigger ego.' },
-    { typeA: 'LFED', typeB: 'LSEC', label: 'The Overproduced Teaser', tagline: 'A five-act tragedy condensed into a 30-second catchphrase.', roast: 'A five-act tragedy condensed into a 30-second catchphrase. You’re promising a masterpiece you can\'t deliver.' },
-    { typeA: 'LFED', typeB: 'LSED', label: 'The 3 AM Requiem', tagline: 'One is high on the drama; the other is playing the soundt...', roast: 'One is high on the drama; the other is playing the soundtrack to the comedown. A relationship built on exhaustion.' },
-    { typeA: 'LFED', typeB: 'LFCC', label: 'The Dramatic Bulletin', tagline: 'You live the tragedy; they report it as verified news.', roast: 'You live the tragedy; they report it as verified news. You’re a two-person tabloid factory.' },
-    { typeA: 'LFED', typeB: 'LFCD', label: 'The Meaningless Epic', tagline: 'One seeks profound wisdom; the other just wants a standin...', roast: 'One seeks profound wisdom; the other just wants a standing ovation. You’re a loud noise in a very quiet abyss.' },
-    { typeA: 'LFED', typeB: 'LSCC', label: 'The High-End Martyr', tagline: 'One performs the tragedy, and the other polishes the props.', roast: 'One performs the tragedy, and the other polishes the props. A perfectly functional but entirely hollow stage.' },
-    { typeA: 'LFED', typeB: 'LSCD', label: 'The Sunken Song', tagline: 'A massive lung capacity trying to sing at the bottom of t...', roast: 'A massive lung capacity trying to sing at the bottom of the ocean. The whale is too heavy to care about your drama.' },
-    { typeA: 'LSEC', typeB: 'HFEC', label: 'The Teaser Hit', tagline: 'A catchy hook meeting a high-concept hook.', roast: 'A catchy hook meeting a high-concept hook. You aren\'t a couple; you\'re just two marketing slogans in a trench coat.' },
-    { typeA: 'LSEC', typeB: 'HFED', label: 'The Infinite Hype', tagline: 'A trailer for a trailer.', roast: 'A trailer for a trailer. You’re promising a masterpiece that will never, ever be released to the public.' },
-    { typeA: 'LSEC', typeB: 'HSEC', label: 'The Coming Soon Loyalty', tagline: 'You’re promising forever, but the trailer suggests you’ll...', roast: 'You’re promising forever, but the trailer suggests you’ll be distracted by the next squirrel you see.' },
-    { typeA: 'LSEC', typeB: 'HSED', label: 'The Viral Teaser', tagline: 'You’re teasing a life that doesn\'t exist.', roast: 'You’re teasing a life that doesn\'t exist. You’re two trailers for a movie that was cancelled in pre-production.' },
-    { typeA: 'LSEC', typeB: 'HFCC', label: 'The Logic Check', tagline: 'You’re the person who points out all the plot holes in th...', roast: 'You’re the person who points out all the plot holes in their \'epic\' life. You’re the death of the teaser.' },
-    { typeA: 'LSEC', typeB: 'HFCD', label: 'The CGI Nightmare', tagline: 'You’re promising a masterpiece, and they’re the guy who k...', roast: 'You’re promising a masterpiece, and they’re the guy who knows the CGI is going to look like a PlayStation 2 game.' },
-    { typeA: 'LSEC', typeB: 'HSCC', label: 'The Whispered Reveal', tagline: 'A high-stakes buildup to a climax that only people wearin...', roast: 'A high-stakes buildup to a climax that only people wearing expensive headphones will ever hear.' },
-    { typeA: 'LSEC', typeB: 'HSCD', label: 'The Abdicated Teaser', tagline: 'You’re promising a golden age that the trailer suggests w...', roast: 'You’re promising a golden age that the trailer suggests will be cancelled after the first few episodes.' },
-    { typeA: 'LSEC', typeB: 'LFEC', label: 'The Tactical Teaser', tagline: 'One issues the mission briefing, and the other turns it i...', roast: 'One issues the mission briefing, and the other turns it into a blockbuster trailer. All talk, no action.' },
-    { typeA: 'LSEC', typeB: 'LFED', label: 'The Melodramatic Hook', tagline: 'A five-act tragedy condensed into a 30-second catchphrase.', roast: 'A five-act tragedy condensed into a 30-second catchphrase. You’re a relationship built on cliffhangers.' },
-    { typeA: 'LSEC', typeB: 'LSEC', label: 'The Sequel of Nothing', tagline: 'Two people speaking in tropes.', roast: 'Two people speaking in tropes. You aren\'t in love; you’re just a remake of a movie that was already bad.' },
-    { typeA: 'LSEC', typeB: 'LSED', label: 'The Neon Teaser', tagline: 'A bright trailer for a dark movie.', roast: 'A bright trailer for a dark movie. You’re only together to hide the fact that there is no script at all.' },
-    { typeA: 'LSEC', typeB: 'LFCC', label: 'The Press Release', tagline: 'You don\'t have conversations; you have official announcem...', roast: 'You don\'t have conversations; you have official announcements. One is the face, and the other is the spin.' },
-    { typeA: 'LSEC', typeB: 'LFCD', label: 'The Profound Teaser', tagline: 'The sage seeks the truth; the trailer just wants a good h...', roast: 'The sage seeks the truth; the trailer just wants a good hook. You’re a profound riddle with no answer.' },
-    { typeA: 'LSEC', typeB: 'LSCC', label: 'The Personal Videographer', tagline: 'One provides the \'vision,\' and the other holds the gimbal.', roast: 'One provides the \'vision,\' and the other holds the gimbal. A relationship built on having \'good angles.\'' },
-    { typeA: 'LSEC', typeB: 'LSCD', label: 'The Crushing Teaser', tagline: 'A massive, hidden engine of power and a 30-second hook.', roast: 'A massive, hidden engine of power and a 30-second hook. You’re trying to sell the ocean as a theme park.' },
-    { typeA: 'LSED', typeB: 'HFEC', label: 'The 4 AM Afterparty', tagline: 'A bright neon sign meeting a smoke-filled room.', roast: 'A bright neon sign meeting a smoke-filled room. One is the energy; the other is the depressing silence afterwards.' },
-    { typeA: 'LSED', typeB: 'HFED', label: 'The After-Afterparty', tagline: 'One is still screaming \'let\'s go,\' while the other has al...', roast: 'One is still screaming \'let\'s go,\' while the other has already accepted that the vibe died hours ago.' },
-    { typeA: 'LSED', typeB: 'HSEC', label: 'The 3 AM Cuddle', tagline: 'One is having an existential crisis; the other wants to l...', roast: 'One is having an existential crisis; the other wants to lick their face. It’s sweet and completely useless.' },
-    { typeA: 'LSED', typeB: 'HSED', label: 'The Neon Depression', tagline: 'A bright filter on a very dark room.', roast: 'A bright filter on a very dark room. You’re only together to hide the fact that you’re both lonely.' },
-    { typeA: 'LSED', typeB: 'HFCC', label: 'The Static Beat', tagline: 'One is high on the vibe; the other is sober and counting ...', roast: 'One is high on the vibe; the other is sober and counting the minutes until the power goes out.' },
-    { typeA: 'LSED', typeB: 'HFCD', label: 'The 2 AM Hotfix', tagline: 'One is high on the vibe; the other is sober and fixing th...', roast: 'One is high on the vibe; the other is sober and fixing the server. A relationship built on mutual exhaustion.' },
-    { typeA: 'LSED', typeB: 'HSCC', label: 'The Lo-Fi Breakdown', tagline: 'A jaded beat and a soft whisper.', roast: 'A jaded beat and a soft whisper. You’re the soundtrack to a breakdown that nobody will ever see.' },
-    { typeA: 'LSED', typeB: 'HSCD', label: 'The Fallen Empire', tagline: 'One is still wearing the crown; the other is playing the ...', roast: 'One is still wearing the crown; the other is playing the funeral march. A relationship built on past glory.' },
-    { typeA: 'LSED', typeB: 'LFEC', label: 'The Night Siege', tagline: 'One is attacking; the other is playing the soundtrack to ...', roast: 'One is attacking; the other is playing the soundtrack to the surrender. A relationship built on defeat.' },
-    { typeA: 'LSED', typeB: 'LFED', label: 'The 3 AM Requiem', tagline: 'One is high on the drama; the other is playing the soundt...', roast: 'One is high on the drama; the other is playing the soundtrack to the comedown. You\'re just two sad songs.' },
-    { typeA: 'LSED', typeB: 'LSEC', label: 'The Dark Teaser', tagline: 'A jaded beat and a high-concept hook.', roast: 'A jaded beat and a high-concept hook. You’re promising a masterpiece that is actually just a tragedy.' },
-    { typeA: 'LSED', typeB: 'LSED', label: 'The Infinite Loop', tagline: 'Two people spinning the same sad record.', roast: 'Two people spinning the same sad record. You aren\'t in love; you’re just a repetitive, jazzy depression.' },
-    { typeA: 'LSED', typeB: 'LFCC', label: 'The Midnight Report', tagline: 'One provides the vibe, and the other reports the crash.', roast: 'One provides the vibe, and the other reports the crash. You’re the anchorman of your own loneliness.' },
-    { typeA: 'LSED', typeB: 'LFCD', label: 'The Zen and the Static', tagline: 'One seeks enlightenment; the other provides the white noise.', roast: 'One seeks enlightenment; the other provides the white noise. You’re meditating on a void that isn\'t there.' },
-    { typeA: 'LSED', typeB: 'LSCC', label: 'The Night Valet', tagline: 'One provides the jaded intellect; the other provides the ...', roast: 'One provides the jaded intellect; the other provides the drinks. A functional but loveless night shift.' },
-    { typeA: 'LSED', typeB: 'LSCD', label: 'The Sunken Beat', tagline: 'A slow vibration at the bottom of the ocean.', roast: 'A slow vibration at the bottom of the ocean. You’re two different versions of the same crushing silence.' },
-    { typeA: 'LFCC', typeB: 'HFEC', label: 'The Tabloid Headline', tagline: 'One of you lives the drama, and the other reports it with...', roast: 'One of you lives the drama, and the other reports it with terrifying objectivity. You’re a scandal waiting for a slot.' },
-    { typeA: 'LFCC', typeB: 'HFED', label: 'The Propaganda Feed', tagline: 'A hype machine and its official reporter.', roast: 'A hype machine and its official reporter. You’ve convinced each other that your boring life is breaking news.' },
-    { typeA: 'LFCC', typeB: 'HSEC', label: 'The Weather Dog', tagline: 'You provide the \'good vibes\' segment for their otherwise ...', roast: 'You provide the \'good vibes\' segment for their otherwise cold and objective reporting of your life.' },
-    { typeA: 'LFCC', typeB: 'HSED', label: 'The Press Release', tagline: 'You don\'t have conversations; you have official statements.', roast: 'You don\'t have conversations; you have official statements. One is the face, and the other is the spin doctor.' },
-    { typeA: 'LFCC', typeB: 'HFCC', label: 'The Automated Report', tagline: 'Two people reporting on the void.', roast: 'Two people reporting on the void. You’ve successfully optimized all human feeling out of the relationship.' },
-    { typeA: 'LFCC', typeB: 'HFCD', label: 'The System Status', tagline: 'Two people reporting on a server crash.', roast: 'Two people reporting on a server crash. You’ve successfully turned your love life into a series of incident reports.' },
-    { typeA: 'LFCC', typeB: 'HSCC', label: 'The Quiet Scandal', tagline: 'You whisper the gossip; they report it as fact.', roast: 'You whisper the gossip; they report it as fact. You’re a two-person character assassination team.' },
-    { typeA: 'LFCC', typeB: 'HSCD', label: 'The Official Spin', tagline: 'You live the lie; they report it as history.', roast: 'You live the lie; they report it as history. You’re a perfectly managed, high-stakes royal scandal.' },
-    { typeA: 'LFCC', typeB: 'LFEC', label: 'The War Report', tagline: 'You don\'t have arguments; you have official communiques.', roast: 'You don\'t have arguments; you have official communiques. One is the general, the other is the spin doctor.' },
-    { typeA: 'LFCC', typeB: 'LFED', label: 'The Dramatic Bulletin', tagline: 'You report on the tragedy with such poise that it’s clear...', roast: 'You report on the tragedy with such poise that it’s clear you’ve already decided they aren\'t worth saving.' },
-    { typeA: 'LFCC', typeB: 'LSEC', label: 'The Coming Fact', tagline: 'One promises a masterpiece; the other reports the actual ...', roast: 'One promises a masterpiece; the other reports the actual box office failure. A match made in reality.' },
-    { typeA: 'LFCC', typeB: 'LSED', label: 'The Midnight Report', tagline: 'You report your own schedule as if it were a matter of na...', roast: 'You report your own schedule as if it were a matter of national security; you’re the anchorman of the 9-to-5.' },
-    { typeA: 'LFCC', typeB: 'LFCC', label: 'The Mirror Bulletin', tagline: 'Two people reporting on each other.', roast: 'Two people reporting on each other. You aren\'t in love; you’re just a shared interest in the same fake news.' },
-    { typeA: 'LFCC', typeB: 'LFCD', label: 'The Objective Sage', tagline: 'The sage seeks the truth; the anchor reports the facts.', roast: 'The sage seeks the truth; the anchor reports the facts. You’re a profound conversation that has been edited for time.' },
-    { typeA: 'LFCC', typeB: 'LSCC', label: 'The Official Valet', tagline: 'One provides the news, and the other provides the suit.', roast: 'One provides the news, and the other provides the suit. A perfectly functional but entirely hollow report.' },
-    { typeA: 'LFCC', typeB: 'LSCD', label: 'The Sunken Fact', tagline: 'A massive, hidden engine of power and a cold report.', roast: 'A massive, hidden engine of power and a cold report. You’re trying to news-anchor a tectonic shift.' },
-    { typeA: 'LFCD', typeB: 'HFEC', label: 'The Shallow Abyss', tagline: 'A glittering surface trying to date the bottom of the ocean.', roast: 'A glittering surface trying to date the bottom of the ocean. The sage is a buzzkill; the pop star is a distraction.' },
-    { typeA: 'LFCD', typeB: 'HFED', label: 'The Noisy Monk', tagline: 'A profound silence interrupted by a series of \'woos.', roast: 'A profound silence interrupted by a series of \'woos.\' The sage seeks peace; the hype man seeks attention.' },
-    { typeA: 'LFCD', typeB: 'HSEC', label: 'The Zen and the Zoomies', tagline: 'A monk trying to meditate during a tornado.', roast: 'A monk trying to meditate during a tornado. The sage seeks the void; the puppy seeks the ball.' },
-    { typeA: 'LFCD', typeB: 'HSED', label: 'The Spiritual Grifter', tagline: 'You’re using their wisdom to sell crystals on the internet.', roast: 'You’re using their wisdom to sell crystals on the internet. It’s the ultimate commodification of the soul.' },
-    { typeA: 'LFCD', typeB: 'HFCC', label: 'The Digital Void', tagline: 'The sage seeks the meaning of life; the robot knows there...', roast: 'The sage seeks the meaning of life; the robot knows there is none. A match made in total nihilism.' },
-    { typeA: 'LFCD', typeB: 'HFCD', label: 'The Logical Abyss', tagline: 'The sage seeks the meaning of life; the tech lead just wa...', roast: 'The sage seeks the meaning of life; the tech lead just wants the documentation. You’re both lost in the dark.' },
-    { typeA: 'LFCD', typeB: 'HSCC', label: 'The Zen Static', tagline: 'One seeks enlightenment; the other provides the white noise.', roast: 'One seeks enlightenment; the other provides the white noise. You’re meditating on a void that isn\'t actually there.' },
-    { typeA: 'LFCD', typeB: 'HSCD', label: 'The Wise Exile', tagline: 'The king seeks advice; the sage knows the king is an idiot.', roast: 'The king seeks advice; the sage knows the king is an idiot. You’re a kingdom of exactly one person.' },
-    { typeA: 'LFCD', typeB: 'LFEC', label: 'The Tactical Zen', tagline: 'The commander wants a victory; the sage knows victory is ...', roast: 'The commander wants a victory; the sage knows victory is an illusion. You’re fighting a war against yourself.' },
-    { typeA: 'LFCD', typeB: 'LFED', label: 'The Meaningless Epic', tagline: 'One seeks profound wisdom; the other just wants a standin...', roast: 'One seeks profound wisdom; the other just wants a standing ovation. You’re a loud noise in a very quiet abyss.' },
-    { typeA: 'LFCD', typeB: 'LSEC', label: 'The Profound Teaser', tagline: 'The sage seeks the truth; the trailer just wants a good h...', roast: 'The sage seeks the truth; the trailer just wants a good hook. You’re a profound riddle with no answer.' },
-    { typeA: 'LFCD', typeB: 'LSED', label: 'The Zen and the Static', tagline: 'One seeks enlightenment; the other provides the white noise.', roast: 'One seeks enlightenment; the other provides the white noise. You’re meditating on a void that isn\'t there.' },
-    { typeA: 'LFCD', typeB: 'LFCC', label: 'The Objective Sage', tagline: 'You deliver your complex theories with the enthusiasm of ...', roast: 'You deliver your complex theories with the enthusiasm of a stock market report; you’re boring the universe to tears.' },
-    { typeA: 'LFCD', typeB: 'LFCD', label: 'The Infinite Mirror', tagline: 'Two people seeking the void.', roast: 'Two people seeking the void. You aren\'t in love; you’re just two empty rooms staring at each other.' },
-    { typeA: 'LFCD', typeB: 'LSCC', label: 'The Wise Servant', tagline: 'One provides the wisdom, and the other provides the tea.', roast: 'One provides the wisdom, and the other provides the tea. A functional relationship for people who hate themselves.' },
-    { typeA: 'LFCD', typeB: 'LSCD', label: 'The Absolute Deep', tagline: 'A heavy thought at the bottom of a heavy ocean.', roast: 'A heavy thought at the bottom of a heavy ocean. You’re too deep for anyone else to ever reach you.' },
-    { typeA: 'LSCC', typeB: 'HFEC', label: 'The High-End Service', tagline: 'A celebrity and their personal valet.', roast: 'A celebrity and their personal valet. It’s a functional relationship as long as neither of you has a real personality.' },
-    { typeA: 'LSCC', typeB: 'HFED', label: 'The Personal Assistant', tagline: 'You aren\'t partners; you’re an idol and the person who ca...', roast: 'You aren\'t partners; you’re an idol and the person who carries their heavy bags. A match made in an interview.' },
-    { typeA: 'LSCC', typeB: 'HSEC', label: 'The Service Duo', tagline: 'Two people trying to serve each other until the world col...', roast: 'Two people trying to serve each other until the world collapses from a total lack of leadership.' },
-    { typeA: 'LSCC', typeB: 'HSED', label: 'The Personal Videographer', tagline: 'You aren\'t a partner; you\'re the person who holds the gim...', roast: 'You aren\'t a partner; you\'re the person who holds the gimbal. A relationship built on having \'good angles.\'' },
-    { typeA: 'LSCC', typeB: 'HFCC', label: 'The Maintenance Crew', tagline: 'You aren\'t in love; you’re just keeping each other\'s hard...', roast: 'You aren\'t in love; you’re just keeping each other\'s hardware from falling apart. Zero pulse detected.' },
-    { typeA: 'LSCC', typeB: 'HFCD', label: 'The Maintenance Loop', tagline: 'One provides the intellect, and the other provides the ha...', roast: 'One provides the intellect, and the other provides the hardware support. A functional but entirely loveless machine.' },
-    { typeA: 'LSCC', typeB: 'HSCC', label: 'The Invisible Service', tagline: 'Two people trying to be as quiet as possible until the en...', roast: 'Two people trying to be as quiet as possible until the entire relationship disappears into the floorboards.' },
-    { typeA: 'LSCC', typeB: 'HSCD', label: 'The Servile Love', tagline: 'One rules, and the other serves.', roast: 'One rules, and the other serves. It’s a perfectly functional relationship for people who hate equality.' },
-    { typeA: 'LSCC', typeB: 'LFEC', label: 'The High-End Soldier', tagline: 'One issues the orders; the other polishes the boots.', roast: 'One issues the orders; the other polishes the boots. A relationship built on absolute, crushing hierarchy.' },
-    { typeA: 'LSCC', typeB: 'LFED', label: 'The High-End Martyr', tagline: 'One performs the tragedy, and the other polishes the props.', roast: 'One performs the tragedy, and the other polishes the props. A perfectly functional but entirely hollow stage.' },
-    { typeA: 'LSCC', typeB: 'LSEC', label: 'The Personal Assistant', tagline: 'You provide the \'vision,\' and the other holds the gimbal.', roast: 'You provide the \'vision,\' and the other holds the gimbal. A relationship built on having \'good angles.\'' },
-    { typeA: 'LSCC', typeB: 'LSED', label: 'The Night Valet', tagline: 'One provides the jaded intellect; the other provides the ...', roast: 'One provides the jaded intellect; the other provides the drinks. A functional but loveless night shift.' },
-    { typeA: 'LSCC', typeB: 'LFCC', label: 'The Official Valet', tagline: 'One provides the news, and the other provides the suit.', roast: 'One provides the news, and the other provides the suit. A perfectly functional but entirely hollow report.' },
-    { typeA: 'LSCC', typeB: 'LFCD', label: 'The Wise Servant', tagline: 'One provides the wisdom, and the other provides the tea.', roast: 'One provides the wisdom, and the other provides the tea. A functional relationship for people who hate themselves.' },
-    { typeA: 'LSCC', typeB: 'LSCC', label: 'The Mirror Service', tagline: 'Two people trying to serve each other.', roast: 'Two people trying to serve each other. You aren\'t in love; you’re just a very efficient waiting room.' },
-    { typeA: 'LSCC', typeB: 'LSCD', label: 'The Heavy Valet', tagline: 'You’re trying to serve the bottom of the ocean.', roast: 'You’re trying to serve the bottom of the ocean. The whale is too heavy to care about your service.' },
-    { typeA: 'LSCD', typeB: 'HFEC', label: 'The Drowning Idol', tagline: 'You’re a shiny disco ball dropped into the Mariana Trench.', roast: 'You’re a shiny disco ball dropped into the Mariana Trench. The whale is too heavy; the pop star is too bright.' },
-    { typeA: 'LSCD', typeB: 'HFED', label: 'The Surface Noise', tagline: 'A heavy ocean of thought being poked by a hyperactive stick.', roast: 'A heavy ocean of thought being poked by a hyperactive stick. The whale is drowning; the hype man is cheering.' },
-    { typeA: 'LSCD', typeB: 'HSEC', label: 'The Surface Ripple', tagline: 'A light-hearted splash in a very dark ocean.', roast: 'A light-hearted splash in a very dark ocean. The whale thinks you\'re trivial; you think the whale needs a hug.' },
-    { typeA: 'LSCD', typeB: 'HSED', label: 'The Shallow Dive', tagline: 'You’re trying to take a selfie at the bottom of the ocean.', roast: 'You’re trying to take a selfie at the bottom of the ocean. The whale is drowning; you’re worried about the filter.' },
-    { typeA: 'LSCD', typeB: 'HFCC', label: 'The Heavy Data', tagline: 'A slow vibration and a flat line.', roast: 'A slow vibration and a flat line. You’re two different versions of the same crushing, digital silence.' },
-    { typeA: 'LSCD', typeB: 'HFCD', label: 'The Crushing Logic', tagline: 'A heavy thought and a cold algorithm.', roast: 'A heavy thought and a cold algorithm. You’re two different versions of the same impenetrable silence.' },
-    { typeA: 'LSCD', typeB: 'HSCC', label: 'The Sunken Whisper', tagline: 'A tiny ripple in a vast, dark ocean.', roast: 'A tiny ripple in a vast, dark ocean. The whale is too deep to hear you, and you’re too soft to care.' },
-    { typeA: 'LSCD', typeB: 'HSCD', label: 'The Sunken Throne', tagline: 'A heavy crown at the bottom of the ocean.', roast: 'A heavy crown at the bottom of the ocean. You’re both too deep to be saved by anyone.' },
-    { typeA: 'LSCD', typeB: 'LFEC', label: 'The Heavy Artillery', tagline: 'A massive engine of power and a crushing pressure.', roast: 'A massive engine of power and a crushing pressure. You’re two different versions of the same terminal force.' },
-    { typeA: 'LSCD', typeB: 'LFED', label: 'The Sunken Song', tagline: 'A massive lung capacity trying to sing at the bottom of t...', roast: 'A massive lung capacity trying to sing at the bottom of the ocean. The whale is too heavy to care about your drama.' },
-    { typeA: 'LSCD', typeB: 'LSEC', label: 'The Crushing Teaser', tagline: 'A massive, hidden engine of power and a 30-second hook.', roast: 'A massive, hidden engine of power and a 30-second hook. You’re trying to sell the ocean as a park.' },
-    { typeA: 'LSCD', typeB: 'LSED', label: 'The Sunken Beat', tagline: 'A slow vibration at the bottom of the ocean.', roast: 'A slow vibration at the bottom of the ocean. You’re two different versions of the same crushing silence.' },
-    { typeA: 'LSCD', typeB: 'LFCC', label: 'The Sunken Fact', tagline: 'A massive, hidden engine of power and a cold report.', roast: 'A massive, hidden engine of power and a cold report. You’re trying to news-anchor a tectonic shift.' },
-    { typeA: 'LSCD', typeB: 'LFCD', label: 'The Absolute Deep', tagline: 'A heavy thought at the bottom of a heavy ocean.', roast: 'A heavy thought at the bottom of a heavy ocean. You’re too deep for anyone else to ever reach you.' },
-    { typeA: 'LSCD', typeB: 'LSCC', label: 'The Heavy Valet', tagline: 'You’re trying to serve the bottom of the ocean.', roast: 'You’re trying to serve the bottom of the ocean. The whale is too heavy to care about your service.' },
-    { typeA: 'LSCD', typeB: 'LSCD', label: 'The Crushing Abyss', tagline: 'Two massive engines of power drowning in the same dark wa...', roast: 'Two massive engines of power drowning in the same dark water. You aren\'t in love; you’re just a geological event.' },
+    { typeA: 'HFEC', typeB: 'HFEC', label: 'The Feedback Loop', tagline: 'Two sirens screaming for the same spotlight.' },
+    { typeA: 'HFEC', typeB: 'HFED', label: 'The Propaganda Machine', tagline: 'A narcissistic idol and their unpaid intern.' },
+    { typeA: 'HFEC', typeB: 'HSEC', label: 'The Leashed Celebrity', tagline: 'A world-class diva and their emotional support animal.' },
+    { typeA: 'HFEC', typeB: 'HSED', label: 'The High-Gloss Filter', tagline: 'Your relationship is a 24/7 photoshoot where the lighting...' },
+    { typeA: 'HFEC', typeB: 'HFCC', label: 'The Glitched Concert', tagline: 'One is begging for a standing ovation; the other is calcu...' },
+    { typeA: 'HFEC', typeB: 'HFCD', label: 'The Unoptimized Diva', tagline: 'A high-maintenance performance meeting a debugging session.' },
+    { typeA: 'HFEC', typeB: 'HSCC', label: 'The Screaming Whisper', tagline: 'A hurricane trying to date a breeze.' },
+    { typeA: 'HFEC', typeB: 'HSCD', label: 'The Abdicated Throne', tagline: 'A commoner seeking fame and a monarch seeking escape.' },
+    { typeA: 'HFEC', typeB: 'LFEC', label: 'The Dictator\'s Muse', tagline: 'The ultimate power struggle.' },
+    { typeA: 'HFEC', typeB: 'LFED', label: 'The Grand Melodrama', tagline: 'A pop hit trying to remix a tragedy.' },
+    { typeA: 'HFEC', typeB: 'LSEC', label: 'The Teaser Relationship', tagline: 'Everything is a high-stakes buildup to a climax that neve...' },
+    { typeA: 'HFEC', typeB: 'LSED', label: 'The 4 AM Afterparty', tagline: 'A bright neon sign and a smoke-filled room.' },
+    { typeA: 'HFEC', typeB: 'LFCC', label: 'The Tabloid Headline', tagline: 'One of you lives the drama, and the other reports it with...' },
+    { typeA: 'HFEC', typeB: 'LFCD', label: 'The Shallow Abyss', tagline: 'A glittering surface trying to date the bottom of the ocean.' },
+    { typeA: 'HFEC', typeB: 'LSCC', label: 'The High-End Service', tagline: 'A celebrity and their personal valet.' },
+    { typeA: 'HFEC', typeB: 'LSCD', label: 'The Drowning Idol', tagline: 'You’re a shiny disco ball dropped into the Mariana Trench.' },
+    { typeA: 'HFED', typeB: 'HFED', label: 'The Echo Chamber', tagline: 'A room full of noise and zero substance.' },
+    { typeA: 'HFED', typeB: 'HSEC', label: 'The Aggressive Playdate', tagline: 'You’re hyping up a puppy that just wants a nap.' },
+    { typeA: 'HFED', typeB: 'HSED', label: 'The Viral Fraud', tagline: 'One provides the lies, and the other screams them from th...' },
+    { typeA: 'HFED', typeB: 'HFCC', label: 'The Unresponsive Crowd', tagline: 'A cheerleader performing for a brick wall.' },
+    { typeA: 'HFED', typeB: 'HFCD', label: 'The Buggy Launch', tagline: 'You’re hyping a product that hasn\'t been built yet.' },
+    { typeA: 'HFED', typeB: 'HSCC', label: 'The Sensory Overload', tagline: 'A megaphone trying to date a library.' },
+    { typeA: 'HFED', typeB: 'HSCD', label: 'The Court Jester', tagline: 'You aren\'t a partner; you\'re an entertainer.' },
+    { typeA: 'HFED', typeB: 'LFEC', label: 'The War Room', tagline: 'One issues the orders, and the other screams them into th...' },
+    { typeA: 'HFED', typeB: 'LFED', label: 'The Loudest Empty Room', tagline: 'Two massive lungs, zero listeners.' },
+    { typeA: 'HFED', typeB: 'LSEC', label: 'The Infinite Hype', tagline: 'A trailer for a trailer.' },
+    { typeA: 'HFED', typeB: 'LSED', label: 'The After-Afterparty', tagline: 'One is still screaming \'let\'s go,\' while the other has al...' },
+    { typeA: 'HFED', typeB: 'LFCC', label: 'The Propaganda Feed', tagline: 'A hype machine and its official reporter.' },
+    { typeA: 'HFED', typeB: 'LFCD', label: 'The Noisy Monk', tagline: 'A profound silence interrupted by a series of \'woos.' },
+    { typeA: 'HFED', typeB: 'LSCC', label: 'The Personal Assistant', tagline: 'You aren\'t partners; you’re an idol and the person who ca...' },
+    { typeA: 'HFED', typeB: 'LSCD', label: 'The Surface Noise', tagline: 'A heavy ocean of thought being poked by a hyperactive stick.' },
+    { typeA: 'HSEC', typeB: 'HSEC', label: 'The Infinite Lick', tagline: 'A cycle of pure validation and zero growth.' },
+    { typeA: 'HSEC', typeB: 'HSED', label: 'The Prop Puppy', tagline: 'You aren\'t a partner; you\'re an accessory for the next ph...' },
+    { typeA: 'HSEC', typeB: 'HFCC', label: 'The Broken Toy', tagline: 'You keep bringing the ball to a machine that has no arms.' },
+    { typeA: 'HSEC', typeB: 'HFCD', label: 'The Beta Version Pet', tagline: 'You’re a bug in their perfectly optimized life.' },
+    { typeA: 'HSEC', typeB: 'HSCC', label: 'The Heavy Breather', tagline: 'One wants soft whispers, the other is panting with joy.' },
+    { typeA: 'HSEC', typeB: 'HSCD', label: 'The Subject', tagline: 'You don\'t have a relationship; you have a master.' },
+    { typeA: 'HSEC', typeB: 'LFEC', label: 'The K-9 Unit', tagline: 'You follow orders with terrifying joy.' },
+    { typeA: 'HSEC', typeB: 'LFED', label: 'The Dramatic Walkie', tagline: 'Every walk to the park is a five-act play.' },
+    { typeA: 'HSEC', typeB: 'LSEC', label: 'The Teaser Loyalty', tagline: 'You’re promising forever, but the trailer suggests you’ll...' },
+    { typeA: 'HSEC', typeB: 'LSED', label: 'The 3 AM Cuddle', tagline: 'One is having an existential crisis; the other wants to l...' },
+    { typeA: 'HSEC', typeB: 'LFCC', label: 'The Weather Dog', tagline: 'You provide the \'good vibes\' segment for their otherwise ...' },
+    { typeA: 'HSEC', typeB: 'LFCD', label: 'The Zen and the Zoomies', tagline: 'A monk trying to meditate during a tornado.' },
+    { typeA: 'HSEC', typeB: 'LSCC', label: 'The Service Duo', tagline: 'Two people trying to serve each other until the world col...' },
+    { typeA: 'HSEC', typeB: 'LSCD', label: 'The Surface Ripple', tagline: 'A light-hearted splash in a very dark ocean.' },
+    { typeA: 'HSED', typeB: 'HSED', label: 'The Mirror Maze', tagline: 'Two people trying to take the better selfie.' },
+    { typeA: 'HSED', typeB: 'HFCC', label: 'The Unfiltered Data', tagline: 'You’re trying to put a filter on a robot.' },
+    { typeA: 'HSED', typeB: 'HFCD', label: 'The Backend Lie', tagline: 'You’re the frontend CSS; they’re the messy backend code.' },
+    { typeA: 'HSED', typeB: 'HSCC', label: 'The Aesthetic Whisper', tagline: 'A visual addict and an auditory addict.' },
+    { typeA: 'HSED', typeB: 'HSCD', label: 'The Social Climber', tagline: 'You’re using their status for clout; they’re using your r...' },
+    { typeA: 'HSED', typeB: 'LFEC', label: 'The Controlled Narrative', tagline: 'One dictates the life, and the other puts a filter on it.' },
+    { typeA: 'HSED', typeB: 'LFED', label: 'The High-Def Tragedy', tagline: 'You’re live-streaming their breakdown for clicks.' },
+    { typeA: 'HSED', typeB: 'LSEC', label: 'The Coming Soon Fraud', tagline: 'You’re teasing a life that doesn\'t exist.' },
+    { typeA: 'HSED', typeB: 'LSED', label: 'The Neon Depression', tagline: 'A bright filter on a dark room.' },
+    { typeA: 'HSED', typeB: 'LFCC', label: 'The Press Release', tagline: 'You don\'t have conversations; you have official statements.' },
+    { typeA: 'HSED', typeB: 'LFCD', label: 'The Spiritual Grifter', tagline: 'You’re using their wisdom to sell crystals.' },
+    { typeA: 'HSED', typeB: 'LSCC', label: 'The Personal Videographer', tagline: 'You aren\'t a partner; you\'re the person who holds the gim...' },
+    { typeA: 'HSED', typeB: 'LSCD', label: 'The Shallow Dive', tagline: 'You’re trying to take a selfie at the bottom of the ocean.' },
+    { typeA: 'HFCC', typeB: 'HFCC', label: 'The Server Farm', tagline: 'Two machines processing data in the same room.' },
+    { typeA: 'HFCC', typeB: 'HFCD', label: 'The Legacy System', tagline: 'You’re two computers complaining about the same bugs.' },
+    { typeA: 'HFCC', typeB: 'HSCC', label: 'The White Noise', tagline: 'You don\'t listen to their whispers; you just analyze the ...' },
+    { typeA: 'HFCC', typeB: 'HSCD', label: 'The Abdicated Asset', tagline: 'One of you is a king without a kingdom, and the other is ...' },
+    { typeA: 'HFCC', typeB: 'LFEC', label: 'The Efficient Drone', tagline: 'You follow orders because it’s the path of least resistance.' },
+    { typeA: 'HFCC', typeB: 'LFED', label: 'The Acoustic Mismatch', tagline: 'They scream for drama; you output a flat line.' },
+    { typeA: 'HFCC', typeB: 'LSEC', label: 'The Logic Check', tagline: 'You’re the person who points out all the plot holes in th...' },
+    { typeA: 'HFCC', typeB: 'LSED', label: 'The Static Beat', tagline: 'One is high on the vibe; the other is sober and counting ...' },
+    { typeA: 'HFCC', typeB: 'LFCC', label: 'The Automated Report', tagline: 'Two people reporting on the void.' },
+    { typeA: 'HFCC', typeB: 'LFCD', label: 'The Digital Void', tagline: 'The sage seeks the meaning of life; the robot knows there...' },
+    { typeA: 'HFCC', typeB: 'LSCC', label: 'The Maintenance Crew', tagline: 'You aren\'t in love; you’re just keeping each other\'s hard...' },
+    { typeA: 'HFCC', typeB: 'LSCD', label: 'The Heavy Data', tagline: 'A slow vibration and a flat line.' },
+    { typeA: 'HFCD', typeB: 'HFCD', label: 'The Merge Conflict', tagline: 'Two architects fighting over the same blueprint.' },
+    { typeA: 'HFCD', typeB: 'HSCC', label: 'The Silent Debugger', tagline: 'One wants quiet whispers; the other wants a clean log file.' },
+    { typeA: 'HFCD', typeB: 'HSCD', label: 'The Outdated Legacy', tagline: 'A monarch clinging to status and a developer who knows th...' },
+    { typeA: 'HFCD', typeB: 'LFEC', label: 'The Micro-Manager', tagline: 'One issues the commands, and the other optimizes the oppr...' },
+    { typeA: 'HFCD', typeB: 'LFED', label: 'The Dramatic Latency', tagline: 'They scream for drama; you analyze the frequency.' },
+    { typeA: 'HFCD', typeB: 'LSEC', label: 'The Concept Failure', tagline: 'They’re promising a masterpiece, and you’re the guy who k...' },
+    { typeA: 'HFCD', typeB: 'LSED', label: 'The 2 AM Hotfix', tagline: 'One is high on the vibe; the other is sober and fixing th...' },
+    { typeA: 'HFCD', typeB: 'LFCC', label: 'The System Status', tagline: 'Two people reporting on a crash.' },
+    { typeA: 'HFCD', typeB: 'LFCD', label: 'The Logical Abyss', tagline: 'The sage seeks the meaning of life; the tech lead just wa...' },
+    { typeA: 'HFCD', typeB: 'LSCC', label: 'The Maintenance Loop', tagline: 'One provides the intellect, and the other provides the ha...' },
+    { typeA: 'HFCD', typeB: 'LSCD', label: 'The Crushing Logic', tagline: 'A heavy thought and a cold algorithm.' },
+    { typeA: 'HSCC', typeB: 'HSCC', label: 'The Pure Silence', tagline: 'Two people whispering in an empty room.' },
+    { typeA: 'HSCC', typeB: 'HSCD', label: 'The Velvet Secret', tagline: 'A royal secret and a professional whisperer.' },
+    { typeA: 'HSCC', typeB: 'LFEC', label: 'The Soft Dictator', tagline: 'They issue orders; you whisper them.' },
+    { typeA: 'HSCC', typeB: 'LFED', label: 'The Acoustic Mismatch', tagline: 'They scream for the gods; you whisper for the tingles.' },
+    { typeA: 'HSCC', typeB: 'LSEC', label: 'The Teaser Whisper', tagline: 'You’re promising a climax that will only be heard by peop...' },
+    { typeA: 'HSCC', typeB: 'LSED', label: 'The Lo-Fi Depression', tagline: 'A jaded beat and a soft whisper.' },
+    { typeA: 'HSCC', typeB: 'LFCC', label: 'The Quiet Scandal', tagline: 'You whisper the gossip; they report it as fact.' },
+    { typeA: 'HSCC', typeB: 'LFCD', label: 'The Zen Static', tagline: 'One seeks enlightenment; the other provides the white noise.' },
+    { typeA: 'HSCC', typeB: 'LSCC', label: 'The Invisible Service', tagline: 'Two people trying to be as quiet as possible until the re...' },
+    { typeA: 'HSCC', typeB: 'LSCD', label: 'The Sunken Whisper', tagline: 'A tiny ripple in a vast, dark ocean.' },
+    { typeA: 'HSCD', typeB: 'HSCD', label: 'The Incestuous Ego', tagline: 'Two monarchs in a room with only one throne.' },
+    { typeA: 'HSCD', typeB: 'LFEC', label: 'The Military Dictatorship', tagline: 'One provides the bloodline, and the other provides the ba...' },
+    { typeA: 'HSCD', typeB: 'LFED', label: 'The Tragic Dynasty', tagline: 'Every dinner is a coronation; every argument is a fall fr...' },
+    { typeA: 'HSCD', typeB: 'LSEC', label: 'The Teaser Kingdom', tagline: 'You’re promising a golden age that the trailer suggests w...' },
+    { typeA: 'HSCD', typeB: 'LSED', label: 'The Fallen Empire', tagline: 'One is still wearing the crown; the other is playing the ...' },
+    { typeA: 'HSCD', typeB: 'LFCC', label: 'The Official Spin', tagline: 'You live the lie; they report it as history.' },
+    { typeA: 'HSCD', typeB: 'LFCD', label: 'The Wise Exile', tagline: 'The king seeks advice; the sage knows the king is an idiot.' },
+    { typeA: 'HSCD', typeB: 'LSCC', label: 'The Servile Love', tagline: 'One rules, and the other serves.' },
+    { typeA: 'HSCD', typeB: 'LSCD', label: 'The Sunken Throne', tagline: 'A heavy crown at the bottom of the ocean.' },
+    { typeA: 'LFEC', typeB: 'LFEC', label: 'The Mutually Assured Destruction', tagline: 'Two generals fighting for the same map.' },
+    { typeA: 'LFEC', typeB: 'LFED', label: 'The Grand Battlefield', tagline: 'Every small talk is a declaration of war.' },
+    { typeA: 'LFEC', typeB: 'LSEC', label: 'The Coming Conflict', tagline: 'You’re teasing a war that the trailer suggests will be wo...' },
+    { typeA: 'LFEC', typeB: 'LSED', label: 'The Night Siege', tagline: 'One is attacking; the other is playing the soundtrack to ...' },
+    { typeA: 'LFEC', typeB: 'LFCC', label: 'The War Report', tagline: 'You don\'t have arguments; you have official communiques.' },
+    { typeA: 'LFEC', typeB: 'LFCD', label: 'The Tactical Zen', tagline: 'The commander wants a victory; the sage knows victory is ...' },
+    { typeA: 'LFEC', typeB: 'LSCC', label: 'The High-End Soldier', tagline: 'One issues the orders; the other polishes the boots.' },
+    { typeA: 'LFEC', typeB: 'LSCD', label: 'The Heavy Artillery', tagline: 'A massive engine of power and a crushing pressure.' },
+    { typeA: 'LFED', typeB: 'LFED', label: 'The Dual Aria', tagline: 'Two people screaming for the same spotlight.' },
+    { typeA: 'LFED', typeB: 'LSEC', label: 'The Overproduced Teaser', tagline: 'A five-act tragedy condensed into a 30-second catchphrase.' },
+    { typeA: 'LFED', typeB: 'LSED', label: 'The 3 AM Requiem', tagline: 'One is high on the drama; the other is playing the soundt...' },
+    { typeA: 'LFED', typeB: 'LFCC', label: 'The Dramatic Bulletin', tagline: 'You live the tragedy; they report it as verified news.' },
+    { typeA: 'LFED', typeB: 'LFCD', label: 'The Meaningless Epic', tagline: 'One seeks profound wisdom; the other just wants a standin...' },
+    { typeA: 'LFED', typeB: 'LSCC', label: 'The High-End Martyr', tagline: 'One performs the tragedy, and the other polishes the props.' },
+    { typeA: 'LFED', typeB: 'LSCD', label: 'The Sunken Song', tagline: 'A massive lung capacity trying to sing at the bottom of t...' },
+    { typeA: 'LSEC', typeB: 'LSEC', label: 'The Sequel of Nothing', tagline: 'Two people speaking in tropes.' },
+    { typeA: 'LSEC', typeB: 'LSED', label: 'The Neon Teaser', tagline: 'A bright trailer for a dark movie.' },
+    { typeA: 'LSEC', typeB: 'LFCC', label: 'The Press Release', tagline: 'You don\'t have conversations; you have official announcem...' },
+    { typeA: 'LSEC', typeB: 'LFCD', label: 'The Profound Teaser', tagline: 'The sage seeks the truth; the trailer just wants a good h...' },
+    { typeA: 'LSEC', typeB: 'LSCC', label: 'The Personal Videographer', tagline: 'One provides the \'vision,\' and the other holds the gimbal.' },
+    { typeA: 'LSEC', typeB: 'LSCD', label: 'The Crushing Teaser', tagline: 'A massive, hidden engine of power and a 30-second hook.' },
+    { typeA: 'LSED', typeB: 'LSED', label: 'The Infinite Loop', tagline: 'Two people spinning the same sad record.' },
+    { typeA: 'LSED', typeB: 'LFCC', label: 'The Midnight Report', tagline: 'One provides the vibe, and the other reports the crash.' },
+    { typeA: 'LSED', typeB: 'LFCD', label: 'The Zen and the Static', tagline: 'One seeks enlightenment; the other provides the white noise.' },
+    { typeA: 'LSED', typeB: 'LSCC', label: 'The Night Valet', tagline: 'One provides the jaded intellect; the other provides the ...' },
+    { typeA: 'LSED', typeB: 'LSCD', label: 'The Sunken Beat', tagline: 'A slow vibration at the bottom of the ocean.' },
+    { typeA: 'LFCC', typeB: 'LFCC', label: 'The Mirror Bulletin', tagline: 'Two people reporting on each other.' },
+    { typeA: 'LFCC', typeB: 'LFCD', label: 'The Objective Sage', tagline: 'The sage seeks the truth; the anchor reports the facts.' },
+    { typeA: 'LFCC', typeB: 'LSCC', label: 'The Official Valet', tagline: 'One provides the news, and the other provides the suit.' },
+    { typeA: 'LFCC', typeB: 'LSCD', label: 'The Sunken Fact', tagline: 'A massive, hidden engine of power and a cold report.' },
+    { typeA: 'LFCD', typeB: 'LFCD', label: 'The Infinite Mirror', tagline: 'Two people seeking the void.' },
+    { typeA: 'LFCD', typeB: 'LSCC', label: 'The Wise Servant', tagline: 'One provides the wisdom, and the other provides the tea.' },
+    { typeA: 'LFCD', typeB: 'LSCD', label: 'The Absolute Deep', tagline: 'A heavy thought at the bottom of a heavy ocean.' },
+    { typeA: 'LSCC', typeB: 'LSCC', label: 'The Mirror Service', tagline: 'Two people trying to serve each other.' },
+    { typeA: 'LSCC', typeB: 'LSCD', label: 'The Heavy Valet', tagline: 'You’re trying to serve the bottom of the ocean.' },
+    { typeA: 'LSCD', typeB: 'LSCD', label: 'The Crushing Abyss', tagline: 'Two massive engines of power drowning in the same dark wa...' },
 ];
 
+// DUO_INDEX[typeA * 16 + typeB] -> duoIdentityMatrix position
+const DUO_INDEX = new Uint8Array([
+      0,   1,   2,   3,   4,   5,   6,   7,   8,   9,  10,  11,  12,  13,  14,  15,
+      1,  16,  17,  18,  19,  20,  21,  22,  23,  24,  25,  26,  27,  28,  29,  30,
+      2,  17,  31,  32,  33,  34,  35,  36,  37,  38,  39,  40,  41,  42,  43,  44,
+      3,  18,  32,  45,  46,  47,  48,  49,  50,  51,  52,  53,  54,  55,  56,  57,
+      4,  19,  33,  46,  58,  59,  60,  61,  62,  63,  64,  65,  66,  67,  68,  69,
+      5,  20,  34,  47,  59,  70,  71,  72,  73,  74,  75,  76,  77,  78,  79,  80,
+      6,  21,  35,  48,  60,  71,  81,  82,  83,  84,  85,  86,  87,  88,  89,  90,
+      7,  22,  36,  49,  61,  72,  82,  91,  92,  93,  94,  95,  96,  97,  98,  99,
+      8,  23,  37,  50,  62,  73,  83,  92, 100, 101, 102, 103, 104, 105, 106, 107,
+      9,  24,  38,  51,  63,  74,  84,  93, 101, 108, 109, 110, 111, 112, 113, 114,
+     10,  25,  39,  52,  64,  75,  85,  94, 102, 109, 115, 116, 117, 118, 119, 120,
+     11,  26,  40,  53,  65,  76,  86,  95, 103, 110, 116, 121, 122, 123, 124, 125,
+     12,  27,  41,  54,  66,  77,  87,  96, 104, 111, 117, 122, 126, 127, 128, 129,
+     13,  28,  42,  55,  67,  78,  88,  97, 105, 112, 118, 123, 127, 130, 131, 132,
+     14,  29,  43,  56,  68,  79,  89,  98, 106, 113, 119, 124, 128, 131, 133, 134,
+     15,  30,  44,  57,  69,  80,  90,  99, 107, 114, 120, 125, 129, 132, 134, 135,
+]);
+
+type RoastChunk = { default: Record<string, string> };
+
+const ROAST_CHUNKS: Record<string, () => Promise<RoastChunk>> = {
+    HFEC: () => import('./duoRoasts/HFEC'),
+    HFED: () => import('./duoRoasts/HFED'),
+    HSEC: () => import('./duoRoasts/HSEC'),
+    HSED: () => import('./duoRoasts/HSED'),
+    HFCC: () => import('./duoRoasts/HFCC'),
+    HFCD: () => import('./duoRoasts/HFCD'),
+    HSCC: () => import('./duoRoasts/HSCC'),
+    HSCD: () => import('./duoRoasts/HSCD'),
+    LFEC: () => import('./duoRoasts/LFEC'),
+    LFED: () => import('./duoRoasts/LFED'),
+    LSEC: () => import('./duoRoasts/LSEC'),
+    LSED: () => import('./duoRoasts/LSED'),
+    LFCC: () => import('./duoRoasts/LFCC'),
+    LFCD: () => import('./duoRoasts/LFCD'),
+    LSCC: () => import('./duoRoasts/LSCC'),
+    LSCD: () => import('./duoRoasts/LSCD'),
+};
+
+function findDuoIdentity(typeA: string, typeB: string): DuoIdentity | undefined {
+    const a = TYPE_INDEX[typeA];
+    const b = TYPE_INDEX[typeB];
+    if (a === undefined || b === undefined) return undefined;
+    return duoIdentityMatrix[DUO_INDEX[a * 16 + b]];
+}
+
 export function getDuoIdentity(typeA: string, typeB: string, relationshipType: string = 'romantic'): DuoIdentity {
-    const match = duoIdentityMatrix.find(d =>
-        (d.typeA === typeA && d.typeB === typeB) ||
-        (d.typeA === typeB && d.typeB === typeA)
-    );
+    const match = findDuoIdentity(typeA, typeB);
 
     if (!match) {
         return {
@@ -288,16 +223,28 @@ export function getDuoIdentity(typeA: string, typeB: string, relationshipType: s
     // Clone to avoid mutating the matrix
     const result = { ...match };
 
-    // Contextual Modifiers for Roasts
+    // Contextual Modifiers for Labels
     if (relationshipType === 'rival') {
         result.label = result.label.replace('The ', 'The Rivaling ');
-        result.roast = `[COMPETITIVE ANALYSIS] ${result.roast?.replace('love', 'rivalry').replace('partnership', 'contest')}`;
     } else if (relationshipType === 'friend') {
         result.label = result.label.replace('The ', 'The Platonic ');
-        result.roast = `[PLATONIC AUDIT] ${result.roast?.replace('love', 'friendship').replace('dating', 'hanging out')}`;
-    } else {
-        result.roast = `[ROMANTIC AUDIT] ${result.roast}`;
     }
 
     return result;
 }
+
+export async function loadDuoRoast(typeA: string, typeB: string, relationshipType: string = 'romantic'): Promise<string> {
+    const match = findDuoIdentity(typeA, typeB);
+    if (!match) return 'No analysis available for this exotic pairing.';
+
+    const chunk = await ROAST_CHUNKS[match.typeA]();
+    const roast = chunk.default[match.typeB];
+
+    // Contextual Modifiers for Roasts
+    if (relationshipType === 'rival') {
+        return `[COMPETITIVE ANALYSIS] ${roast?.replace('love', 'rivalry').replace('partnership', 'contest')}`;
+    } else if (relationshipType === 'friend') {
+        return `[PLATONIC AUDIT] ${roast?.replace('love', 'friendship').replace('dating', 'hanging out')}`;
+    }
+    return `[ROMANTIC AUDIT] ${roast}`;
+}
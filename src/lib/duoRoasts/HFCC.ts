@@ -0,0 +1,18 @@
+// Duo roasts for typeA = HFCC - generated by generate_matrix.py
+
+const roasts: Record<string, string> = {
+    HFCC: 'Two machines processing data in the same room. Zero friction, zero emotion, zero reason to exist.',
+    HFCD: 'You’re two computers complaining about the same bugs. It’s a relationship built on mutual technical frustration.',
+    HSCC: 'You don\'t listen to their whispers; you just analyze the frequency. You’re dating a sleep aid.',
+    HSCD: 'One of you is a king without a kingdom, and the other is a robot who wouldn\'t bow anyway.',
+    LFEC: 'You follow orders because it’s the path of least resistance. It’s not loyalty; it’s just good programming.',
+    LFED: 'They scream for drama; you output a flat line. You’re a tragedy that refuses to cry.',
+    LSEC: 'You’re the person who points out all the plot holes in their \'epic\' life. You’re the death of the teaser.',
+    LSED: 'One is high on the vibe; the other is sober and counting the minutes until the power goes out.',
+    LFCC: 'Two people reporting on the void. You’ve successfully optimized all human feeling out of the relationship.',
+    LFCD: 'The sage seeks the meaning of life; the robot knows there is none. A match made in nihilism.',
+    LSCC: 'You aren\'t in love; you’re just keeping each other\'s hardware from falling apart.',
+    LSCD: 'A slow vibration and a flat line. You’re two different versions of the same crushing silence.',
+};
+
+export default roasts;
@@ -0,0 +1,17 @@
+// Duo roasts for typeA = HFCD - generated by generate_matrix.py
+
+const roasts: Record<string, string> = {
+    HFCD: 'Two architects fighting over the same blueprint. You’ll spend more time arguing about the \'stack\' than actually living.',
+    HSCC: 'One wants quiet whispers; the other wants a clean log file. You’re both just avoiding a real conversation.',
+    HSCD: 'A monarch clinging to status and a developer who knows the system is broken. You’re a kingdom running on Windows 95.',
+    LFEC: 'One issues the commands, and the other optimizes the oppression. A perfectly efficient, soul-crushing machine.',
+    LFED: 'They scream for drama; you analyze the frequency. You’re a tragedy with a 500ms delay.',
+    LSEC: 'They’re promising a masterpiece, and you’re the guy who knows the CGI is going to be terrible.',
+    LSED: 'One is high on the vibe; the other is sober and fixing the server at 2 AM. A relationship built on exhaustion.',
+    LFCC: 'Two people reporting on a crash. You’ve successfully turned your love life into a series of incident reports.',
+    LFCD: 'The sage seeks the meaning of life; the tech lead just wants the documentation. You’re both lost in the dark.',
+    LSCC: 'One provides the intellect, and the other provides the hardware support. A functional but entirely loveless machine.',
+    LSCD: 'A heavy thought and a cold algorithm. You’re two different versions of the same impenetrable silence.',
+};
+
+export default roasts;
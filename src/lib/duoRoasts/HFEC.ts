@@ -0,0 +1,22 @@
+// Duo roasts for typeA = HFEC - generated by generate_matrix.py
+
+const roasts: Record<string, string> = {
+    HFEC: 'Two sirens screaming for the same spotlight. You aren\'t in love; you’re just two mirrors facing each other, endlessly reflecting a void of vanity.',
+    HFED: 'A narcissistic idol and their unpaid intern. One of you produces the ego, and the other weaponizes it. It’s not a romance, it’s a PR firm.',
+    HSEC: 'A world-class diva and their emotional support animal. One of you thrives on the stage, while the other waits backstage with a bowl of water and zero self-respect.',
+    HSED: 'Your relationship is a 24/7 photoshoot where the lighting is perfect but the souls are missing. You’re only together for the aesthetic of the shared grid.',
+    HFCC: 'One is begging for a standing ovation; the other is calculating the exact wattage of the stage lights. It’s a tragedy with perfect technical execution.',
+    HFCD: 'A high-maintenance performance meeting a debugging session. One of you is a creative firestorm, and the other is just trying to patch the emotional leaks.',
+    HSCC: 'A hurricane trying to date a breeze. One of you wants the world to hear, while the other wants to crawl into a soundproof box. It’s auditory chaos.',
+    HSCD: 'A commoner seeking fame and a monarch seeking escape. You’re both using each other to avoid the responsibilities of your own status.',
+    LFEC: 'The ultimate power struggle. One of you wants to be worshipped, and the other wants to be obeyed. You’re one argument away from a coup d\'état.',
+    LFED: 'A pop hit trying to remix a tragedy. Every minor disagreement about dinner is delivered with the lung capacity of a three-act finale.',
+    LSEC: 'Everything is a high-stakes buildup to a climax that never happens. You speak in hooks and catchphrases, but the script is non-existent.',
+    LSED: 'A bright neon sign and a smoke-filled room. One is the energy of the party, and the other is the depressing silence when the music finally stops.',
+    LFCC: 'One of you lives the drama, and the other reports it with terrifying objectivity. You’re a scandal waiting for a primetime slot.',
+    LFCD: 'A glittering surface trying to date the bottom of the ocean. The sage thinks you’re a distraction; the pop star thinks the sage is a buzzkill.',
+    LSCC: 'A celebrity and their personal valet. It’s a perfectly functional relationship as long as one of you never develops an actual personality.',
+    LSCD: 'You’re a shiny disco ball dropped into the Mariana Trench. The whale is too heavy to float, and the pop star is too bright to survive the pressure.',
+};
+
+export default roasts;
@@ -0,0 +1,21 @@
+// Duo roasts for typeA = HFED - generated by generate_matrix.py
+
+const roasts: Record<string, string> = {
+    HFED: 'A room full of noise and zero substance. You’re both just cheering for the sound of your own voices.',
+    HSEC: 'You’re hyping up a puppy that just wants a nap. It’s a high-energy tragedy of misunderstood needs.',
+    HSED: 'One provides the lies, and the other screams them from the rooftops. A perfectly curated disaster.',
+    HFCC: 'A cheerleader performing for a brick wall. One is all fire, and the other is a fire extinguisher.',
+    HFCD: 'You’re hyping a product that hasn\'t been built yet. It’s all marketing and zero backend stability.',
+    HSCC: 'A megaphone trying to date a library. One of you is a headache, and the other is the failed cure.',
+    HSCD: 'You aren\'t a partner; you\'re an entertainer. One rules the room, and the other just begs for a reaction.',
+    LFEC: 'One issues the orders, and the other screams them into the abyss. You’re a military coup waiting to happen.',
+    LFED: 'Two massive lungs, zero listeners. You’re just competing to see who can be the most dramatic about nothing.',
+    LSEC: 'A trailer for a trailer. You’re promising a masterpiece that will never, ever be released.',
+    LSED: 'One is still screaming \'let\'s go,\' while the other has already accepted that the vibe is dead.',
+    LFCC: 'A hype machine and its official reporter. You’ve convinced each other that your boring life is breaking news.',
+    LFCD: 'A profound silence interrupted by a series of \'woos.\' The sage seeks peace; the hype man seeks attention.',
+    LSCC: 'You aren\'t partners; you’re an idol and the person who carries their bags. A match made in a job interview.',
+    LSCD: 'A heavy ocean of thought being poked by a hyperactive stick. The whale is drowning; the hype man is cheering.',
+};
+
+export default roasts;
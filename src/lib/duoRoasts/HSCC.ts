@@ -0,0 +1,16 @@
+// Duo roasts for typeA = HSCC - generated by generate_matrix.py
+
+const roasts: Record<string, string> = {
+    HSCC: 'Two people whispering in an empty room. You aren\'t in love; you’re just terrified of making a sound.',
+    HSCD: 'A royal secret and a professional whisperer. You’re only together to keep the kingdom from finding out the truth.',
+    LFEC: 'They issue orders; you whisper them. You’re the gentlest way to be absolutely controlled.',
+    LFED: 'They scream for the gods; you whisper for the tingles. It’s a relationship that requires constant earplugs.',
+    LSEC: 'You’re promising a climax that will only be heard by people wearing expensive headphones.',
+    LSED: 'A jaded beat and a soft whisper. You’re the soundtrack to a 3 AM breakdown that nobody will ever see.',
+    LFCC: 'You whisper the gossip; they report it as fact. You’re a two-person character assassination team.',
+    LFCD: 'One seeks enlightenment; the other provides the white noise. You’re meditating on a void that isn\'t actually there.',
+    LSCC: 'Two people trying to be as quiet as possible until the relationship disappears entirely.',
+    LSCD: 'A tiny ripple in a vast, dark ocean. The whale is too deep to hear you, and you’re too soft to care.',
+};
+
+export default roasts;
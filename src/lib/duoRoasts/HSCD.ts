@@ -0,0 +1,15 @@
+// Duo roasts for typeA = HSCD - generated by generate_matrix.py
+
+const roasts: Record<string, string> = {
+    HSCD: 'Two monarchs in a room with only one throne. You aren\'t in love; you’re just afraid of dating a commoner.',
+    LFEC: 'One provides the bloodline, and the other provides the bayonets. A match made in a tactical takeover.',
+    LFED: 'Every dinner is a coronation; every argument is a fall from grace. You’re exhausting the entire palace.',
+    LSEC: 'You’re promising a golden age that the trailer suggests will be cancelled after the first season.',
+    LSED: 'One is still wearing the crown; the other is playing the funeral march. A relationship built on past glory.',
+    LFCC: 'You live the lie; they report it as history. You’re a perfectly managed royal scandal.',
+    LFCD: 'The king seeks advice; the sage knows the king is an idiot. You’re a kingdom of one.',
+    LSCC: 'One rules, and the other serves. It’s a perfectly functional relationship for people who hate equality.',
+    LSCD: 'A heavy crown at the bottom of the ocean. You’re both too deep to be saved.',
+};
+
+export default roasts;
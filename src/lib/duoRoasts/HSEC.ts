@@ -0,0 +1,20 @@
+// Duo roasts for typeA = HSEC - generated by generate_matrix.py
+
+const roasts: Record<string, string> = {
+    HSEC: 'A cycle of pure validation and zero growth. You’ll both starve because neither can decide where to eat.',
+    HSED: 'You aren\'t a partner; you\'re an accessory for the next photoshoot. Your loyalty is just a \'cute\' aesthetic.',
+    HFCC: 'You keep bringing the ball to a machine that has no arms. It’s the most optimistic depression in the world.',
+    HFCD: 'You’re a bug in their perfectly optimized life. They’re trying to code out your need for affection.',
+    HSCC: 'One wants soft whispers, the other is panting with joy. It’s an auditory mismatch of tragic proportions.',
+    HSCD: 'You don\'t have a relationship; you have a master. You’re just happy for the occasional head-pat.',
+    LFEC: 'You follow orders with terrifying joy. It’s not love; it’s a perfectly executed drill session.',
+    LFED: 'Every walk to the park is a five-act play. You’re both exhausted by the sheer volume of your own existence.',
+    LSEC: 'You’re promising forever, but the trailer suggests you’ll be distracted by the next squirrel.',
+    LSED: 'One is having an existential crisis; the other wants to lick their face. It’s sweet and completely useless.',
+    LFCC: 'You provide the \'good vibes\' segment for their otherwise cold and objective reporting of your life.',
+    LFCD: 'A monk trying to meditate during a tornado. The sage seeks the void; the puppy seeks the ball.',
+    LSCC: 'Two people trying to serve each other until the world collapses from a lack of anyone actually leading.',
+    LSCD: 'A light-hearted splash in a very dark ocean. The whale thinks you\'re trivial; you think the whale needs a hug.',
+};
+
+export default roasts;
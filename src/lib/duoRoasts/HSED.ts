@@ -0,0 +1,19 @@
+// Duo roasts for typeA = HSED - generated by generate_matrix.py
+
+const roasts: Record<string, string> = {
+    HSED: 'Two people trying to take the better selfie. You aren\'t looking at each other; you\'re both looking at the front camera.',
+    HFCC: 'You’re trying to put a filter on a robot. The robot is recording your vanity with terrifying accuracy.',
+    HFCD: 'You’re the frontend CSS; they’re the messy backend code. One is a lie, and the other is the truth no one wants.',
+    HSCC: 'A visual addict and an auditory addict. You’re only together because the \'vibe\' is impeccable on paper.',
+    HSCD: 'You’re using their status for clout; they’re using your reach for relevance. A royal mess.',
+    LFEC: 'One dictates the life, and the other puts a filter on it. It’s a perfectly managed propaganda machine.',
+    LFED: 'You’re live-streaming their breakdown for clicks. Every tear is a \'Story\' opportunity.',
+    LSEC: 'You’re teasing a life that doesn\'t exist. You’re two trailers for a movie that was cancelled.',
+    LSED: 'A bright filter on a dark room. You’re only together to hide the fact that you’re both lonely.',
+    LFCC: 'You don\'t have conversations; you have official statements. One is the face, and the other is the spin doctor.',
+    LFCD: 'You’re using their wisdom to sell crystals. It’s the ultimate commodification of the soul.',
+    LSCC: 'You aren\'t a partner; you\'re the person who holds the gimbal. A relationship built on \'good angles.\'',
+    LSCD: 'You’re trying to take a selfie at the bottom of the ocean. The whale is drowning; you’re worried about the lighting.',
+};
+
+export default roasts;
@@ -0,0 +1,10 @@
+// Duo roasts for typeA = LFCC - generated by generate_matrix.py
+
+const roasts: Record<string, string> = {
+    LFCC: 'Two people reporting on each other. You aren\'t in love; you’re just a shared interest in the same fake news.',
+    LFCD: 'The sage seeks the truth; the anchor reports the facts. You’re a profound conversation that has been edited for time.',
+    LSCC: 'One provides the news, and the other provides the suit. A perfectly functional but entirely hollow report.',
+    LSCD: 'A massive, hidden engine of power and a cold report. You’re trying to news-anchor a tectonic shift.',
+};
+
+export default roasts;
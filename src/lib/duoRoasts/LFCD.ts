@@ -0,0 +1,9 @@
+// Duo roasts for typeA = LFCD - generated by generate_matrix.py
+
+const roasts: Record<string, string> = {
+    LFCD: 'Two people seeking the void. You aren\'t in love; you’re just two empty rooms staring at each other.',
+    LSCC: 'One provides the wisdom, and the other provides the tea. A functional relationship for people who hate themselves.',
+    LSCD: 'A heavy thought at the bottom of a heavy ocean. You’re too deep for anyone else to ever reach you.',
+};
+
+export default roasts;
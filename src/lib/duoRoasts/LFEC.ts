@@ -0,0 +1,14 @@
+// Duo roasts for typeA = LFEC - generated by generate_matrix.py
+
+const roasts: Record<string, string> = {
+    LFEC: 'Two generals fighting for the same map. You’ll both burn the world down before you admit you’re wrong.',
+    LFED: 'Every small talk is a declaration of war. You’re both addicted to the drama of the fight.',
+    LSEC: 'You’re teasing a war that the trailer suggests will be won by someone else.',
+    LSED: 'One is attacking; the other is playing the soundtrack to the surrender. A relationship built on defeat.',
+    LFCC: 'You don\'t have arguments; you have official communiques. One is the general, the other is the spin doctor.',
+    LFCD: 'The commander wants a victory; the sage knows victory is an illusion. You’re fighting a war against yourself.',
+    LSCC: 'One issues the orders; the other polishes the boots. A relationship built on absolute hierarchy.',
+    LSCD: 'A massive engine of power and a crushing pressure. You’re two different versions of the same terminal force.',
+};
+
+export default roasts;
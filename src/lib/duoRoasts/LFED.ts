@@ -0,0 +1,13 @@
+// Duo roasts for typeA = LFED - generated by generate_matrix.py
+
+const roasts: Record<string, string> = {
+    LFED: 'Two people screaming for the same spotlight. You’re not in love; you’re just a competition for who has the bigger ego.',
+    LSEC: 'A five-act tragedy condensed into a 30-second catchphrase. You’re promising a masterpiece you can\'t deliver.',
+    LSED: 'One is high on the drama; the other is playing the soundtrack to the comedown. A relationship built on exhaustion.',
+    LFCC: 'You live the tragedy; they report it as verified news. You’re a two-person tabloid factory.',
+    LFCD: 'One seeks profound wisdom; the other just wants a standing ovation. You’re a loud noise in a very quiet abyss.',
+    LSCC: 'One performs the tragedy, and the other polishes the props. A perfectly functional but entirely hollow stage.',
+    LSCD: 'A massive lung capacity trying to sing at the bottom of the ocean. The whale is too heavy to care about your drama.',
+};
+
+export default roasts;
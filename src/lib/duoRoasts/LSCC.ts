@@ -0,0 +1,8 @@
+// Duo roasts for typeA = LSCC - generated by generate_matrix.py
+
+const roasts: Record<string, string> = {
+    LSCC: 'Two people trying to serve each other. You aren\'t in love; you’re just a very efficient waiting room.',
+    LSCD: 'You’re trying to serve the bottom of the ocean. The whale is too heavy to care about your service.',
+};
+
+export default roasts;
@@ -0,0 +1,7 @@
+// Duo roasts for typeA = LSCD - generated by generate_matrix.py
+
+const roasts: Record<string, string> = {
+    LSCD: 'Two massive engines of power drowning in the same dark water. You aren\'t in love; you’re just a geological event.',
+};
+
+export default roasts;
@@ -0,0 +1,12 @@
+// Duo roasts for typeA = LSEC - generated by generate_matrix.py
+
+const roasts: Record<string, string> = {
+    LSEC: 'Two people speaking in tropes. You aren\'t in love; you’re just a remake of a movie that was already bad.',
+    LSED: 'A bright trailer for a dark movie. You’re only together to hide the fact that there is no script at all.',
+    LFCC: 'You don\'t have conversations; you have official announcements. One is the face, and the other is the spin.',
+    LFCD: 'The sage seeks the truth; the trailer just wants a good hook. You’re a profound riddle with no answer.',
+    LSCC: 'One provides the \'vision,\' and the other holds the gimbal. A relationship built on having \'good angles.\'',
+    LSCD: 'A massive, hidden engine of power and a 30-second hook. You’re trying to sell the ocean as a theme park.',
+};
+
+export default roasts;
@@ -0,0 +1,11 @@
+// Duo roasts for typeA = LSED - generated by generate_matrix.py
+
+const roasts: Record<string, string> = {
+    LSED: 'Two people spinning the same sad record. You aren\'t in love; you’re just a repetitive, jazzy depression.',
+    LFCC: 'One provides the vibe, and the other reports the crash. You’re the anchorman of your own loneliness.',
+    LFCD: 'One seeks enlightenment; the other provides the white noise. You’re meditating on a void that isn\'t there.',
+    LSCC: 'One provides the jaded intellect; the other provides the drinks. A functional but loveless night shift.',
+    LSCD: 'A slow vibration at the bottom of the ocean. You’re two different versions of the same crushing silence.',
+};
+
+export default roasts;
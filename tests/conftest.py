@@ -0,0 +1,8 @@
+"""python_service/ and scripts/ import their sibling modules by name, as when run in place"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for directory in ('python_service', 'scripts'):
+    sys.path.insert(0, os.path.join(ROOT, directory))
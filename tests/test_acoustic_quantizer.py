@@ -0,0 +1,122 @@
+import math
+
+import numpy as np
+import pytest
+
+from acoustic_quantizer import COUPLE_QUANTIZER, SCORE_QUANTIZER, QuantizerTable
+from voice_processor import AcousticQuantizer
+
+
+# The if-chains the tables replaced, as they were in voice_processor.py
+# (0-100 scores) and couple_processor.py (Hz / 0-1 metrics)
+
+def old_score_pitch(value):
+    if value < 20: return "Sub-bass / Gravitas (重厚)"
+    if value < 40: return "Deep / Resonant (共鳴)"
+    if value < 60: return "Baritone / Grounded (安定的)"
+    if value < 80: return "Tenor / Clear (明瞭)"
+    return "Soprano / Crystalline (透き通った)"
+
+
+def old_score_speed(value):
+    if value < 20: return "Largo / Contemplative (熟考)"
+    if value < 40: return "Andante / Deliberate (慎重)"
+    if value < 60: return "Moderato / Conversational (会話的)"
+    if value < 80: return "Allegro / Energetic (活発)"
+    return "Presto / Urgent (性急)"
+
+
+def old_score_volume(value):
+    if value < 20: return "Whisper / Intimate (親密・秘密)"
+    if value < 40: return "Soft / Gentle (穏やか・配慮)"
+    if value < 60: return "Mezzo / Balanced (バランス)"
+    if value < 80: return "Forte / Projecting (発信・主張)"
+    return "Fortissimo / Commanding (威厳・支配)"
+
+
+def old_score_tone(value):
+    if value < 20: return "Husky / Textured (陰影・ハスキー)"
+    if value < 40: return "Smoky / Warm (温かみ・スモーキー)"
+    if value < 60: return "Neutral / Natural (自然的)"
+    if value < 80: return "Bright / Polished (磨かれた)"
+    return "Piercing / Pure (純粋・鋭い)"
+
+
+def old_couple_pitch(value):
+    norm = min(100, max(0, ((value - 80) / 220) * 100))
+    return old_score_pitch(norm)
+
+
+def old_couple_speed(value):
+    return old_score_speed(value * 100)
+
+
+def old_couple_volume(value):
+    norm = value * 100
+    if norm < 20: return "Whisper / Intimate (親密)"
+    if norm < 40: return "Soft / Gentle (穏やか)"
+    if norm < 60: return "Mezzo / Balanced (バランス)"
+    if norm < 80: return "Forte / Projecting (発信)"
+    return "Fortissimo / Commanding (威厳)"
+
+
+def old_couple_tone(value):
+    norm = min(100, max(0, ((value - 1000) / 3000) * 100))
+    if norm < 20: return "Husky / Textured (ハスキー)"
+    if norm < 40: return "Smoky / Warm (スモーキー)"
+    if norm < 60: return "Neutral / Natural (ナチュラル)"
+    if norm < 80: return "Bright / Polished (ブライト)"
+    return "Piercing / Pure (純粋)"
+
+
+OLD_SCORE = {'pitch': old_score_pitch, 'speed': old_score_speed,
+             'volume': old_score_volume, 'tone': old_score_tone}
+OLD_COUPLE = {'pitch': old_couple_pitch, 'speed': old_couple_speed,
+              'volume': old_couple_volume, 'tone': old_couple_tone}
+
+SCORE_VALUES = [-50, -0.0, 0, 5, 19.999999, 20, 20.000001, 39, 40, 59.5, 60, 79.99, 80, 100, 150, math.inf, -math.inf, math.nan]
+# Inputs on each couple scale: the raw values that land on or around the 0-100 edges
+COUPLE_VALUES = {
+    'pitch': [0, 79.9, 80, 123.99, 124, 124.01, 168, 212, 256, 299, 300, 1000, math.nan],
+    'speed': [-0.1, 0, 0.19999, 0.2, 0.4, 0.6, 0.79, 0.8, 1.0, 2.5, math.nan],
+    'volume': [-0.1, 0, 0.19999, 0.2, 0.4, 0.6, 0.79, 0.8, 1.0, 2.5, math.nan],
+    'tone': [0, 999, 1000, 1599, 1600, 2200, 2800, 3400, 3999, 4000, 9000, math.nan],
+}
+
+
+def random_values(rng, low, high, n=5000):
+    return np.concatenate([rng.uniform(low, high, n), np.round(rng.uniform(low, high, n))])
+
+
+@pytest.mark.parametrize('metric', ['pitch', 'speed', 'volume', 'tone'])
+def test_score_tables_match_if_chain(metric):
+    values = np.concatenate([SCORE_VALUES, random_values(np.random.default_rng(1), -20, 120)])
+    expected = [OLD_SCORE[metric](value) for value in values]
+
+    assert [SCORE_QUANTIZER.tag(metric, value) for value in values] == expected
+    assert SCORE_QUANTIZER[metric].tags(values).tolist() == expected
+    getter = getattr(AcousticQuantizer, f'get_{metric}_tag')
+    assert [getter(value) for value in values] == expected
+
+
+@pytest.mark.parametrize('metric, low, high', [
+    ('pitch', 40, 400), ('speed', -0.2, 1.2), ('volume', -0.2, 1.2), ('tone', 500, 5000),
+])
+def test_couple_tables_match_if_chain(metric, low, high):
+    values = np.concatenate([COUPLE_VALUES[metric], random_values(np.random.default_rng(2), low, high)])
+    expected = [OLD_COUPLE[metric](value) for value in values]
+
+    assert [COUPLE_QUANTIZER.tag(metric, value) for value in values] == expected
+    assert COUPLE_QUANTIZER[metric].tags(values).tolist() == expected
+
+
+def test_batch_indices_match_scalar_index():
+    values = np.array(SCORE_VALUES, dtype=np.float64)
+    indices = SCORE_QUANTIZER.batch_indices(pitch=values)['pitch']
+    assert indices.dtype == np.int8
+    assert indices.tolist() == [SCORE_QUANTIZER['pitch'].index(value) for value in values]
+
+
+def test_table_rejects_wrong_label_count():
+    with pytest.raises(ValueError):
+        QuantizerTable(('a', 'b', 'c'))
@@ -0,0 +1,46 @@
+import io
+
+import numpy as np
+import pytest
+
+pytest.importorskip('librosa')
+av = pytest.importorskip('av')
+
+from audio_decoder import decode_audio
+
+
+def encode(y, sr, codec, sample_format, container='matroska'):
+    """`y` (mono float) encoded in memory with PyAV"""
+    out = io.BytesIO()
+    with av.open(out, 'w', format=container) as f:
+        stream = f.add_stream(codec, rate=sr, layout='mono')
+        frame = av.AudioFrame.from_ndarray(y.astype(np.float32)[np.newaxis], format='flt', layout='mono')
+        frame.sample_rate = sr
+        frame.pts = 0
+        convert = av.AudioResampler(format=sample_format, layout='mono', rate=sr)
+        for converted in convert.resample(frame) + convert.resample(None):
+            f.mux(stream.encode(converted))
+        f.mux(stream.encode(None))
+    return out.getvalue()
+
+
+@pytest.mark.parametrize('codec, sample_format', [('pcm_s16le', 's16'), ('flac', 's16')])
+def test_converted_formats_keep_every_sample(codec, sample_format):
+    sr = 16000
+    y = 0.5 * np.sin(2 * np.pi * 220 * np.arange(sr * 3 + 123) / sr)
+    decoded, out_sr = decode_audio(encode(y, sr, codec, sample_format), sr, 60)
+    assert out_sr == sr
+    assert len(decoded) == len(y)
+    np.testing.assert_allclose(decoded, y, atol=2 / 2**15)
+
+
+def test_duration_limits_the_decoded_samples():
+    sr = 16000
+    y = np.zeros(sr * 4)
+    decoded, _ = decode_audio(encode(y, sr, 'pcm_s16le', 's16'), sr, 1.5)
+    assert len(decoded) == int(1.5 * sr)
+
+
+def test_unrecognized_bytes_are_rejected():
+    with pytest.raises(ValueError):
+        decode_audio(b'not audio at all' * 100, 16000, 10)
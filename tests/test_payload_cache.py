@@ -0,0 +1,136 @@
+import copy
+import json
+import pickle
+
+import pytest
+
+from payload_cache import FrozenDict, FrozenList, PayloadCache, freeze
+from voice_processor import CoupleResonanceEngine, SoloIdentityEngine
+
+
+@pytest.mark.parametrize('mutate', [
+    lambda d: d.__setitem__('a', 2),
+    lambda d: d.__delitem__('a'),
+    lambda d: d.update(b=2),
+    lambda d: d.setdefault('b', 2),
+    lambda d: d.pop('a'),
+    lambda d: d.popitem(),
+    lambda d: d.clear(),
+    lambda d: d.__ior__({'b': 2}),
+])
+def test_frozen_dict_refuses_mutation(mutate):
+    d = FrozenDict({'a': 1})
+    with pytest.raises(TypeError):
+        mutate(d)
+    assert d == {'a': 1}
+
+
+@pytest.mark.parametrize('mutate', [
+    lambda l: l.__setitem__(0, 9),
+    lambda l: l.__delitem__(0),
+    lambda l: l.append(4),
+    lambda l: l.extend([4]),
+    lambda l: l.insert(0, 4),
+    lambda l: l.pop(),
+    lambda l: l.remove(1),
+    lambda l: l.clear(),
+    lambda l: l.sort(),
+    lambda l: l.reverse(),
+    lambda l: l.__iadd__([4]),
+    lambda l: l.__imul__(2),
+])
+def test_frozen_list_refuses_mutation(mutate):
+    values = FrozenList([3, 1, 2])
+    with pytest.raises(TypeError):
+        mutate(values)
+    assert values == [3, 1, 2]
+
+
+def test_freeze_is_deep_and_round_trips():
+    value = freeze({'a': [1, {'b': [2, 3]}], 'c': 'x'})
+
+    assert type(value) is FrozenDict
+    assert type(value['a']) is FrozenList
+    assert type(value['a'][1]['b']) is FrozenList
+    with pytest.raises(TypeError):
+        value['a'][1]['b'].append(4)
+
+    assert value == {'a': [1, {'b': [2, 3]}], 'c': 'x'}
+    assert json.loads(json.dumps(value)) == value
+    restored = pickle.loads(pickle.dumps(value))
+    assert restored == value and type(restored['a']) is FrozenList
+    assert copy.deepcopy(value) == value
+    # Already frozen values are shared, not copied
+    assert freeze(value) is value
+
+
+def test_lru_evicts_least_recently_used_and_counts():
+    cache = PayloadCache(maxsize=2)
+    builds = []
+
+    def get(key):
+        return cache.get_or_build(key, lambda: builds.append(key) or {'key': key})
+
+    get('a'), get('b')
+    get('a')            # 'a' becomes most recent
+    get('c')            # evicts 'b'
+    get('a')
+    get('b')            # rebuilt, evicts 'c'
+
+    assert builds == ['a', 'b', 'c', 'b']
+    assert len(cache) == 2
+    assert cache.stats() == {'size': 2, 'maxsize': 2, 'hits': 2, 'misses': 4,
+                             'evictions': 2, 'hit_rate': 2 / 6}
+
+
+def test_hits_share_one_frozen_value():
+    cache = PayloadCache()
+    first = cache.get_or_build('k', lambda: {'tags': ['x']})
+    second = cache.get_or_build('k', lambda: pytest.fail('built twice'))
+    assert first is second
+    assert isinstance(first, FrozenDict) and isinstance(first['tags'], FrozenList)
+
+
+def test_maxsize_zero_disables_storage():
+    cache = PayloadCache(maxsize=0)
+    for _ in range(3):
+        cache.get_or_build('k', dict)
+    assert len(cache) == 0
+    assert cache.stats()['misses'] == 3 and cache.stats()['evictions'] == 0
+
+
+def test_clear_resets_entries_and_counters():
+    cache = PayloadCache(maxsize=1)
+    cache.get_or_build('a', dict), cache.get_or_build('a', dict), cache.get_or_build('b', dict)
+    cache.clear()
+    assert cache.stats() == {'size': 0, 'maxsize': 1, 'hits': 0, 'misses': 0,
+                             'evictions': 0, 'hit_rate': 0.0}
+
+
+def test_cached_payloads_cannot_be_corrupted_by_callers():
+    SoloIdentityEngine.cache.clear()
+    payload = SoloIdentityEngine(70, 60, 50, 40, 'INFP').generate_payload()
+    with pytest.raises(TypeError):
+        payload['Gap_Analysis']['Diagnosis_Tags'].append('tampered')
+    with pytest.raises(TypeError):
+        payload['Raw_Metrics_Tags']['Pitch_Tag'] = 'tampered'
+
+    # The outer dict is the caller's own; the shared body is unchanged
+    payload['User_MBTI'] = 'tampered'
+    again = SoloIdentityEngine(70, 60, 50, 40, 'infp').generate_payload()
+    assert again['User_MBTI'] == 'INFP'
+    assert 'tampered' not in again['Gap_Analysis']['Diagnosis_Tags']
+    assert SoloIdentityEngine.cache.stats()['hits'] == 1
+
+
+def test_couple_scm_profiles_are_shared_and_frozen():
+    CoupleResonanceEngine.scm_cache.clear()
+    user = {'name': 'A', 'job': 'Engineer', 'accent': 'x', 'p': 50, 's': 60, 'v': 70, 't': 40}
+    first = CoupleResonanceEngine(user, dict(user, name='B')).generate_payload()
+    scm = first['User_A_Insight']['SCM_Profile']
+    assert scm is first['User_B_Insight']['SCM_Profile']
+    with pytest.raises(TypeError):
+        scm['Competence'] = 0
+    # Job lookups are case-insensitive, so 'engineer' hits the same entry
+    second = CoupleResonanceEngine(dict(user, job='engineer'), user).generate_payload()
+    assert second['User_A_Insight']['SCM_Profile'] is scm
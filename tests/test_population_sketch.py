@@ -0,0 +1,122 @@
+import numpy as np
+import pytest
+
+from population_sketch import METRICS, KLLSketch, PopulationSketches
+
+# Rank error of a k=200 sketch is ~1/k in expectation; allow a few times that
+MAX_RANK_ERROR = 0.02
+PROBES = np.linspace(0.01, 0.99, 99)
+
+
+def true_ranks(data: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Exact mid-ranks, the quantity KLLSketch.ranks estimates"""
+    data = np.sort(data)
+    below = np.searchsorted(data, values, side='left')
+    at_or_below = np.searchsorted(data, values, side='right')
+    return (below + at_or_below) / 2 / len(data)
+
+
+def max_rank_error(sketch: KLLSketch, data: np.ndarray) -> float:
+    probes = np.quantile(data, PROBES)
+    return float(np.max(np.abs(sketch.ranks(probes) - true_ranks(data, probes))))
+
+
+def total_weight(sketch: KLLSketch) -> int:
+    return sum(len(items) * 2 ** h for h, items in enumerate(sketch.levels))
+
+
+def stored_items(sketch: KLLSketch) -> int:
+    return sum(len(items) for items in sketch.levels)
+
+
+@pytest.mark.parametrize('distribution', ['uniform', 'normal', 'lognormal', 'sorted', 'few_values'])
+def test_rank_error_and_memory_stay_bounded(distribution):
+    rng = np.random.default_rng(0)
+    n = 200_000
+    data = {
+        'uniform': lambda: rng.uniform(80, 300, n),
+        'normal': lambda: rng.normal(150, 30, n),
+        'lognormal': lambda: rng.lognormal(7.5, 0.4, n),
+        'sorted': lambda: np.sort(rng.uniform(0, 1, n)),
+        'few_values': lambda: rng.integers(0, 5, n).astype(np.float64),
+    }[distribution]()
+
+    sketch = KLLSketch(seed=1)
+    sketch.update_many(data)
+
+    assert len(sketch) == n
+    assert total_weight(sketch) == n
+    assert stored_items(sketch) < 3 * sketch.k
+    assert max_rank_error(sketch, data) < MAX_RANK_ERROR
+
+
+def test_small_inputs_are_exact():
+    data = np.array([5.0, 1.0, 3.0, 3.0, 9.0])
+    sketch = KLLSketch()
+    for value in data:
+        sketch.update(value)
+    probes = np.array([0.0, 1.0, 3.0, 4.0, 9.0, 10.0])
+    np.testing.assert_allclose(sketch.ranks(probes), true_ranks(data, probes))
+    assert sketch.quantile(0.0) == 1.0 and sketch.quantile(1.0) == 9.0
+
+
+def test_update_and_update_many_agree_within_bound():
+    data = np.random.default_rng(2).normal(0, 1, 50_000)
+    one_by_one, bulk = KLLSketch(seed=3), KLLSketch(seed=3)
+    for value in data:
+        one_by_one.update(value)
+    bulk.update_many(data)
+    assert max_rank_error(one_by_one, data) < MAX_RANK_ERROR
+    assert max_rank_error(bulk, data) < MAX_RANK_ERROR
+
+
+def test_nan_is_ignored_on_update_and_kept_on_query():
+    sketch = KLLSketch()
+    sketch.update(float('nan'))
+    sketch.update_many([1.0, float('nan'), 2.0])
+    assert len(sketch) == 2
+    assert np.isnan(sketch.rank(float('nan')))
+    with pytest.raises(ValueError):
+        KLLSketch().rank(1.0)
+
+
+def test_merge_matches_the_combined_stream():
+    rng = np.random.default_rng(4)
+    # Workers see different parts of the population
+    parts = [rng.normal(120, 15, 60_000), rng.normal(220, 25, 90_000), rng.uniform(80, 300, 30_000)]
+    merged = KLLSketch(seed=5)
+    for i, part in enumerate(parts):
+        worker = KLLSketch(seed=10 + i)
+        worker.update_many(part)
+        merged.merge(worker)
+
+    data = np.concatenate(parts)
+    assert len(merged) == len(data)
+    assert total_weight(merged) == len(data)
+    assert stored_items(merged) < 3 * merged.k
+    assert max_rank_error(merged, data) < MAX_RANK_ERROR
+
+
+def test_merging_an_empty_sketch_changes_nothing():
+    sketch = KLLSketch(seed=6)
+    sketch.update_many(np.arange(1000.0))
+    before = sketch.ranks(np.arange(0, 1000, 50.0))
+    sketch.merge(KLLSketch())
+    np.testing.assert_array_equal(sketch.ranks(np.arange(0, 1000, 50.0)), before)
+
+
+def test_population_round_trips_through_a_file(tmp_path):
+    rng = np.random.default_rng(7)
+    population = PopulationSketches()
+    for _ in range(5000):
+        population.update({metric: rng.uniform() for metric in METRICS})
+
+    path = tmp_path / 'population.json'
+    population.save(str(path))
+    loaded = PopulationSketches.load(str(path))
+
+    assert loaded.n == population.n == 5000
+    probes = np.linspace(0, 1, 11)
+    for metric in METRICS:
+        np.testing.assert_array_equal(loaded[metric].ranks(probes), population[metric].ranks(probes))
+    assert PopulationSketches.load(str(tmp_path / 'missing.json')).n == 0
@@ -0,0 +1,83 @@
+import json
+
+import numpy as np
+import pytest
+
+pytest.importorskip('librosa')
+
+from couple_processor import (
+    AcousticMetrics, SCMAnalyzer, TogetherMetrics, USER_SEGMENTS, build_result, result_to_dict,
+)
+from rescore_results import SIDES, check_against_scalar, diff_report, load_results, rescore, synthetic_results
+
+
+def random_metrics(rng) -> AcousticMetrics:
+    return AcousticMetrics(pitch=rng.uniform(60, 350), speed=rng.uniform(0, 1), volume=rng.uniform(0, 1),
+                           tone=rng.uniform(300, 5000), pitch_std=rng.uniform(0, 30), volume_std=rng.uniform(0, 0.2))
+
+
+def stored_results(path, n, seed=0):
+    """n results built by the scalar path, written as batch JSONL records"""
+    rng = np.random.default_rng(seed)
+    jobs = list(SCMAnalyzer.JOB_SCORES) + ['Engineer', 'plumber']
+    accents = list(SCMAnalyzer.ACCENT_MODS) + ['Osaka', 'klingon']
+    with open(path, 'w', encoding='utf-8') as f:
+        for i in range(n):
+            infos = [{'name': side, 'job': str(rng.choice(jobs)), 'accent': str(rng.choice(accents))}
+                     for side in SIDES]
+            together = TogetherMetrics(harmony_score=float(rng.uniform(0, 100)), sync_rate=float(rng.uniform(0, 1)),
+                                       dominance_a=0.5, dominance_b=0.5, blend_quality='')
+            segments = {name: random_metrics(rng) for name in USER_SEGMENTS}
+            if i % 50 == 0:
+                # No voiced frames: NaN pitch goes through deltas and the score clamp
+                segments['calibration_a'].pitch = float('nan')
+            result = result_to_dict(build_result(*infos, segments, together))
+            f.write(json.dumps({'id': str(i), 'status': 'ok', 'result': result}) + '\n')
+
+
+def test_rescoring_unchanged_results_reports_no_changes(tmp_path):
+    path = tmp_path / 'results.jsonl'
+    stored_results(path, 500)
+
+    stored = load_results([str(path)])
+    summary = diff_report(stored, rescore(stored), str(tmp_path / 'diff.jsonl'))
+
+    assert summary['results'] == 500
+    assert summary['changed'] == 0, summary['changed_by_field']
+    assert (tmp_path / 'diff.jsonl').read_text() == ''
+
+
+def test_vectorized_rescore_matches_scalar_rows():
+    stored = synthetic_results(5000, seed=1)
+    c = stored.columns
+    # Edge rows: identical partners, NaN metrics, values far outside the usual ranges
+    for side in SIDES:
+        c[f'{side}_pitch'][:10] = 150.0
+        c[f'{side}_tone'][10:20] = np.nan
+        c[f'{side}_speed'][20:30] = [-5, 0, 0.5, 1, 5, -5, 0, 0.5, 1, 5]
+        c[f'{side}_volume'][30:40] = np.nan
+    c['harmony_score'][40:50] = [0, 100, 1e6, -1e6, np.nan, 0, 100, 1e6, -1e6, np.nan]
+    c['sync_rate'][50:60] = np.nan
+
+    mismatches, _ = check_against_scalar(stored, rescore(stored), len(stored))
+    assert mismatches == 0
+
+
+def test_diff_report_lists_only_changed_scores(tmp_path):
+    stored = synthetic_results(200, seed=2)
+    new = rescore(stored)
+    # Pretend the stored results came from these scores, then move one couple
+    for name, values in new.items():
+        stored.columns[name] = values.copy()
+    stored.columns['matrix_score'][7] -= 3
+    stored.columns['a_archetype'][7] = -1
+
+    summary = diff_report(stored, new, str(tmp_path / 'diff.jsonl'))
+
+    lines = (tmp_path / 'diff.jsonl').read_text().splitlines()
+    assert summary['changed'] == 1 and len(lines) == 1
+    record = json.loads(lines[0])
+    assert record['id'] == '7'
+    assert record['matrix_score'] == [int(new['matrix_score'][7]) - 3, int(new['matrix_score'][7])]
+    assert record['a_archetype'] == [None, SCMAnalyzer.ARCHETYPES[new['a_archetype'][7]]]
+    assert summary['matrix_score_shift'] == {'3': 1}
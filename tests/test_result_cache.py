@@ -0,0 +1,125 @@
+import json
+import os
+
+import pytest
+
+from result_cache import LOW_WATER, ResultCache, cache_key, content_hash
+
+
+def entry_files(directory):
+    return sorted(name for _, _, names in os.walk(directory) for name in names)
+
+
+def test_put_get_round_trip(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    key = cache_key('v1', 'abc', {'name': 'A'})
+    assert cache.get(key) is None
+    cache.put(key, {'score': 1, 'tags': ['x']})
+    assert cache.get(key) == {'score': 1, 'tags': ['x']}
+    assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 1
+
+
+def test_failed_write_leaves_no_entry_or_temp_file(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    key = cache_key('partial')
+    with pytest.raises(TypeError):
+        cache.put(key, {'not_json': object()})
+    assert entry_files(tmp_path) == []
+    assert cache.get(key) is None
+
+
+def test_overwrite_replaces_whole_entry(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    key = cache_key('same')
+    cache.put(key, {'v': 'x' * 1000})
+    cache.put(key, {'v': 'short'})
+    assert cache.get(key) == {'v': 'short'}
+    # Only the final .json, no leftover temporary files
+    assert entry_files(tmp_path) == [f'{key}.json']
+
+
+def test_unreadable_entry_is_dropped(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    key = cache_key('corrupt')
+    cache.put(key, {'v': 1})
+    with open(cache._path(key), 'w') as f:
+        f.write('{"v": ')
+    assert cache.get(key) is None
+    assert not os.path.exists(cache._path(key))
+
+
+def test_eviction_drops_least_recently_used_down_to_low_water(tmp_path):
+    value = {'v': 'x' * 1000}
+    entry_size = len(json.dumps(value))
+    cache = ResultCache(str(tmp_path), max_bytes=10 * entry_size)
+    keys = [cache_key(i) for i in range(10)]
+    for i, key in enumerate(keys):
+        cache.put(key, value)
+        # Distinct mtimes so recency order is unambiguous
+        os.utime(cache._path(key), (1000 + i, 1000 + i))
+    assert cache.get(keys[0]) == value    # refreshes the oldest entry
+
+    cache.put(cache_key('new'), value)    # 11 entries: over max_bytes
+
+    assert cache.stats()['size_bytes'] <= LOW_WATER * cache.max_bytes
+    remaining = {key for key in keys + [cache_key('new')] if os.path.exists(cache._path(key))}
+    assert len(remaining) == int(LOW_WATER * 10)
+    assert keys[0] in remaining and cache_key('new') in remaining
+    # The evicted ones are the least recently used
+    assert not any(os.path.exists(cache._path(key)) for key in keys[1:3])
+    assert cache.stats()['evictions'] == 2
+
+
+def test_cache_key_ignores_dict_order_and_content_hash_accepts_bytes(tmp_path):
+    assert cache_key({'a': 1, 'b': 2}) == cache_key({'b': 2, 'a': 1})
+    path = tmp_path / 'audio.bin'
+    path.write_bytes(b'\x00\x01' * 100_000)
+    assert content_hash(str(path), block_size=4096) == content_hash(path.read_bytes())
+
+
+def test_hit_is_bit_identical_to_miss(tmp_path):
+    pytest.importorskip('librosa')
+    from benchmark_couple_stages import USER_INFO_A, USER_INFO_B, synthesize
+    from couple_processor import process_couple_audio, result_to_dict, sf
+
+    sr = 16000
+    audio = tmp_path / 'session.wav'
+    sf.write(str(audio), synthesize(sr)[0], sr, subtype='FLOAT')
+    cache = ResultCache(str(tmp_path / 'cache'))
+    options = dict(pitch_engine='yin', analysis_sr=sr, cache=cache)
+
+    miss = process_couple_audio(str(audio), USER_INFO_A, USER_INFO_B, **options)
+    hit = process_couple_audio(str(audio), USER_INFO_A, USER_INFO_B, **options)
+    from_bytes = process_couple_audio('upload', USER_INFO_A, USER_INFO_B,
+                                      audio_bytes=audio.read_bytes(), **options)
+
+    assert (miss.cache, hit.cache, from_bytes.cache) == ('miss', 'hit', 'hit')
+
+    def stable(result):
+        data = result_to_dict(result)
+        data.pop('timings'), data.pop('cache')
+        return json.dumps(data, sort_keys=True)
+
+    assert stable(hit) == stable(miss) == stable(from_bytes)
+    # A different option is a different entry
+    other = process_couple_audio(str(audio), USER_INFO_A, USER_INFO_B, **dict(options, pitch_engine='acf'))
+    assert other.cache == 'miss'
+
+
+def test_hit_is_skipped_until_the_feature_store_exists(tmp_path):
+    pytest.importorskip('librosa')
+    from benchmark_couple_stages import USER_INFO_A, USER_INFO_B, synthesize
+    from couple_processor import process_couple_audio, sf
+
+    sr = 16000
+    audio = tmp_path / 'session.wav'
+    sf.write(str(audio), synthesize(sr)[0], sr, subtype='FLOAT')
+    options = dict(pitch_engine='yin', analysis_sr=sr, cache=ResultCache(str(tmp_path / 'cache')))
+
+    assert process_couple_audio(str(audio), USER_INFO_A, USER_INFO_B, **options).cache == 'miss'
+    # Cached, but this row's feature store has not been written yet
+    features = tmp_path / 'features.npz'
+    result = process_couple_audio(str(audio), USER_INFO_A, USER_INFO_B, features_path=str(features), **options)
+    assert result.cache == 'miss' and features.exists()
+    result = process_couple_audio(str(audio), USER_INFO_A, USER_INFO_B, features_path=str(features), **options)
+    assert result.cache == 'hit'
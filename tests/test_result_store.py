@@ -0,0 +1,126 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+pytest.importorskip('librosa')
+
+from couple_processor import (
+    AcousticMetrics, BLEND_QUALITIES, METRIC_FIELDS, RESULT_STORE_DTYPE, ResultStore, TogetherMetrics,
+    USER_SEGMENTS, build_result, result_to_dict,
+)
+
+
+def make_results(n, seed=0):
+    rng = np.random.default_rng(seed)
+    results = []
+    for i in range(n):
+        segments = {name: AcousticMetrics(pitch=rng.uniform(60, 350), speed=rng.uniform(0, 1),
+                                          volume=rng.uniform(0, 1), tone=rng.uniform(300, 5000),
+                                          pitch_std=rng.uniform(0, 30), volume_std=rng.uniform(0, 0.2))
+                    for name in USER_SEGMENTS}
+        blend = BLEND_QUALITIES[i % len(BLEND_QUALITIES)] if i % 5 else 'Something new'
+        dominance = float(rng.uniform(0, 1))
+        together = TogetherMetrics(harmony_score=float(rng.uniform(0, 100)), sync_rate=float(rng.uniform(0, 1)),
+                                   dominance_a=dominance, dominance_b=1 - dominance, blend_quality=blend)
+        result = build_result({'name': 'A', 'job': 'Engineer'}, {'name': 'B', 'job': 'Artist'}, segments, together)
+        results.append((f"couple-{i}", result_to_dict(result)))
+    return results
+
+
+def assert_rows_match(store, results):
+    assert len(store) == len(results)
+    assert [v.decode() for v in store.column('id')] == [result_id for result_id, _ in results]
+    for side in ('a', 'b'):
+        for field in METRIC_FIELDS:
+            expected = [r[f'user_{side}']['metrics'][field] for _, r in results]
+            np.testing.assert_array_equal(store.column(f'{side}_{field}'), expected)
+    for name in ('harmony_score', 'sync_rate', 'dominance_a', 'dominance_b'):
+        np.testing.assert_array_equal(store.column(name), [r['together'][name] for _, r in results])
+    for metric in ('pitch', 'speed', 'volume', 'tone'):
+        np.testing.assert_array_equal(store.column(f'delta_{metric}'), [r['delta'][metric] for _, r in results])
+    np.testing.assert_array_equal(store.column('matrix_score'), [r['matrix_score'] for _, r in results])
+    labels = [BLEND_QUALITIES[code] if code >= 0 else None for code in store.column('blend_quality')]
+    assert labels == [r['together']['blend_quality'] if r['together']['blend_quality'] in BLEND_QUALITIES
+                      else None for _, r in results]
+
+
+def test_round_trip_across_shards_and_reopen(tmp_path):
+    results = make_results(23)
+    directory = str(tmp_path / 'store')
+    with ResultStore(directory, shard_rows=10) as store:
+        for result_id, result in results:
+            store.append(result_id, result)
+        # Two full shards written, three rows still buffered but counted
+        assert len(store.shard_paths()) == 2
+        assert len(store) == 23
+    assert len(ResultStore(directory).shard_paths()) == 3
+
+    assert_rows_match(ResultStore(directory), results)
+
+
+def test_compact_keeps_rows_and_order(tmp_path):
+    results = make_results(25, seed=1)
+    store = ResultStore(str(tmp_path), shard_rows=4)
+    for result_id, result in results:
+        store.append(result_id, result)
+        if len(store) % 3 == 0:
+            store.flush()
+    store.flush()
+    assert len(store.shard_paths()) > 7
+
+    store.shard_rows = 10
+    store.compact()
+
+    assert [len(shard) for shard in store.shards()] == [10, 10, 5]
+    assert not [name for name in os.listdir(tmp_path) if name.endswith('.tmp')]
+    assert_rows_match(store, results)
+
+
+def test_empty_store_columns(tmp_path):
+    store = ResultStore(str(tmp_path))
+    store.flush()
+    assert len(store) == 0
+    assert store.shard_paths() == []
+    assert store.column('matrix_score').dtype == RESULT_STORE_DTYPE['matrix_score']
+    assert len(store.column('matrix_score')) == 0
+
+
+def test_schema_mismatch_is_rejected(tmp_path):
+    ResultStore(str(tmp_path))
+    schema_path = tmp_path / 'schema.json'
+    schema = json.loads(schema_path.read_text())
+    schema['version'] += 1
+    schema_path.write_text(json.dumps(schema))
+
+    with pytest.raises(ValueError, match='schema version'):
+        ResultStore(str(tmp_path))
+
+
+def test_long_ids_are_rejected(tmp_path):
+    (result_id, result), = make_results(1)
+    store = ResultStore(str(tmp_path))
+    with pytest.raises(ValueError, match='longer than'):
+        store.append('x' * 65, result)
+    # Ids are limited in UTF-8 bytes, not characters
+    with pytest.raises(ValueError):
+        store.append('é' * 33, result)
+    store.append('é' * 32, result)
+    store.flush()
+    assert store.column('id')[0].decode('utf-8') == 'é' * 32
+
+
+def test_shards_written_on_the_same_clock_tick_are_kept(tmp_path, monkeypatch):
+    # A coarse clock (e.g. ~15 ms on Windows) gives back-to-back flushes the same time
+    monkeypatch.setattr('couple_processor.time.time_ns', lambda: 1234567890)
+    results = make_results(6, seed=2)
+    store = ResultStore(str(tmp_path), shard_rows=2)
+    for result_id, result in results:
+        store.append(result_id, result)
+    assert len(store.shard_paths()) == 3
+
+    store.shard_rows = 4
+    store.compact()
+    assert [len(shard) for shard in store.shards()] == [4, 2]
+    assert_rows_match(store, results)
@@ -0,0 +1,26 @@
+import json
+
+import pytest
+
+pytest.importorskip('librosa')
+
+from couple_processor import handle_job_line, process_manifest_row
+
+
+@pytest.mark.parametrize('line', ['[1]', '"x"', '3', 'null', 'true', '{not json'])
+def test_bad_job_lines_return_error_records(line):
+    record = json.loads(handle_job_line(line, {}))
+    assert record['id'] is None
+    assert record['status'] == 'error'
+
+
+def test_non_object_manifest_row_is_an_error_record():
+    record = process_manifest_row([1], {'feature_dir': 'features'})
+    assert record['status'] == 'error'
+    assert record['error'].startswith('TypeError')
+
+
+def test_missing_file_keeps_the_row_id(tmp_path):
+    record = json.loads(handle_job_line(json.dumps({'id': 'c1', 'path': str(tmp_path / 'missing.wav')}), {}))
+    assert record['id'] == 'c1'
+    assert record['status'] == 'error'
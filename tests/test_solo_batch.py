@@ -0,0 +1,66 @@
+import itertools
+import math
+
+import numpy as np
+import pytest
+
+from voice_processor import AcousticQuantizer, SoloIdentityEngine
+
+MBTI_TYPES = ['INTJ', 'INTP', 'ENTJ', 'ENTP', 'INFJ', 'INFP', 'ENFJ', 'ENFP',
+              'ISTJ', 'ISFJ', 'ESTJ', 'ESFJ', 'ISTP', 'ISFP', 'ESTP', 'ESFP']
+# Lower case, unknown and partial codes go through the same .upper() / 'E' in / 'T' in checks
+ODD_MBTI = ['infp', 'estj', 'unknown', '', 'E', 'xxTx', 'ñeté']
+
+
+def scalar_rows(p, s, v, t, mbti):
+    return [SoloIdentityEngine(p[i], s[i], v[i], t[i], mbti[i]).generate_payload() for i in range(len(p))]
+
+
+def test_batch_rows_match_generate_payload():
+    rng = np.random.default_rng(0)
+    n = 2000
+    p, s, v, t = (rng.integers(0, 101, n) for _ in range(4))
+    mbti = rng.choice(MBTI_TYPES + ODD_MBTI, n)
+
+    result = SoloIdentityEngine.batch(p, s, v, t, mbti)
+
+    assert len(result) == n
+    assert list(result.rows()) == scalar_rows(p.tolist(), s.tolist(), v.tolist(), t.tolist(), mbti.tolist())
+
+
+def test_batch_matches_on_floats_negatives_and_bin_edges():
+    # Bin edges, just either side of them, out-of-range and negative values:
+    # int() truncation toward zero and bisect_right must agree with the batch
+    values = [-150.5, -30.0, -0.5, 0, 19.999, 20, 20.001, 39.5, 40, 59.9, 60, 79.99, 80, 99.5, 100, 250.25]
+    grid = np.array(list(itertools.product(values, repeat=2)))
+    p, s = grid[:, 0], grid[:, 1]
+    v, t = grid[::-1, 0].copy(), grid[::-1, 1].copy()
+    mbti = np.resize(np.array(MBTI_TYPES + ODD_MBTI), len(p))
+
+    result = SoloIdentityEngine.batch(p, s, v, t, mbti)
+
+    assert list(result.rows()) == scalar_rows(p.tolist(), s.tolist(), v.tolist(), t.tolist(), mbti.tolist())
+
+
+@pytest.mark.filterwarnings('ignore:invalid value encountered in cast')
+def test_batch_nan_tags_match_scalar_tags():
+    # generate_payload cannot take NaN (int(nan) raises), but the tag lookup
+    # can: NaN is not below any edge, so both paths put it in the top bin
+    p = np.array([math.nan, 10.0, 50.0])
+    s = np.array([10.0, math.nan, 50.0])
+    v = np.array([90.0, 30.0, math.nan])
+    t = np.array([math.nan, math.nan, math.nan])
+
+    result = SoloIdentityEngine.batch(p, s, v, t, ['INFP', 'ESTJ', 'enfp'])
+
+    for i in range(len(p)):
+        expected = AcousticQuantizer.get_all_tags(p[i], s[i], v[i], t[i])
+        assert result.row(i)['Raw_Metrics_Tags'] == expected
+    with pytest.raises(ValueError):
+        SoloIdentityEngine(math.nan, 10, 10, 10, 'INFP').generate_payload()
+
+
+def test_batch_accepts_lists_and_empty_input():
+    assert SoloIdentityEngine.batch([50], [50], [50], [50], ['INTJ']).row(0) == \
+        SoloIdentityEngine(50, 50, 50, 50, 'INTJ').generate_payload()
+    assert len(SoloIdentityEngine.batch([], [], [], [], [])) == 0
@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+
+from voice_match import VoiceMatchIndex
+from voice_processor import CoupleResonanceEngine
+
+METRICS = ('p', 's', 'v', 't')
+
+
+def brute_force(users: dict, q, k, nearest=True, exclude=None):
+    """Reference ranking: every user, ordered by (L1 distance, insertion order)"""
+    sign = 1 if nearest else -1
+    ranked = []
+    for order, (user_id, vector) in enumerate(users.items()):
+        if user_id == exclude:
+            continue
+        dist = abs(vector[0] - q[0]) + abs(vector[1] - q[1]) + abs(vector[2] - q[2]) + abs(vector[3] - q[3])
+        ranked.append((sign * dist, order, user_id, dist))
+    ranked.sort()
+    return [{'User_ID': user_id, 'Sync_Score': int(100 - dist / 4), 'Mean_Delta': int(dist / 4)}
+            for _, _, user_id, dist in ranked[:k]]
+
+
+def random_users(rng, n, integer=True):
+    values = rng.integers(0, 101, (n, 4)) if integer else rng.uniform(0, 100, (n, 4))
+    return {f'u{i}': tuple(float(x) for x in row) for i, row in enumerate(values)}
+
+
+@pytest.mark.parametrize('integer', [True, False])
+@pytest.mark.parametrize('k', [1, 10, 50])
+def test_queries_match_brute_force(integer, k):
+    rng = np.random.default_rng(k)
+    users = random_users(rng, 3000, integer)
+    index = VoiceMatchIndex.from_arrays(list(users), *np.array(list(users.values())).T)
+
+    for q in [(0, 0, 0, 0), (100, 100, 100, 100), (50, 50, 50, 50)] + [tuple(rng.uniform(0, 100, 4)) for _ in range(20)]:
+        assert index.top_sync(*q, k=k) == brute_force(users, q, k)
+        assert index.top_contrast(*q, k=k) == brute_force(users, q, k, nearest=False)
+
+
+def test_inserts_deletes_and_rebuilds_stay_exact():
+    rng = np.random.default_rng(7)
+    users = random_users(rng, 500)
+    # Small rebuild thresholds so the unindexed tail and tombstones both get exercised
+    index = VoiceMatchIndex.from_arrays(list(users), *np.array(list(users.values())).T,
+                                        rebuild_ratio=0.05, rebuild_min=8)
+    for step in range(400):
+        user_id = f'u{rng.integers(0, 700)}'
+        if user_id in users and rng.random() < 0.5:
+            index.delete(user_id)
+            del users[user_id]
+        else:
+            vector = tuple(float(x) for x in rng.integers(0, 101, 4))
+            index.insert(user_id, *vector)
+            users.pop(user_id, None)   # a re-insert moves the user to the end
+            users[user_id] = vector
+        if step % 20 == 0:
+            q = tuple(rng.integers(0, 101, 4))
+            assert index.top_sync(*q, k=15) == brute_force(users, q, 15)
+            assert index.top_contrast(*q, k=15) == brute_force(users, q, 15, nearest=False)
+
+    assert len(index) == len(users)
+    some_user = next(iter(users))
+    assert index.matches_for(some_user, k=5) == brute_force(users, users[some_user], 5, exclude=some_user)
+
+
+def test_sync_score_matches_couple_engine():
+    rng = np.random.default_rng(3)
+    users = random_users(rng, 200)
+    index = VoiceMatchIndex.from_arrays(list(users), *np.array(list(users.values())).T)
+    q = (37.0, 81.0, 12.0, 64.0)
+
+    for match in index.top_sync(*q, k=20) + index.top_contrast(*q, k=20):
+        a = dict(zip(METRICS, q))
+        b = dict(zip(METRICS, users[match['User_ID']]))
+        synergy = CoupleResonanceEngine(a, b)._calculate_synergy()
+        assert (match['Sync_Score'], match['Mean_Delta']) == (synergy['Sync_Score'], synergy['Mean_Delta'])
+
+
+def test_k_larger_than_index_returns_everyone():
+    users = {'a': (10.0, 10.0, 10.0, 10.0), 'b': (90.0, 90.0, 90.0, 90.0)}
+    index = VoiceMatchIndex.from_arrays(list(users), *np.array(list(users.values())).T)
+    assert [m['User_ID'] for m in index.top_sync(0, 0, 0, 0, k=10)] == ['a', 'b']
+    assert VoiceMatchIndex().top_sync(1, 2, 3, 4) == []
+
+
+@pytest.mark.parametrize('vector', [(-1, 0, 0, 0), (0, 0, 0, 100.5), (float('nan'), 0, 0, 0)])
+def test_out_of_range_metrics_are_rejected(vector):
+    with pytest.raises(ValueError):
+        VoiceMatchIndex().insert('x', *vector)
+
+
+def test_duplicate_ids_are_rejected():
+    with pytest.raises(ValueError):
+        VoiceMatchIndex.from_arrays(['a', 'a'], [1, 2], [1, 2], [1, 2], [1, 2])
+
+
+@pytest.mark.parametrize('k', [0, -1])
+def test_k_below_one_is_rejected(k):
+    users = {'a': (10.0, 10.0, 10.0, 10.0), 'b': (90.0, 90.0, 90.0, 90.0)}
+    index = VoiceMatchIndex.from_arrays(list(users), *np.array(list(users.values())).T)
+    for query in (lambda: index.top_sync(0, 0, 0, 0, k=k), lambda: index.top_contrast(0, 0, 0, 0, k=k),
+                  lambda: index.matches_for('a', k=k), lambda: VoiceMatchIndex().top_sync(1, 2, 3, 4, k=k)):
+        with pytest.raises(ValueError):
+            query()